@@ -0,0 +1,177 @@
+"""Sales and booking reports served from rollup tables.
+
+``place_order`` adds each order to ``sales_daily`` (orders and revenue per
+day) and ``item_sales_daily`` (quantity and revenue per item per day) in the
+same transaction as the order itself, using INSERT ... ON CONFLICT DO UPDATE
+so concurrent orders just add to the same rows. Booking figures come from
+``booking_slot``, which ``book_table`` already maintains per restaurant and
+slot. Reports only ever read these small tables, so dashboards never scan
+``order``/``order_item`` or hold locks on them. ``flask rebuild-analytics``
+recomputes the sales rollups from the raw tables, e.g. after a backfill;
+days up to the newest archived order (see archive.py) are kept as they are,
+since their orders are no longer in those tables.
+"""
+import datetime
+import importlib
+
+import click
+from sqlalchemy import Date, cast, delete, func, insert, literal, select, update
+
+
+def _upsert(dialect_name, model, keys):
+    """INSERT ... ON CONFLICT (keys) DO UPDATE that adds the new values to the stored ones."""
+    # Only the dialect in use gets imported ('sqlite' or 'postgresql')
+    stmt = importlib.import_module(f'sqlalchemy.dialects.{dialect_name}').insert(model)
+    table = model.__table__
+    counters = [c.name for c in table.columns if c.name not in keys]
+    return stmt.on_conflict_do_update(
+        index_elements=keys, set_={name: table.c[name] + stmt.excluded[name] for name in counters})
+
+
+def date_range(days, end=None):
+    """The last ``days`` days up to and including ``end`` (default: today, UTC)."""
+    end = end or datetime.datetime.utcnow().date()
+    return end - datetime.timedelta(days=days - 1), end
+
+
+class SalesAnalytics:
+    def __init__(self, db, order_model, order_item_model, food_item_model, restaurant_model,
+                 booking_slot_model, daily_model, item_daily_model, archived_until=None):
+        self.db = db
+        self.order_model = order_model
+        self.order_item_model = order_item_model
+        self.food_item_model = food_item_model
+        self.restaurant_model = restaurant_model
+        self.booking_slot_model = booking_slot_model
+        self.daily_model = daily_model
+        self.item_daily_model = item_daily_model
+        self.archived_until = archived_until  # callable: when the newest archived order was placed
+
+    # --- Recording ---
+
+    def record_order(self, placed, total, lines):
+        """Add an order to the rollups; ``lines`` are (food_item_id, quantity, unit price). Call before commit."""
+        day = placed.date()
+        dialect = self.db.session.get_bind().dialect.name
+        self.db.session.execute(_upsert(dialect, self.daily_model, ['day']).values(
+            day=day, orders=1, revenue=total, items_sold=sum(quantity for _, quantity, _ in lines)))
+        per_item = {}
+        for food_item_id, quantity, price in lines:
+            sold, revenue = per_item.get(food_item_id, (0, 0.0))
+            per_item[food_item_id] = (sold + quantity, revenue + quantity * price)
+        self.db.session.execute(_upsert(dialect, self.item_daily_model, ['day', 'food_item_id']), [
+            {'day': day, 'food_item_id': food_item_id, 'quantity': sold, 'revenue': revenue}
+            for food_item_id, (sold, revenue) in per_item.items()
+        ])
+
+    # --- Reports ---
+
+    def revenue_by_day(self, start, end):
+        Daily = self.daily_model
+        rows = self.db.session.execute(
+            select(Daily.day, Daily.orders, Daily.revenue, Daily.items_sold)
+            .where(Daily.day.between(start, end)).order_by(Daily.day))
+        return [{'day': row.day.isoformat(), 'orders': row.orders, 'revenue': round(row.revenue, 2),
+                 'items_sold': row.items_sold} for row in rows]
+
+    def average_order_value(self, start, end):
+        Daily = self.daily_model
+        orders, revenue = self.db.session.execute(
+            select(func.coalesce(func.sum(Daily.orders), 0), func.coalesce(func.sum(Daily.revenue), 0.0))
+            .where(Daily.day.between(start, end))).one()
+        return {'orders': orders, 'revenue': round(revenue, 2),
+                'average_order_value': round(revenue / orders, 2) if orders else 0.0}
+
+    def top_items(self, start, end, limit=10):
+        ItemDaily, FoodItem = self.item_daily_model, self.food_item_model
+        quantity = func.sum(ItemDaily.quantity).label('quantity')
+        totals = (select(ItemDaily.food_item_id, quantity, func.sum(ItemDaily.revenue).label('revenue'))
+                  .where(ItemDaily.day.between(start, end))
+                  .group_by(ItemDaily.food_item_id).order_by(quantity.desc()).limit(limit).subquery())
+        rows = self.db.session.execute(
+            select(totals, FoodItem.name).outerjoin(FoodItem, FoodItem.id == totals.c.food_item_id)
+            .order_by(totals.c.quantity.desc()))
+        return [{'food_item_id': row.food_item_id, 'name': row.name or '(deleted item)',
+                 'quantity': row.quantity, 'revenue': round(row.revenue, 2)} for row in rows]
+
+    def bookings_by_slot(self, start, end):
+        Slot, Restaurant = self.booking_slot_model, self.restaurant_model
+        rows = self.db.session.execute(
+            select(Slot.restaurant_id, Restaurant.name, Slot.slot_time,
+                   func.sum(Slot.bookings).label('bookings'), func.sum(Slot.seats_booked).label('guests'))
+            .join(Restaurant, Restaurant.id == Slot.restaurant_id)
+            .where(Slot.slot_date.between(start, end))
+            .group_by(Slot.restaurant_id, Restaurant.name, Slot.slot_time)
+            .order_by(Restaurant.name, Slot.slot_time))
+        return [{'restaurant_id': row.restaurant_id, 'restaurant': row.name,
+                 'slot': row.slot_time.strftime('%H:%M'), 'bookings': row.bookings, 'guests': row.guests}
+                for row in rows]
+
+    def report(self, start, end, top=10, upcoming_days=7):
+        # Bookings are made ahead, so their range also covers the days after ``end``.
+        bookings_end = end + datetime.timedelta(days=upcoming_days)
+        return {
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'bookings_end': bookings_end.isoformat(),
+            'summary': self.average_order_value(start, end),
+            'revenue_by_day': self.revenue_by_day(start, end),
+            'top_items': self.top_items(start, end, limit=top),
+            'bookings_by_slot': self.bookings_by_slot(start, bookings_end),
+        }
+
+    # --- Batch refresh ---
+
+    def rebuild(self, since=None):
+        """Recompute the sales rollups from order/order_item, for every day or from ``since`` on.
+
+        Returns the first day recomputed; days with archived orders are never wiped.
+        """
+        horizon = self.archived_until() if self.archived_until else None
+        if horizon:
+            since = max(since or datetime.date.min, horizon.date() + datetime.timedelta(days=1))
+        Order, OrderItem = self.order_model, self.order_item_model
+        Daily, ItemDaily = self.daily_model, self.item_daily_model
+        if self.db.session.get_bind().dialect.name == 'sqlite':
+            day = func.date(Order.date_placed)  # CAST(... AS DATE) has NUMERIC affinity in SQLite
+        else:
+            day = cast(Order.date_placed, Date)
+        session = self.db.session
+        try:
+            daily_rows, item_rows = delete(Daily), delete(ItemDaily)
+            orders = select(day.label('day'), func.count(Order.id), func.sum(Order.total_price))
+            lines = (select(day.label('day'), OrderItem.food_item_id, func.sum(OrderItem.quantity),
+                            func.sum(OrderItem.quantity * OrderItem.price_per_item))
+                     .select_from(OrderItem).join(Order, Order.id == OrderItem.order_id))
+            items_sold = update(Daily).values(items_sold=func.coalesce(
+                select(func.sum(ItemDaily.quantity)).where(ItemDaily.day == Daily.day).scalar_subquery(), 0))
+            if since:
+                start = datetime.datetime.combine(since, datetime.time.min)
+                daily_rows = daily_rows.where(Daily.day >= since)
+                item_rows = item_rows.where(ItemDaily.day >= since)
+                orders = orders.where(Order.date_placed >= start)
+                lines = lines.where(Order.date_placed >= start)
+                items_sold = items_sold.where(Daily.day >= since)
+            session.execute(daily_rows)
+            session.execute(item_rows)
+            session.execute(insert(ItemDaily).from_select(
+                ['day', 'food_item_id', 'quantity', 'revenue'], lines.group_by(day, OrderItem.food_item_id)))
+            session.execute(insert(Daily).from_select(['day', 'orders', 'revenue', 'items_sold'],
+                                                      orders.add_columns(literal(0)).group_by(day)))
+            session.execute(items_sold)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return since
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        @app.cli.command('rebuild-analytics')
+        @click.option('--since', type=click.DateTime(formats=['%Y-%m-%d']),
+                      help='Only recompute days from this date on (default: everything).')
+        def rebuild_analytics_command(since):
+            """Recompute the sales rollup tables from the order tables."""
+            since = self.rebuild(since=since.date() if since else None)
+            click.echo(f'Sales rollups rebuilt from {since}.' if since else 'Sales rollups rebuilt.')
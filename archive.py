@@ -0,0 +1,201 @@
+"""Order archival: old receipts move out of order/order_item into a compressed archive table.
+
+``order`` and ``order_item`` only grow, and every index and scan on them
+grows with them. ``flask archive-orders`` (run it nightly from cron) moves
+orders that are finished (delivered or cancelled) and older than
+``ARCHIVE_AFTER_DAYS`` into ``order_archive``, so the hot tables stay about
+that many days big. An archived order is one row: what /my_orders pages on
+(user, date placed, id) stays in plain columns, and the rest of the receipt
+(delivery details and its lines, with item names and pictures as they were
+then, since menu items come and go) is zstandard-compressed JSON.
+
+Orders are moved oldest first in batches of ``batch_size``, each copied and
+deleted in one transaction: an interrupted run loses or duplicates nothing,
+and the next run picks up where it stopped.
+
+Other jobs read the order tables too:
+
+* ``flask refresh-recommendations`` reads order lines forward from its
+  watermark, so only orders it has already read are archived
+  (``ready_upto``; a warning says how many are held back). Set
+  ``RECOMMENDATIONS_ENABLED=0`` where it never runs. A ``--full`` rebuild
+  afterwards only sees the hot orders.
+* The sales rollups already hold archived orders; ``flask rebuild-analytics``
+  leaves the days up to the newest archived order alone (``horizon``).
+* Delivered dispatch batches keep their ``order_count`` but no longer list
+  orders that have been archived.
+
+``/my_orders`` reads only the hot table until a page reaches back to the
+user's newest archived order (one index lookup) or runs out of hot orders,
+and from there merges both, since an older order that never finished is
+still hot. The ``(date_placed, id)`` cursor means the same thing in both
+tables. zstandard is imported by the archiver
+and on the first archived page shown, not when a web worker starts.
+"""
+import datetime
+import json
+import logging
+import time
+from collections import namedtuple
+
+import click
+from sqlalchemy import delete, func, insert, select, tuple_
+
+from dispatch import CANCELLED, DELIVERED
+
+log = logging.getLogger(__name__)
+
+FINISHED = (DELIVERED, CANCELLED)  # orders in any other status still have a delivery ahead of them
+PAYLOAD_VERSION = 1
+
+# Shaped like Order / OrderItem / FoodItem as far as the order history template goes
+ArchivedOrder = namedtuple('ArchivedOrder', 'id date_placed total_price status name email address city items')
+ArchivedLine = namedtuple('ArchivedLine', 'food_item quantity price_per_item')
+ArchivedFood = namedtuple('ArchivedFood', 'id name image_file')
+
+
+class OrderArchiver:
+    def __init__(self, db, order_model, order_item_model, food_item_model, archive_model, after_days=180,
+                 batch_size=500, ready_upto=None, level=10):
+        self.db = db
+        self.order_model = order_model
+        self.order_item_model = order_item_model
+        self.food_item_model = food_item_model
+        self.archive_model = archive_model
+        self.after = datetime.timedelta(days=after_days)
+        self.batch_size = batch_size
+        self.ready_upto = ready_upto  # callable: newest order id that may be archived (None: any)
+        self.level = level
+
+    # --- Archiving ---
+
+    def _candidates(self, cutoff, upto, after, limit):
+        Order = self.order_model
+        # Walk the primary key from where the last batch ended; the status test is wrapped so SQLite doesn't
+        # collect and sort every finished order off the status index for each batch instead.
+        query = (select(Order.id)
+                 .where(Order.id > after, Order.date_placed < cutoff, func.coalesce(Order.status, '').in_(FINISHED))
+                 .order_by(Order.id).limit(limit))
+        if upto is not None:
+            query = query.where(Order.id <= upto)
+        return self.db.session.scalars(query).all()
+
+    def run(self, now=None, limit=None):
+        """Archive finished orders older than ``after_days``, at most ``limit``; returns how many moved."""
+        import zstandard
+        now = now or datetime.datetime.utcnow()
+        cutoff = now - self.after
+        upto = self.ready_upto() if self.ready_upto else None
+        compressor = zstandard.ZstdCompressor(level=self.level)
+        moved = last = 0
+        while limit is None or moved < limit:
+            size = self.batch_size if limit is None else min(self.batch_size, limit - moved)
+            ids = self._candidates(cutoff, upto, last, size)
+            self.db.session.rollback()  # no read transaction held between batches
+            if not ids:
+                break
+            moved += self._archive(ids, compressor, now)
+            last = ids[-1]
+        if upto is not None:
+            held = self._held_back(cutoff, upto)
+            if held:
+                log.warning('%d finished order(s) after #%d are held back until `flask refresh-recommendations` '
+                            'reads them (or set RECOMMENDATIONS_ENABLED=0)', held, upto)
+        return moved
+
+    def _held_back(self, cutoff, upto):
+        Order = self.order_model
+        return self.db.session.scalar(select(func.count()).select_from(Order).where(
+            Order.id > upto, Order.date_placed < cutoff, Order.status.in_(FINISHED)))
+
+    def _archive(self, ids, compressor, now):
+        """Copy one batch of orders into the archive and delete them, in one transaction."""
+        Order, OrderItem, FoodItem = self.order_model, self.order_item_model, self.food_item_model
+        session = self.db.session
+        try:
+            orders = session.execute(
+                select(Order.id, Order.user_id, Order.date_placed, Order.total_price, Order.status, Order.name,
+                       Order.email, Order.address, Order.city, Order.idempotency_key, Order.dispatch_batch_id)
+                .where(Order.id.in_(ids), Order.status.in_(FINISHED))).all()
+            if not orders:
+                session.rollback()
+                return 0
+            ids = [order.id for order in orders]
+            lines = {}
+            for row in session.execute(
+                    select(OrderItem.order_id, OrderItem.food_item_id, FoodItem.name, FoodItem.image_file,
+                           OrderItem.quantity, OrderItem.price_per_item)
+                    .outerjoin(FoodItem, FoodItem.id == OrderItem.food_item_id)
+                    .where(OrderItem.order_id.in_(ids)).order_by(OrderItem.id)):
+                lines.setdefault(row.order_id, []).append(list(row[1:]))
+            session.execute(insert(self.archive_model), [
+                {'id': order.id, 'user_id': order.user_id, 'date_placed': order.date_placed,
+                 'total_price': order.total_price, 'status': order.status, 'archived_at': now,
+                 'payload': compressor.compress(json.dumps({
+                     'v': PAYLOAD_VERSION, 'name': order.name, 'email': order.email, 'address': order.address,
+                     'city': order.city, 'idempotency_key': order.idempotency_key,
+                     'dispatch_batch_id': order.dispatch_batch_id, 'lines': lines.get(order.id, []),
+                 }, separators=(',', ':')).encode())}
+                for order in orders])
+            session.execute(delete(OrderItem).where(OrderItem.order_id.in_(ids)),
+                            execution_options={'synchronize_session': False})
+            session.execute(delete(Order).where(Order.id.in_(ids)), execution_options={'synchronize_session': False})
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return len(ids)
+
+    # --- Reading ---
+
+    def page(self, user_id, before=None, limit=20):
+        """The user's archived orders older than the ``before`` (date_placed, id) cursor, newest first."""
+        Archive = self.archive_model
+        query = (select(Archive.id, Archive.date_placed, Archive.total_price, Archive.status, Archive.payload)
+                 .where(Archive.user_id == user_id))
+        if before:
+            query = query.where(tuple_(Archive.date_placed, Archive.id) < before)
+        rows = self.db.session.execute(query.order_by(Archive.date_placed.desc(), Archive.id.desc()).limit(limit)).all()
+        if not rows:
+            return []
+        import zstandard
+        decompressor = zstandard.ZstdDecompressor()
+        orders = []
+        for row in rows:
+            receipt = json.loads(decompressor.decompress(row.payload))
+            items = [ArchivedLine(ArchivedFood(food_item_id, name, image_file), quantity, price)
+                     for food_item_id, name, image_file, quantity, price in receipt['lines']]
+            orders.append(ArchivedOrder(row.id, row.date_placed, row.total_price, row.status, receipt['name'],
+                                        receipt['email'], receipt['address'], receipt['city'], items))
+        return orders
+
+    def reaches(self, user_id, placed):
+        """Whether the user has archived orders from ``placed`` on, so a page reaching back there must merge them."""
+        Archive = self.archive_model
+        newest = self.db.session.scalar(select(func.max(Archive.date_placed)).where(Archive.user_id == user_id))
+        return newest is not None and placed <= newest
+
+    def horizon(self):
+        """When the newest archived order was placed (None if nothing is archived)."""
+        return self.db.session.scalar(select(func.max(self.archive_model.date_placed)))
+
+    def counts(self):
+        """(hot orders, archived orders, archive payload bytes)."""
+        Archive = self.archive_model
+        hot = self.db.session.scalar(select(func.count()).select_from(self.order_model))
+        archived, size = self.db.session.execute(
+            select(func.count(), func.coalesce(func.sum(func.length(Archive.payload)), 0))).one()
+        return hot, archived, size
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        @app.cli.command('archive-orders')
+        @click.option('--limit', type=int, help='Archive at most this many orders.')
+        def archive_orders_command(limit):
+            """Move delivered/cancelled orders older than ARCHIVE_AFTER_DAYS into the compressed archive."""
+            started = time.perf_counter()
+            moved = self.run(limit=limit)
+            click.echo(f'Archived {moved} order(s) in {time.perf_counter() - started:.2f}s.')
+            hot, archived, size = self.counts()
+            click.echo(f'{hot} order(s) in the hot tables, {archived} archived in {size / 1024:.0f} KiB.')
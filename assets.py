@@ -0,0 +1,170 @@
+"""Fingerprinted, long-cached URLs for the CSS/JS files in static/.
+
+At startup every stylesheet and script is content-hashed, and
+``url_for('static', filename='home.css')`` is rewritten to
+``/static/home.<hash>.css``. Those URLs are served with a year-long
+``immutable`` Cache-Control, so browsers never revalidate them; a new
+deploy changes the hash and therefore the URL. ``flask build-assets``
+writes Brotli (``.br``) and zstandard (``.zst``) siblings that are sent
+instead of the original when the browser accepts them.
+"""
+import hashlib
+import mimetypes
+import os
+import re
+
+import click
+from flask import current_app, request, send_file, send_from_directory
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FINGERPRINT_EXTENSIONS = ('.css', '.js')
+# Preferred first: Brotli compresses text best, zstd decodes fastest.
+ENCODINGS = (('br', '.br'), ('zstd', '.zst'))
+_HASHED = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[A-Za-z0-9]+)$')
+
+
+def _content_hash(path):
+    with open(path, 'rb') as fh:
+        return hashlib.sha256(fh.read()).hexdigest()[:12]
+
+
+def compress_assets(static_folder, log=print):
+    """Write .br/.zst siblings for every fingerprinted asset that is missing or stale."""
+    written = 0
+    for filename in _asset_files(static_folder):
+        path = os.path.join(static_folder, filename)
+        with open(path, 'rb') as fh:
+            data = fh.read()
+        for encoding, suffix in ENCODINGS:
+            target = path + suffix
+            if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                continue
+            if encoding == 'br' and brotli:
+                payload = brotli.compress(data, quality=11)
+            elif encoding == 'zstd' and zstandard:
+                payload = zstandard.ZstdCompressor(level=19).compress(data)
+            else:
+                continue
+            with open(target, 'wb') as fh:
+                fh.write(payload)
+            written += 1
+            log(f'{filename}{suffix}: {len(data)} -> {len(payload)} bytes')
+    return written
+
+
+def _asset_files(static_folder):
+    for root, _dirs, files in os.walk(static_folder):
+        for name in files:
+            if name.endswith(FINGERPRINT_EXTENSIONS):
+                yield os.path.relpath(os.path.join(root, name), static_folder).replace(os.sep, '/')
+
+
+class AssetManifest:
+    def __init__(self, app=None):
+        self.hashed = {}    # 'home.css' -> 'home.<hash>.css'
+        self.logical = {}   # 'home.<hash>.css' -> 'home.css'
+        self._mtimes = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('ASSETS_FINGERPRINT', True)
+        self.static_folder = app.static_folder
+        self.build()
+        if app.config['ASSETS_FINGERPRINT']:
+            app.url_defaults(self._fingerprint_url)
+            app.view_functions['static'] = self.send_static
+
+        @app.cli.command('build-assets')
+        def build_assets_command():
+            """Write Brotli/zstandard copies of the CSS and JS files in static/."""
+            written = compress_assets(app.static_folder, log=click.echo)
+            click.echo(f'Wrote {written} precompressed file(s).')
+
+    def build(self):
+        self.hashed.clear()
+        self.logical.clear()
+        for filename in _asset_files(self.static_folder):
+            self._add(filename)
+
+    def _add(self, filename):
+        path = os.path.join(self.static_folder, filename)
+        stem, ext = os.path.splitext(filename)
+        old = self.hashed.get(filename)
+        if old:
+            self.logical.pop(old, None)
+        hashed = f'{stem}.{_content_hash(path)}{ext}'
+        self.hashed[filename] = hashed
+        self.logical[hashed] = filename
+        self._mtimes[filename] = os.path.getmtime(path)
+        return hashed
+
+    def fingerprint(self, filename):
+        hashed = self.hashed.get(filename)
+        if hashed and current_app.debug:
+            # Pick up edits without a restart while developing.
+            path = os.path.join(self.static_folder, filename)
+            if os.path.getmtime(path) != self._mtimes.get(filename):
+                hashed = self._add(filename)
+        return hashed
+
+    def _fingerprint_url(self, endpoint, values):
+        if endpoint != 'static':
+            return
+        hashed = self.fingerprint(values.get('filename'))
+        if hashed:
+            values['filename'] = hashed
+            values.pop('v', None)  # the old manual cache-busting parameter is redundant now
+
+    def send_static(self, filename):
+        logical = self.logical.get(filename)
+        immutable = logical is not None or filename.startswith('images/derived/')
+        if logical is None:
+            match = _HASHED.match(filename)
+            if match and self.hashed.get(match['stem'] + match['ext']):
+                # A hash from an older deploy: serve the current file, but don't pin it.
+                logical = match['stem'] + match['ext']
+            else:
+                logical = filename
+        response = self._send_precompressed(logical) or send_from_directory(self.static_folder, logical)
+        if logical in self.hashed:
+            response.vary.add('Accept-Encoding')
+        if immutable:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = 31536000
+            response.cache_control.immutable = True
+        return response
+
+    def _send_precompressed(self, filename):
+        if filename not in self.hashed:
+            return None
+        path = safe_join(self.static_folder, filename)
+        if path is None:
+            raise NotFound()
+        accepted = request.accept_encodings
+        for encoding, suffix in ENCODINGS:
+            if not accepted[encoding]:
+                continue
+            compressed = path + suffix
+            try:
+                if os.path.getmtime(compressed) < os.path.getmtime(path):
+                    continue
+            except OSError:
+                continue
+            mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            response = send_file(compressed, mimetype=mimetype, conditional=True)
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+        return None
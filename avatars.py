@@ -0,0 +1,112 @@
+"""Profile pictures: bounded uploads, processed off the request thread.
+
+The request only streams the upload into ``UPLOAD_FOLDER/incoming`` (Flask
+rejects bodies over ``MAX_CONTENT_LENGTH`` with a 413 before any of it is
+stored) and hands the file to a small thread pool. The worker checks that it
+really is an image, crops it square and writes one WebP per avatar size
+under a content-addressed name, ``<digest>-<size>.webp``, so identical
+uploads share files and different users' ``me.jpg`` can never collide. Only
+then is ``User.image_file`` switched to the digest; until that happens the
+old picture keeps showing.
+"""
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import url_for
+
+log = logging.getLogger(__name__)
+
+# Rendered sizes: the header badge (35px) and the profile page (150px), at 2x.
+SIZES = {'small': 80, 'large': 320}
+DIGEST_LENGTH = 16  # User.image_file is String(20)
+_DIGEST = re.compile(rf'^[0-9a-f]{{{DIGEST_LENGTH}}}$')
+
+
+class AvatarPipeline:
+    def __init__(self, app=None, on_ready=None):
+        self.on_ready = on_ready
+        self._executor = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('AVATAR_WORKERS', 2)
+        app.config.setdefault('AVATAR_MAX_PIXELS', 64_000_000)  # room for 48MP phone cameras
+        self.app = app
+        self.folder = app.config['UPLOAD_FOLDER']
+        self.incoming = os.path.join(self.folder, 'incoming')
+        self.max_pixels = app.config['AVATAR_MAX_PIXELS']
+        self.workers = app.config['AVATAR_WORKERS']
+        self.available = importlib.util.find_spec('PIL') is not None  # imported on the first upload
+        app.jinja_env.globals['avatar_url'] = self.url
+
+    def url(self, image_file, size='small'):
+        """Static URL of a user's picture; pre-pipeline uploads are served as they were saved."""
+        if _DIGEST.match(image_file or ''):
+            return url_for('static', filename=f'profile_pics/{image_file}-{SIZES[size]}.webp')
+        return url_for('static', filename='profile_pics/' + (image_file or 'default.jpg'))
+
+    def submit(self, user_id, upload):
+        """Spool ``upload`` (a FileStorage) to disk and queue it; returns the worker's Future."""
+        os.makedirs(self.incoming, exist_ok=True)
+        path = os.path.join(self.incoming, uuid.uuid4().hex)
+        upload.save(path)
+        # Started on first use, so a gunicorn master that preloads the app never forks with live threads
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='avatars')
+        return self._executor.submit(self._process, user_id, path)
+
+    def _process(self, user_id, path):
+        try:
+            digest = self.render(path)
+        except Exception as e:  # not an image, truncated, too large, ...
+            log.warning('Rejected profile picture upload for user %s: %s', user_id, e)
+            return None
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if self.on_ready:
+            with self.app.app_context():
+                self.on_ready(user_id, digest)
+        return digest
+
+    def render(self, path):
+        """Validate the image at ``path`` and write its avatar sizes; returns the digest."""
+        from PIL import Image, ImageOps
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()[:DIGEST_LENGTH]
+        targets = {size: os.path.join(self.folder, f'{digest}-{size}.webp') for size in SIZES.values()}
+        if all(os.path.exists(target) for target in targets.values()):
+            return digest
+
+        with Image.open(path) as img:
+            if img.width * img.height > self.max_pixels:
+                raise ValueError(f'{img.width}x{img.height} image is too large')
+            largest = max(SIZES.values())
+            # JPEGs can decode at 1/2, 1/4 or 1/8 scale directly, which is most of the work saved
+            img.draft('RGB', (largest * 2, largest * 2))
+            img.load()
+            img = ImageOps.exif_transpose(img).convert('RGB')
+            for size, target in sorted(targets.items(), reverse=True):
+                square = ImageOps.fit(img, (size, size), Image.Resampling.LANCZOS)
+                tmp = f'{target}.{uuid.uuid4().hex}.tmp'
+                square.save(tmp, 'WEBP', quality=80, method=4)
+                os.replace(tmp, target)
+        return digest
+
+    def shutdown(self, wait=True):
+        if self._executor:
+            self._executor.shutdown(wait=wait)
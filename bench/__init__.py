@@ -0,0 +1,18 @@
+"""Reproducible load benchmark for the browse -> cart -> checkout journey.
+
+``python -m bench`` seeds a scaled synthetic dataset into its own database
+(never ``site.db``), then drives the real routes with a pool of virtual
+users, either in-process through Flask's test client or over HTTP against a
+multi-worker gunicorn. It reports throughput, p50/p99 latency and SQL
+statements per request (read from the ``Server-Timing`` header that
+metrics.py adds) and writes the results to JSON so releases can be
+compared::
+
+    python -m bench --mode client --users 2000 --items 5000 --orders 50000
+    python -m bench --mode gunicorn --workers 4 --concurrency 16 -o bench/results/1.4.json
+
+In gunicorn mode it also reports how long each worker took to boot and the
+master's and workers' memory (proportional and private, from
+``/proc/<pid>/smaps_rollup``), idle and after the run; compare
+``--preload`` (the default, see gunicorn.conf.py) with ``--no-preload``.
+"""
@@ -0,0 +1,246 @@
+"""``python -m bench``: seed, drive the journey, print and save the results."""
+import datetime
+import json
+import os
+import platform
+import re
+import secrets
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATABASE = os.path.join(ROOT, 'bench', 'bench.db')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise click.ClickException(f'gunicorn exited with status {process.returncode}')
+        try:
+            urllib.request.urlopen(url, timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise click.ClickException(f'gunicorn did not answer on {url} within {timeout}s')
+
+
+def _dataset():
+    from models import FoodItem, Order, Restaurant, User, db
+    first, last = db.session.execute(
+        db.select(db.func.min(FoodItem.id), db.func.max(FoodItem.id)).where(FoodItem.tag != 'Category')).one()
+    if first is None:
+        raise click.ClickException('The benchmark database has no menu; run without --no-seed first.')
+    return {
+        'users': db.session.scalar(db.select(db.func.count(User.id))),
+        'restaurants': db.session.scalar(db.select(db.func.count(Restaurant.id))),
+        'orders': db.session.scalar(db.select(db.func.count(Order.id))),
+        'first_item_id': first,
+        'last_item_id': last,
+    }
+
+
+def _worker_pids(master):
+    pids = []
+    for entry in os.listdir('/proc'):
+        try:
+            with open(f'/proc/{entry}/stat') as fh:
+                ppid = int(fh.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid == master:
+            pids.append(int(entry))
+    return sorted(pids)
+
+
+def _memory(pid):
+    """Resident, proportional (shared pages split between their users) and private MB of one process."""
+    kb = {}
+    with open(f'/proc/{pid}/smaps_rollup') as fh:
+        for line in fh:
+            name, _, rest = line.partition(':')
+            if rest.strip().endswith('kB'):
+                kb[name] = int(rest.split()[0])
+    return {'rss_mb': round(kb['Rss'] / 1024, 1), 'pss_mb': round(kb['Pss'] / 1024, 1),
+            'private_mb': round((kb['Private_Clean'] + kb['Private_Dirty']) / 1024, 1)}
+
+
+def _server_memory(master):
+    """Memory of the gunicorn master and its workers (Linux only; None elsewhere)."""
+    try:
+        workers = [_memory(pid) for pid in _worker_pids(master)]
+        memory = {'master': _memory(master), 'workers': workers}
+    except (OSError, KeyError):
+        return None
+    memory['worker_private_mb_mean'] = round(sum(w['private_mb'] for w in workers) / max(len(workers), 1), 1)
+    memory['total_pss_mb'] = round(memory['master']['pss_mb'] + sum(w['pss_mb'] for w in workers), 1)
+    return memory
+
+
+def _wait_for_workers(log_path, workers, process, timeout=60):
+    """Each worker's boot time (fork to app loaded, ms), as logged by gunicorn.conf.py."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with open(log_path, encoding='utf-8', errors='replace') as fh:
+            booted = [float(ms) for ms in re.findall(r'Worker \d+ booted in (\d+) ms', fh.read())]
+        if len(booted) >= workers:
+            return booted
+        if process.poll() is not None:
+            raise click.ClickException(f'gunicorn exited with status {process.returncode}')
+        time.sleep(0.1)
+    raise click.ClickException(f'gunicorn workers did not all boot within {timeout}s')
+
+
+def _print_table(summary):
+    click.echo(f'{"route":<22}{"requests":>9}{"errors":>8}{"req/s":>9}{"p50 ms":>9}{"p99 ms":>9}{"queries":>9}')
+    rows = list(summary['routes'].items()) + [('TOTAL', summary['total'])]
+    for route, stats in rows:
+        queries = stats['queries_per_request']
+        click.echo(f'{route:<22}{stats["requests"]:>9}{stats["errors"]:>8}{stats["throughput_rps"]:>9}'
+                   f'{stats["p50_ms"]:>9}{stats["p99_ms"]:>9}{"-" if queries is None else queries:>9}')
+
+
+def _print_server(stats):
+    boot = stats['worker_boot_ms']
+    click.echo(f'gunicorn {"with" if stats["preload"] else "without"} --preload: ready in {stats["ready_s"]}s, '
+               f'worker boot {min(boot):.0f}-{max(boot):.0f} ms')
+    for label in ('memory_idle', 'memory_loaded'):
+        memory = stats.get(label)
+        if memory:
+            click.echo(f'  {label[len("memory_"):]:<7} private per worker {memory["worker_private_mb_mean"]} MB, '
+                       f'master + workers PSS {memory["total_pss_mb"]} MB')
+
+
+@click.command()
+@click.option('--mode', type=click.Choice(['client', 'gunicorn']), default='client', show_default=True,
+              help='In-process test client, or HTTP against a multi-worker gunicorn.')
+@click.option('--database', default=DEFAULT_DATABASE, show_default=True, type=click.Path(dir_okay=False),
+              help='SQLite file the benchmark seeds and runs against.')
+@click.option('--no-seed', is_flag=True, help='Reuse the data already in --database.')
+@click.option('--users', default=1000, show_default=True)
+@click.option('--items', default=2000, show_default=True)
+@click.option('--orders', default=20000, show_default=True)
+@click.option('--restaurants', default=8, show_default=True)
+@click.option('--seed', default=1, show_default=True, help='Random seed for the data and the journeys.')
+@click.option('--journeys', default=200, show_default=True, help='Measured browse -> order -> book journeys.')
+@click.option('--warmup', default=20, show_default=True, help='Unmeasured journeys run first.')
+@click.option('--concurrency', default=8, show_default=True, help='Virtual users running at once.')
+@click.option('--workers', default=4, show_default=True, help='gunicorn worker processes (gunicorn mode).')
+@click.option('--threads', default=2, show_default=True, help='Threads per gunicorn worker (gunicorn mode).')
+@click.option('--preload/--no-preload', default=True, show_default=True,
+              help='Build the app once in the gunicorn master and fork the workers from it (gunicorn mode).')
+@click.option('--output', '-o', type=click.Path(dir_okay=False),
+              help='Where to write the JSON results (default: bench/results/<mode>-<timestamp>.json).')
+def main(mode, database, no_seed, users, items, orders, restaurants, seed, journeys, warmup, concurrency,
+         workers, threads, preload, output):
+    """Benchmark the browse -> cart -> checkout journey against a synthetic dataset."""
+    database = os.path.abspath(database)
+    os.environ['DATABASE_URL'] = 'sqlite:///' + database
+    os.environ.setdefault('SECRET_KEY', secrets.token_hex(32))  # shared with the gunicorn workers
+    sys.path.insert(0, ROOT)
+    from app import create_app, init_migrations  # DATABASE_URL is read when the app is created
+    from flask_migrate import upgrade
+    from models import db
+    from bench import driver
+    from bench.seed import seed as seed_database
+
+    application = create_app()
+    with application.app_context():
+        init_migrations(application)
+        upgrade(directory=os.path.join(ROOT, 'migrations'))
+        if not no_seed:
+            started = time.perf_counter()
+            seed_database(users=users, items=items, orders=orders, restaurants=restaurants, seed=seed)
+            click.echo(f'Seeded {database} in {time.perf_counter() - started:.1f}s')
+        dataset = _dataset()
+        db.session.remove()
+    window = application.config['BOOKING_WINDOW_DAYS']
+
+    server = server_stats = None
+    if mode == 'client':
+        def make_client():
+            return driver.TestClient(application)
+    else:
+        base_url = f'http://127.0.0.1:{_free_port()}'
+        log = tempfile.NamedTemporaryFile('w+', prefix='bench-gunicorn-', suffix='.log', delete=False)
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '--config', os.path.join(ROOT, 'gunicorn.conf.py'),
+             '--workers', str(workers), '--threads', str(threads), '--bind', base_url[len('http://'):],
+             '--log-level', 'info'],
+            cwd=ROOT, env=dict(os.environ, GUNICORN_PRELOAD='1' if preload else '0'), stderr=log)
+
+        def make_client():
+            return driver.HTTPClient(base_url)
+    try:
+        if server:
+            worker_boot_ms = _wait_for_workers(log.name, workers, server)
+            _wait_for(base_url + '/', server)
+            server_stats = {'preload': preload, 'ready_s': round(time.perf_counter() - started, 3),
+                            'worker_boot_ms': worker_boot_ms, 'memory_idle': _server_memory(server.pid)}
+        if warmup:
+            driver.run(make_client, dataset, concurrency, warmup, seed=seed + 1, booking_window_days=window)
+        recorder, elapsed = driver.run(make_client, dataset, concurrency, journeys, seed=seed,
+                                       booking_window_days=window)
+        if server:
+            server_stats['memory_loaded'] = _server_memory(server.pid)
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+            log.close()
+            os.unlink(log.name)
+
+    summary = recorder.summary(elapsed)
+    results = {
+        'benchmark': 'browse-cart-checkout',
+        'started_at': datetime.datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'mode': mode,
+        'config': {'journeys': journeys, 'warmup': warmup, 'concurrency': concurrency, 'seed': seed,
+                   'workers': workers if mode == 'gunicorn' else None,
+                   'threads': threads if mode == 'gunicorn' else None,
+                   'preload': preload if mode == 'gunicorn' else None,
+                   'db_profile': os.environ.get('DB_PROFILE'), 'cart_store': application.config['CART_STORE']},
+        'dataset': dataset,
+        'server': server_stats,
+        'elapsed_s': round(elapsed, 3),
+        'journeys_per_s': round(journeys / elapsed, 2) if elapsed else None,
+        **summary,
+    }
+    _print_table(summary)
+    if server_stats:
+        _print_server(server_stats)
+    if not output:
+        stamp = datetime.datetime.utcnow().strftime('%Y%m%dT%H%M%S')
+        output = os.path.join(ROOT, 'bench', 'results', f'{mode}-{stamp}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as fh:
+        json.dump(results, fh, indent=2)
+    click.echo(f'{journeys} journeys in {elapsed:.1f}s ({results["journeys_per_s"]}/s); results written to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""Virtual users walking the browse -> cart -> checkout journey, and the numbers they collect."""
+import datetime
+import http.cookiejar
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from bench.seed import CITIES, CUISINES, DESSERTS, PASSWORD, WORDS, email
+
+_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+_IDEMPOTENCY_KEY = re.compile(r'name="idempotency_key" value="(\w+)"')
+
+
+class Response:
+    def __init__(self, status, body, headers):
+        self.status = status
+        self.body = body
+        self.headers = headers
+
+    @property
+    def queries(self):
+        """SQL statements the server ran for this request, from metrics.py's Server-Timing header."""
+        match = _QUERIES.search(', '.join(self.headers.get_all('Server-Timing') or []))
+        return int(match.group(1)) if match else None
+
+
+class TestClient:
+    """In-process: one Flask test client (and so one cookie jar) per virtual user."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        return Response(response.status_code, response.get_data(as_text=True), _Headers(response.headers))
+
+
+class HTTPClient:
+    """Over the network, without following redirects, so each hop is timed on its own."""
+
+    class _NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *args, **kwargs):
+            return None
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), self._NoRedirect())
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        req = urllib.request.Request(self.base_url + path, data=body, method=method)
+        try:
+            with self.opener.open(req, timeout=30) as response:
+                return Response(response.status, response.read().decode('utf-8', 'replace'), response.headers)
+        except urllib.error.HTTPError as e:  # 3xx/4xx/5xx still count as answered requests
+            return Response(e.code, e.read().decode('utf-8', 'replace'), e.headers)
+
+
+class _Headers:
+    """werkzeug Headers with the ``get_all`` spelling of http.client's messages."""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+    def get_all(self, name):
+        return self.headers.getlist(name)
+
+
+class Recorder:
+    """Thread-safe samples per route: (seconds, status, queries)."""
+
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, route, seconds, response):
+        with self._lock:
+            self.samples.setdefault(route, []).append((seconds, response.status, response.queries))
+
+    def summary(self, elapsed):
+        routes = {route: summarize(samples, elapsed) for route, samples in sorted(self.samples.items())}
+        everything = [sample for samples in self.samples.values() for sample in samples]
+        return {'total': summarize(everything, elapsed), 'routes': routes}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(seconds for seconds, _, _ in samples)
+    queries = [count for _, _, count in samples if count is not None]
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, status, _ in samples if status >= 500),
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+        'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        'max_queries': max(queries) if queries else None,
+    }
+
+
+class VirtualUser:
+    """One shopper. Browses anonymously, logs in once, then keeps ordering and booking."""
+
+    def __init__(self, client, recorder, rng, dataset, booking_window_days=7):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.dataset = dataset
+        self.booking_window_days = booking_window_days
+        self.logged_in = False
+
+    def call(self, route, method, path, data=None):
+        start = time.perf_counter()
+        response = self.client.request(method, path, data)
+        self.recorder.add(route, time.perf_counter() - start, response)
+        return response
+
+    def journey(self):
+        rng, dataset = self.rng, self.dataset
+        tag = rng.choice(CUISINES + DESSERTS)
+        item_id = rng.randint(dataset['first_item_id'], dataset['last_item_id'])
+        self.call('/', 'GET', '/')
+        self.call('/category/<name>', 'GET', '/category/' + urllib.parse.quote(tag))
+        self.call('/search', 'GET', '/search?' + urllib.parse.urlencode({'query': f'{rng.choice(WORDS)} {tag}'}))
+        self.call('/item/<id>', 'GET', f'/item/{item_id}')
+        if not self.logged_in:
+            user = rng.randint(1, dataset['users'])
+            login = self.call('/login', 'POST', '/login', {'email': email(user), 'password': PASSWORD})
+            self.logged_in = login.status == 302  # a 429 from the per-IP limiter is retried next journey
+        self.call('/add_to_cart/<id>', 'POST', f'/add_to_cart/{item_id}', {'quantity': rng.randint(1, 3)})
+        checkout = self.call('/checkout', 'GET', '/checkout')
+        key = _IDEMPOTENCY_KEY.search(checkout.body)
+        if key:
+            self.call('/place_order', 'POST', '/place_order', {
+                'idempotency_key': key.group(1), 'name': 'Bench Shopper', 'email': 'shopper@example.com',
+                'address': '1 Bench Street', 'city': rng.choice(CITIES)})
+        day = datetime.date.today() + datetime.timedelta(days=rng.randint(1, self.booking_window_days - 1))
+        slot = datetime.time(rng.randint(11, 21), rng.choice((0, 30)))
+        self.call('/book_table/<id>', 'POST', f'/book_table/{rng.randint(1, dataset["restaurants"])}', {
+            'slot': f'{day.isoformat()}T{slot.strftime("%H:%M")}', 'party_size': rng.randint(1, 6)})
+
+
+def run(make_client, dataset, concurrency, journeys, seed=1, booking_window_days=7):
+    """Run ``journeys`` journeys spread over ``concurrency`` threads; returns (Recorder, seconds)."""
+    recorder = Recorder()
+    remaining = [journeys]
+    lock = threading.Lock()
+
+    def worker(index):
+        shopper = VirtualUser(make_client(), recorder, random.Random(seed * 1000 + index), dataset,
+                              booking_window_days)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            shopper.journey()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return recorder, time.perf_counter() - start
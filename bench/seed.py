@@ -0,0 +1,96 @@
+"""Synthetic dataset for the benchmark, inserted in bulk.
+
+Everything is derived from a seeded ``random.Random`` so two runs with the
+same sizes produce the same database.
+"""
+import datetime
+import random
+
+from sqlalchemy import delete, insert
+
+PASSWORD = 'bench-password'
+BATCH = 5000
+CUISINES = ['Fish', 'Prawns', 'Pasta', 'Biryani', 'Manchuria', 'Sushi', 'Burger', 'Pizza', 'Noodles',
+            'Kebab', 'Shawarma', 'French Fries', 'Popcorn', 'Chips']
+DESSERTS = ['Cheese Cake', 'Gulab Jamun', 'Donut', 'Brownies', 'Puddings', 'Cookies']
+SUB_TAGS = ['Spicy', 'Classic', 'Veg', 'Grilled', 'Fried', 'Healthy', 'Cheesy', 'Sweet']
+WORDS = ['Golden', 'Crispy', 'Smoky', 'Garlic', 'Masala', 'Truffle', 'Lemon', 'Chili', 'Herb', 'Royal',
+         'Butter', 'Tandoori', 'Honey', 'Pepper', 'Sesame', 'Coconut']
+CITIES = ['Hyderabad', 'Bangalore', 'Chennai', 'Mumbai', 'Pune', 'Delhi']
+
+
+def email(index):
+    return f'bench{index}@example.com'
+
+
+def _batches(rows):
+    for start in range(0, len(rows), BATCH):
+        yield rows[start:start + BATCH]
+
+
+def _insert(db, model, rows):
+    for batch in _batches(rows):
+        db.session.execute(insert(model), batch)
+
+
+def seed(users=1000, items=2000, orders=20000, restaurants=8, seed=1):
+    """Replace the contents of the current app's database with a dataset of the given size."""
+    import models
+    import services
+    db = models.db
+    rng = random.Random(seed)
+    for model in (models.OutboxMessage, models.OrderArchive, models.OrderItem, models.Order, models.SalesDaily,
+                  models.ItemSalesDaily, models.Booking, models.BookingSlot, models.CartSession, models.FoodItem,
+                  models.Restaurant, models.User):
+        db.session.execute(delete(model))
+
+    password = services.passwords.hash(PASSWORD)  # one KDF run shared by every bench user
+    _insert(db, models.User, [
+        {'id': i, 'email': email(i), 'password': password, 'first_name': 'Bench', 'last_name': str(i),
+         'country': 'Benchland', 'image_file': 'default.jpg', 'is_admin': False}
+        for i in range(1, users + 1)
+    ])
+
+    tags = CUISINES + DESSERTS
+    menu = [{'id': i + 1, 'name': tag, 'tag': 'Category', 'sub_tag': 'Cuisine' if tag in CUISINES else 'Dessert',
+             'price': 0, 'image_file': 'default.jpg', 'description': None} for i, tag in enumerate(tags)]
+    prices = {}
+    for item_id in range(len(menu) + 1, len(menu) + items + 1):
+        tag = tags[item_id % len(tags)]
+        price = round(rng.uniform(2, 25), 2)
+        prices[item_id] = price
+        menu.append({'id': item_id, 'name': f'{rng.choice(WORDS)} {rng.choice(WORDS)} {tag} {item_id}', 'tag': tag,
+                     'sub_tag': rng.choice(SUB_TAGS), 'price': price, 'image_file': 'default.jpg',
+                     'description': f'Benchmark {tag.lower()} number {item_id}.'})
+    _insert(db, models.FoodItem, menu)
+
+    _insert(db, models.Restaurant, [
+        {'id': i, 'name': f'Bench Restaurant {i}', 'description': 'Benchmark restaurant.',
+         'image_file': 'default.jpg', 'location': rng.choice(CITIES), 'capacity': 40}
+        for i in range(1, restaurants + 1)
+    ])
+
+    now = datetime.datetime.utcnow()
+    item_ids = list(prices)
+    order_rows, line_rows = [], []
+    for order_id in range(1, orders + 1):
+        lines = {}
+        for item_id in rng.sample(item_ids, min(len(item_ids), rng.randint(1, 4))):
+            lines[item_id] = rng.randint(1, 3)
+        user_id = rng.randint(1, users)
+        order_rows.append({
+            'id': order_id, 'user_id': user_id, 'date_placed': now - datetime.timedelta(minutes=rng.randint(1, 90 * 24 * 60)),
+            'total_price': round(sum(prices[i] * q for i, q in lines.items()), 2), 'name': f'Bench {user_id}',
+            'email': email(user_id), 'address': f'{order_id} Bench Street', 'city': rng.choice(CITIES),
+            'idempotency_key': None, 'status': 'delivered'})
+        line_rows.extend({'order_id': order_id, 'food_item_id': item_id, 'quantity': quantity,
+                          'price_per_item': prices[item_id]} for item_id, quantity in lines.items())
+    _insert(db, models.Order, order_rows)
+    _insert(db, models.OrderItem, line_rows)
+    db.session.commit()
+
+    services.analytics.rebuild()
+    services.search_index.rebuild()
+    services.users.cache.clear()
+    return {'users': users, 'items': len(menu), 'orders': orders, 'order_items': len(line_rows),
+            'restaurants': restaurants, 'seed': seed}
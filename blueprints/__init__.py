@@ -0,0 +1,22 @@
+"""Routes, one blueprint per area; ``register_blueprints`` attaches them to an app."""
+from flask import current_app, flash, jsonify, redirect, request, url_for
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from blueprints import account, admin, bookings, catalog, orders
+
+
+def register_blueprints(app):
+    for module in (catalog, orders, bookings, account, admin):
+        app.register_blueprint(module.bp)
+    if app.debug or app.config['DEV_ROUTES']:
+        from blueprints import dev
+        app.register_blueprint(dev.bp)
+    app.register_error_handler(RequestEntityTooLarge, upload_too_large)
+
+
+def upload_too_large(e):
+    limit = current_app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    if request.path.startswith('/admin/api/') or request.accept_mimetypes.best == 'application/json':
+        return jsonify(error=f'Upload too large (max {limit} MB).'), 413
+    flash(f'That file is too large. The limit is {limit} MB.', 'error')
+    return redirect(request.referrer or url_for('catalog.home'), 303)
@@ -0,0 +1,114 @@
+"""Sign-up, login/logout and the profile page."""
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+
+from models import User, db
+from passwords import HasherBusy
+from services import avatars, login_email_limiter, login_ip_limiter, passwords, users
+
+bp = Blueprint('account', __name__)
+
+def login_rate_limited(email=None):
+    if not login_ip_limiter.allow(request.remote_addr):
+        return True
+    return email is not None and not login_email_limiter.allow(email.strip().lower())
+
+@bp.route('/signup', methods=['GET', 'POST'])
+def signup():
+    if request.method == 'POST':
+        email = request.form['email']
+        password = request.form['password']
+        first_name = request.form['first_name']
+        last_name = request.form['last_name']
+        country = request.form['country']
+        if login_rate_limited():
+            flash('Too many attempts. Please wait a minute and try again.', 'error')
+            return render_template('signup.html'), 429
+        existing_user = User.query.filter_by(email=email).first()
+        if not existing_user:
+            try:
+                password_hash = passwords.hash(password)
+            except HasherBusy:
+                flash('The server is busy. Please try again in a moment.', 'error')
+                return render_template('signup.html'), 503
+            new_user = User(email=email, password=password_hash, first_name=first_name, last_name=last_name, country=country)
+            db.session.add(new_user)
+            db.session.commit()
+            flash('Signup successful!', 'success')
+            return redirect(url_for('account.login'))
+        else:
+            flash('Email already exists.', 'error')
+    return render_template('signup.html')
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        email = request.form['email']
+        password = request.form['password']
+        if login_rate_limited(email):
+            flash('Too many login attempts. Please wait a few minutes and try again.', 'error')
+            return render_template('login.html'), 429
+        user = User.query.filter_by(email=email).first()
+        try:
+            valid, needs_rehash = passwords.verify(user.password if user else None, password)
+            if valid and needs_rehash:
+                # Plaintext or an older work factor: store a hash made with the current settings
+                user.password = passwords.hash(password)
+                db.session.commit()
+        except HasherBusy:
+            flash('The server is busy. Please try again in a moment.', 'error')
+            return render_template('login.html'), 503
+        if valid:
+            login_email_limiter.reset(email.strip().lower())
+            users.login(user)
+            if user.is_admin:
+                return redirect(url_for('admin.admin_panel'))
+            return redirect(url_for('catalog.home'))
+        else:
+            flash('Invalid email or password', 'error')
+    return render_template('login.html')
+
+@bp.route('/profile', methods=['GET', 'POST'])
+def profile():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    
+    current_user = users.current()
+    
+    if request.method == 'POST':
+        current_user = users.current_for_update()
+        # Update Text Fields
+        current_user.first_name = request.form.get('first_name')
+        current_user.last_name = request.form.get('last_name')
+        current_user.country = request.form.get('country')
+        
+        # Update Password (only if typed in)
+        new_password = request.form.get('password')
+        if new_password:
+            try:
+                current_user.password = passwords.hash(new_password)
+            except HasherBusy:
+                db.session.rollback()
+                flash('The server is busy. Please try again in a moment.', 'error')
+                return redirect(url_for('account.profile'))
+            
+        db.session.commit()
+
+        # Handle Image Upload: resized in the background, the new picture shows up once it is ready
+        file = request.files.get('profile_picture') # Matching your HTML name
+        if file and file.filename != '':
+            if not avatars.available:
+                flash('Picture uploads are not available right now.', 'error')
+                return redirect(url_for('account.profile'))
+            avatars.submit(current_user.id, file)
+            flash('Profile updated! Your new picture will appear in a moment.', 'success')
+            return redirect(url_for('account.profile'))
+
+        flash('Profile updated successfully!', 'success')
+        return redirect(url_for('account.profile'))
+
+    # Send current info to the template
+    return render_template('profile.html', user=current_user)
+
+@bp.route('/logout')
+def logout():
+    users.logout()
+    return redirect(url_for('catalog.home'))
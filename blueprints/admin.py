@@ -0,0 +1,211 @@
+"""Admin pages and JSON APIs: menu management, import/export, analytics and dispatch."""
+import datetime
+
+from flask import (Blueprint, Response, abort, current_app, flash, jsonify, redirect, render_template, request, session,
+                   stream_with_context, url_for)
+from sqlalchemy import tuple_
+from sqlalchemy.exc import SQLAlchemyError
+
+from analytics import date_range
+from dispatch import DispatchError
+from menu_io import format_from_filename, read_rows
+from models import FoodItem, db
+from services import analytics, dispatcher, menu_io, users
+
+bp = Blueprint('admin', __name__)
+
+@bp.route('/admin')
+def admin_panel():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user or not current_user.is_admin:
+        flash('Access Denied. Admins only.', 'error')
+        return redirect(url_for('catalog.home'))
+    try:
+        items, next_cursor = admin_item_page(request.args)
+    except ValueError as e:
+        flash(str(e), 'error')
+        items, next_cursor = admin_item_page({})
+    return render_template('admin.html', user=current_user, items=items, next_cursor=next_cursor,
+                           filters=request.args, sort_options=ADMIN_SORTS)
+
+@bp.route('/admin/api/items')
+def admin_items_api():
+    if 'user' not in session: return jsonify(error='Login required.'), 401
+    current_user = users.current()
+    if not current_user or not current_user.is_admin: return jsonify(error='Admins only.'), 403
+    try:
+        items, next_cursor = admin_item_page(request.args)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    columns = ('id', 'name', 'tag', 'sub_tag', 'price', 'image_file', 'description')
+    return jsonify(items=[{c: getattr(item, c) for c in columns} for item in items], next_cursor=next_cursor)
+
+ADMIN_SORTS = {'name': 'Name', 'price': 'Price', 'tag': 'Category', 'id': 'Newest'}
+
+def admin_item_page(args):
+    # Filters on tag/sub_tag/price/name, keyset pagination on (sort column, id); raises ValueError on bad input
+    sort = args.get('sort') or 'name'
+    if sort not in ADMIN_SORTS: raise ValueError(f'Unknown sort {sort!r}.')
+    descending = args.get('order') == 'desc' or (sort == 'id' and args.get('order') != 'asc')
+    limit = parse_number(args, 'limit', int) if args.get('limit') else current_app.config['ADMIN_PAGE_SIZE']
+    limit = max(1, min(limit, current_app.config['ADMIN_MAX_PAGE_SIZE']))
+    query = FoodItem.query
+    if args.get('tag'):
+        query = query.filter(FoodItem.tag == args['tag'])
+    else:
+        query = query.filter(FoodItem.tag != 'Category')  # category tiles are managed with the home page
+    if args.get('sub_tag'):
+        query = query.filter(FoodItem.sub_tag == args['sub_tag'])
+    if args.get('min_price'):
+        query = query.filter(FoodItem.price >= parse_number(args, 'min_price', float))
+    if args.get('max_price'):
+        query = query.filter(FoodItem.price <= parse_number(args, 'max_price', float))
+    if args.get('q'):
+        query = query.filter(FoodItem.name.ilike(f"%{args['q']}%"))
+    column = getattr(FoodItem, sort)
+    key = tuple_(column, FoodItem.id)
+    if args.get('after'):
+        cursor = parse_item_cursor(args['after'], sort)
+        query = query.filter(key < cursor if descending else key > cursor)
+    order = (column.desc(), FoodItem.id.desc()) if descending else (column, FoodItem.id)
+    items = query.order_by(*order).limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = f'{getattr(items[-1], sort)}_{items[-1].id}'
+    return items, next_cursor
+
+def parse_number(args, name, kind):
+    # Bad input gets a fixed message, not the parser's own text
+    try:
+        return kind(args[name])
+    except ValueError:
+        raise ValueError(f'Invalid {name}.') from None
+
+def parse_item_cursor(value, sort):
+    # An 'after' cursor is '<sort value>_<id>', as built by admin_item_page
+    value, separator, item_id = value.rpartition('_')
+    try:
+        if not separator: raise ValueError
+        return float(value) if sort == 'price' else int(value) if sort == 'id' else value, int(item_id)
+    except ValueError:
+        raise ValueError('Invalid cursor.') from None
+
+@bp.route('/admin/add_item', methods=['POST'])
+def add_item():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user.is_admin: return redirect(url_for('catalog.home'))
+    name = request.form.get('name')
+    tag = request.form.get('tag')
+    sub_tag = request.form.get('sub_tag')
+    price = float(request.form.get('price'))
+    image_file = request.form.get('image_file')
+    new_item = FoodItem(name=name, tag=tag, sub_tag=sub_tag, price=price, image_file=image_file)
+    db.session.add(new_item)
+    db.session.commit()
+    flash(f'{name} added successfully!', 'success')
+    return redirect(url_for('admin.admin_panel'))
+
+@bp.route('/admin/delete_item/<int:item_id>')
+def delete_item(item_id):
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user.is_admin: return redirect(url_for('catalog.home'))
+    item = FoodItem.query.get_or_404(item_id)
+    db.session.delete(item)
+    db.session.commit()
+    flash('Item deleted.', 'success')
+    return redirect(url_for('admin.admin_panel'))
+
+@bp.route('/admin/import', methods=['POST'])
+def import_menu():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user.is_admin: return redirect(url_for('catalog.home'))
+    file = request.files.get('menu_file')
+    kind = request.form.get('kind', 'items')
+    if not file or file.filename == '':
+        flash('Choose a CSV or JSON file to import.', 'error')
+        return redirect(url_for('admin.admin_panel'))
+    try:
+        rows = read_rows(file.stream, format_from_filename(file.filename))
+        report = menu_io.import_rows(kind, rows, progress=lambda r: current_app.logger.info('menu import: %s', r))
+    except ValueError as e:
+        flash(f'Import failed: {e}', 'error')
+        return redirect(url_for('admin.admin_panel'))
+    except SQLAlchemyError:
+        current_app.logger.exception('menu import failed')
+        flash('Import failed: the database rejected a batch of rows. Batches before it were saved.', 'error')
+        return redirect(url_for('admin.admin_panel'))
+    flash(f'Imported {report}.', 'success' if not report.invalid else 'error')
+    for number, message in report.errors[:10]:
+        flash(f'Row {number}: {message}', 'error')
+    return redirect(url_for('admin.admin_panel'))
+
+@bp.route('/admin/export/<kind>.<fmt>')
+def export_menu(kind, fmt):
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user.is_admin: return redirect(url_for('catalog.home'))
+    if kind not in ('items', 'restaurants') or fmt not in ('csv', 'json'): abort(404)
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/json'
+    return Response(stream_with_context(menu_io.export(kind, fmt)), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename={kind}.{fmt}'})
+
+@bp.route('/admin/analytics')
+def analytics_dashboard():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    current_user = users.current()
+    if not current_user.is_admin: return redirect(url_for('catalog.home'))
+    days = request.args.get('days', 30, type=int)
+    report = analytics.report(*date_range(max(days, 1)), upcoming_days=current_app.config['BOOKING_WINDOW_DAYS'])
+    return render_template('admin_analytics.html', user=current_user, report=report, days=days)
+
+@bp.route('/admin/api/analytics')
+def analytics_api():
+    if 'user' not in session: return jsonify(error='Login required.'), 401
+    current_user = users.current()
+    if not current_user or not current_user.is_admin: return jsonify(error='Admins only.'), 403
+    try:
+        if request.args.get('start'):
+            start = datetime.date.fromisoformat(request.args['start'])
+            end = datetime.date.fromisoformat(request.args.get('end') or datetime.datetime.utcnow().date().isoformat())
+        else:
+            start, end = date_range(max(request.args.get('days', 30, type=int), 1))
+    except ValueError:
+        return jsonify(error='start and end must be YYYY-MM-DD dates.'), 400
+    return jsonify(analytics.report(start, end, top=request.args.get('top', 10, type=int), upcoming_days=current_app.config['BOOKING_WINDOW_DAYS']))
+
+@bp.route('/admin/api/dispatch')
+def dispatch_api():
+    if 'user' not in session: return jsonify(error='Login required.'), 401
+    current_user = users.current()
+    if not current_user or not current_user.is_admin: return jsonify(error='Admins only.'), 403
+    limit = min(request.args.get('limit', current_app.config['ADMIN_PAGE_SIZE'], type=int), current_app.config['ADMIN_MAX_PAGE_SIZE'])
+    batches, next_cursor = dispatcher.batches(status=request.args.get('status'), city=request.args.get('city'),
+                                              after=request.args.get('after', type=int), limit=max(limit, 1))
+    orders = dispatcher.orders_by_batch([batch.id for batch in batches])
+    return jsonify(
+        backlog=dispatcher.backlog(),
+        batches=[{
+            'id': batch.id, 'city': batch.city, 'status': batch.status, 'driver': batch.driver,
+            'created_at': batch.created_at.isoformat(), 'window_start': batch.window_start.isoformat(),
+            'window_end': batch.window_end.isoformat(), 'order_count': batch.order_count,
+            'orders': [{'id': o.id, 'name': o.name, 'address': o.address, 'city': o.city, 'status': o.status,
+                        'date_placed': o.date_placed.isoformat(), 'total_price': o.total_price} for o in orders[batch.id]],
+        } for batch in batches],
+        next_cursor=next_cursor)
+
+@bp.route('/admin/api/dispatch/<int:batch_id>', methods=['POST'])
+def dispatch_batch_update(batch_id):
+    if 'user' not in session: return jsonify(error='Login required.'), 401
+    current_user = users.current()
+    if not current_user or not current_user.is_admin: return jsonify(error='Admins only.'), 403
+    data = request.get_json(silent=True) or request.form
+    try:
+        dispatcher.set_batch_status(batch_id, data.get('status'), driver=data.get('driver'))
+    except DispatchError as e:
+        return jsonify(error=str(e)), 400
+    return jsonify(id=batch_id, status=data.get('status'))
@@ -0,0 +1,62 @@
+"""Restaurant pages and table bookings."""
+from flask import Blueprint, abort, current_app, flash, redirect, render_template, request, session, url_for
+from sqlalchemy.orm import joinedload
+
+from models import Booking
+from reservations import BookingError, parse_slot
+from services import catalog, reservations, users
+
+bp = Blueprint('bookings', __name__)
+
+@bp.route('/restaurant/<int:restaurant_id>')
+def restaurant_details(restaurant_id):
+    user_data = users.current()
+    restaurant = catalog.restaurant(restaurant_id)
+    if not restaurant: abort(404)
+    availability = reservations.availability(restaurant)
+    return render_template('restaurant_details.html', user=user_data, restaurant=restaurant, availability=availability)
+
+@bp.route('/book_table/<int:restaurant_id>', methods=['POST'])
+def book_table(restaurant_id):
+    if 'user' not in session:
+        flash('Login required.', 'error')
+        return redirect(url_for('account.login'))
+    user = users.current()
+    restaurant = catalog.restaurant(restaurant_id)
+    if not restaurant: abort(404)
+    slot = parse_slot(request.form.get('slot'))
+    if not slot:
+        flash('Please pick a booking time.', 'error')
+        return redirect(url_for('bookings.restaurant_details', restaurant_id=restaurant_id))
+    # Missing or non-numeric comes out as 0, which book() turns down like any other bad party size
+    party_size = request.form.get('party_size', 0, type=int)
+    try:
+        new_booking = reservations.book(user.id, restaurant, *slot, party_size=party_size)
+    except BookingError as e:
+        flash(str(e), 'error')
+        return redirect(url_for('bookings.restaurant_details', restaurant_id=restaurant_id))
+    return redirect(url_for('bookings.booking_success', booking_id=new_booking.id))
+
+@bp.route('/booking_success/<int:booking_id>')
+def booking_success(booking_id):
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user = users.current()
+    booking = Booking.query.get_or_404(booking_id)
+    if booking.user_id != user.id: return redirect(url_for('catalog.home'))
+    return render_template('booking_success.html', user=user, booking=booking)
+
+@bp.route('/my_bookings')
+def my_bookings():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user_data = users.current()
+    page_size = current_app.config['HISTORY_PAGE_SIZE']
+    query = Booking.query.filter_by(user_id=user_data.id).options(joinedload(Booking.restaurant))
+    before = request.args.get('before', type=int)
+    if before:
+        query = query.filter(Booking.id < before)
+    bookings = query.order_by(Booking.id.desc()).limit(page_size + 1).all()
+    next_cursor = None
+    if len(bookings) > page_size:
+        bookings = bookings[:page_size]
+        next_cursor = bookings[-1].id
+    return render_template('my_bookings.html', user=user_data, bookings=bookings, next_cursor=next_cursor, paged=before is not None)
@@ -0,0 +1,57 @@
+"""Menu pages: home, categories, item details and search."""
+from flask import Blueprint, abort, current_app, jsonify, redirect, render_template, request, url_for
+
+from services import cached, catalog, page_cache, recommender, search_index, users
+
+bp = Blueprint('catalog', __name__)
+
+@bp.route('/')
+@cached
+def home():
+    user_data = users.current()
+    catalog_html = page_cache.fragment('home', lambda: render_template(
+        'partials/home_catalog.html',
+        cuisines=catalog.items_by_sub_tag('Category', 'Cuisine'),
+        desserts=catalog.items_by_sub_tag('Category', 'Dessert'),
+        restaurants=catalog.restaurants()))
+    return render_template('home.html', user=user_data, catalog_html=catalog_html)
+
+@bp.route('/category/<category_name>')
+@cached
+def category_page(category_name):
+    user_data = users.current()
+    catalog_html = page_cache.fragment('category', lambda: render_template(
+        'partials/category_items.html', items=catalog.items_by_tag(category_name)), category_name)
+    return render_template('category_page.html', user=user_data, category_name=category_name, catalog_html=catalog_html)
+
+@bp.route('/item/<int:item_id>')
+@cached
+def item_details(item_id):
+    user_data = users.current()
+    item = catalog.item(item_id)
+    if not item: abort(404)
+    catalog_html = page_cache.fragment('item', lambda: render_template('partials/item_details.html', item=item), item_id)
+    suggestions = recommender.for_item(item_id)
+    return render_template('item_details.html', user=user_data, item=item, catalog_html=catalog_html, suggestions=suggestions)
+
+@bp.route('/search')
+def search():
+    query = request.args.get('query', '').strip()
+    if not query: return redirect(url_for('catalog.home'))
+    user_data = users.current()
+    ids = search_index.search(query, limit=current_app.config['SEARCH_RESULT_LIMIT'])
+    results = [item for item in map(catalog.item, ids) if item]
+    return render_template('search_results.html', user=user_data, query=query, results=results)
+
+@bp.route('/search/suggest')
+def search_suggest():
+    query = request.args.get('q', '').strip()
+    ids = search_index.search(query, limit=current_app.config['SEARCH_SUGGEST_LIMIT'])
+    suggestions = []
+    for item in filter(None, map(catalog.item, ids)):
+        if item.tag == 'Category':
+            url = url_for('catalog.category_page', category_name=item.name)
+        else:
+            url = url_for('catalog.item_details', item_id=item.id)
+        suggestions.append({'id': item.id, 'name': item.name, 'tag': item.tag, 'price': item.price, 'url': url})
+    return jsonify(suggestions)
@@ -0,0 +1,162 @@
+"""Cart, checkout and order history."""
+import datetime
+import uuid
+
+from flask import Blueprint, abort, current_app, flash, redirect, render_template, request, session, url_for
+from sqlalchemy import insert, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+
+from models import Order, OrderItem, db
+from services import analytics, archive, cart, catalog, outbox, pricer, recommender, users
+
+bp = Blueprint('orders', __name__)
+
+@bp.route('/add_to_cart/<int:item_id>', methods=['POST'])
+def add_to_cart(item_id):
+    if 'user' not in session:
+        flash('Login required.', 'error')
+        return redirect(url_for('account.login'))
+    item = catalog.item(item_id)
+    if not item: abort(404)
+    quantity = int(request.form.get('quantity', 1))
+    cart_items = cart.get()
+    item_id_str = str(item_id)
+    if item_id_str in cart_items:
+        cart_items[item_id_str]['quantity'] += quantity
+    else:
+        cart_items[item_id_str] = {'name': item.name, 'price': item.price, 'quantity': quantity, 'image_file': item.image_file}
+    cart.save(cart_items)
+    db.session.commit()
+    flash(f"{quantity} x {item.name} added!", 'success')
+    return redirect(url_for('catalog.item_details', item_id=item_id))
+
+@bp.route('/order_now/<int:item_id>', methods=['POST'])
+def order_now(item_id):
+    if 'user' not in session: return redirect(url_for('account.login'))
+    item = catalog.item(item_id)
+    if not item: abort(404)
+    quantity = int(request.form.get('quantity', 1))
+    cart.save({str(item_id): {'name': item.name, 'price': item.price, 'quantity': quantity, 'image_file': item.image_file}})
+    db.session.commit()
+    return redirect(url_for('orders.checkout_page'))
+
+@bp.route('/cart')
+def cart_page():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user_data = users.current()
+    quote = reprice_cart()
+    suggestions = recommender.for_cart([line.item_id for line in quote.lines if not line.error])
+    return render_template('cart.html', user=user_data, quote=quote, suggestions=suggestions)
+
+@bp.route('/remove_from_cart/<string:item_id>')
+def remove_from_cart(item_id):
+    cart_items = cart.get()
+    cart_items.pop(item_id, None)
+    cart.save(cart_items)
+    db.session.commit()
+    return redirect(url_for('orders.cart_page'))
+
+@bp.route('/checkout')
+def checkout_page():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user_data = users.current()
+    cart_items = cart.get()
+    if not cart_items: return redirect(url_for('orders.cart_page'))
+    quote = pricer.quote(cart_items)
+    if quote.errors:
+        # The cart page shows what changed and brings the cart up to date
+        flash('Some items in your cart have changed. Please review your cart.', 'error')
+        return redirect(url_for('orders.cart_page'))
+    idempotency_key = uuid.uuid4().hex
+    return render_template('checkout.html', user=user_data, quote=quote, idempotency_key=idempotency_key)
+
+@bp.route('/place_order', methods=['POST'])
+def place_order():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user = users.current()
+    idempotency_key = request.form.get('idempotency_key') or None
+    # A repeated submit of the same checkout form goes straight to the order it already created
+    existing = find_order_by_key(user.id, idempotency_key)
+    if existing:
+        cart.clear()
+        db.session.commit()
+        return redirect(url_for('orders.order_success_page', order_id=existing.id))
+    cart_items = cart.get()
+    if not cart_items: return redirect(url_for('orders.cart_page'))
+    # Price against the database itself, so the order is charged what the menu says right now
+    quote = pricer.quote(cart_items, fresh=True)
+    if quote.errors:
+        flash('Some items in your cart have changed. Please review your cart.', 'error')
+        return redirect(url_for('orders.cart_page'))
+    new_order = Order(total_price=quote.total, user_id=user.id, name=request.form.get('name'), email=request.form.get('email'), address=request.form.get('address'), city=request.form.get('city'), idempotency_key=idempotency_key)
+    # One transaction: flush for the order id, bulk-insert the lines, commit once
+    try:
+        db.session.add(new_order)
+        db.session.flush()
+        order_id = new_order.id
+        db.session.execute(insert(OrderItem), [
+            {'order_id': order_id, 'food_item_id': line.item_id, 'quantity': line.quantity, 'price_per_item': line.unit_price}
+            for line in quote.lines
+        ])
+        analytics.record_order(new_order.date_placed, quote.total, [(line.item_id, line.quantity, line.unit_price) for line in quote.lines])
+        outbox.add('order_confirmation', order_id=order_id)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        # Lost the race against a concurrent submit carrying the same key
+        existing = find_order_by_key(user.id, idempotency_key)
+        if not existing: raise
+        order_id = existing.id
+    cart.clear()
+    db.session.commit()
+    return redirect(url_for('orders.order_success_page', order_id=order_id))
+
+def reprice_cart():
+    # Reprice from the catalog and write any dropped items or new prices back, so each change is flagged once
+    cart_items = cart.get()
+    quote = pricer.quote(cart_items)
+    if quote.errors:
+        cart.save(quote.synced_cart())
+        db.session.commit()
+    return quote
+
+def find_order_by_key(user_id, idempotency_key):
+    if not idempotency_key: return None
+    return Order.query.filter_by(user_id=user_id, idempotency_key=idempotency_key).first()
+
+@bp.route('/order_success')
+def order_success_page():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user_data = users.current()
+    order = Order.query.get(request.args.get('order_id'))
+    if not order or order.user_id != user_data.id: return redirect(url_for('catalog.home'))
+    return render_template('order_success.html', user=user_data, order=order)
+
+@bp.route('/my_orders')
+def my_orders():
+    if 'user' not in session: return redirect(url_for('account.login'))
+    user_data = users.current()
+    page_size = current_app.config['HISTORY_PAGE_SIZE']
+    # Keyset pagination on (date_placed, id); items and their food rows come back in the same query
+    query = Order.query.filter_by(user_id=user_data.id).options(joinedload(Order.items).joinedload(OrderItem.food_item))
+    cursor = parse_order_cursor(request.args.get('before'))
+    if cursor:
+        query = query.filter(tuple_(Order.date_placed, Order.id) < cursor)
+    orders = query.order_by(Order.date_placed.desc(), Order.id.desc()).limit(page_size + 1).all()
+    if len(orders) <= page_size or archive.reaches(user_data.id, orders[page_size - 1].date_placed):
+        # Back past the hot window: archived receipts interleave from here on, on the same cursor
+        orders = sorted(orders + archive.page(user_data.id, cursor, page_size + 1),
+                        key=lambda order: (order.date_placed, order.id), reverse=True)[:page_size + 1]
+    next_cursor = None
+    if len(orders) > page_size:
+        orders = orders[:page_size]
+        next_cursor = f"{orders[-1].date_placed.isoformat()}_{orders[-1].id}"
+    return render_template('my_orders.html', user=user_data, orders=orders, next_cursor=next_cursor, paged=cursor is not None)
+
+def parse_order_cursor(value):
+    try:
+        placed, order_id = value.rsplit('_', 1)
+        return datetime.datetime.fromisoformat(placed), int(order_id)
+    except (AttributeError, ValueError):
+        return None
@@ -0,0 +1,109 @@
+"""Small building blocks shared by the in-process caches."""
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import inspect
+
+_row_types = {}
+
+
+def row_type(model):
+    """Return (and memoise) a namedtuple class mirroring the model's columns."""
+    cls = _row_types.get(model)
+    if cls is None:
+        fields = [attr.key for attr in inspect(model).column_attrs]
+        cls = _row_types[model] = namedtuple(model.__name__ + 'Row', fields)
+    return cls
+
+
+def snapshot(obj):
+    """Copy an ORM instance into an immutable row that is safe to share between threads."""
+    cls = row_type(type(obj))
+    return cls(*(getattr(obj, field) for field in cls._fields))
+
+
+class VersionStamp:
+    """A version number kept in a small file so every worker on the host can see it.
+
+    Checking for a new version is a single ``os.stat`` call; the file is only
+    re-read when it has been replaced by a ``bump()`` from any process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stat_key = None
+        self._value = 0
+
+    def current(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if key != self._stat_key:
+            with self._lock:
+                try:
+                    with open(self.path) as fh:
+                        self._value = int(fh.read().strip() or 0)
+                except (FileNotFoundError, ValueError):
+                    self._value = 0
+                self._stat_key = key
+        return self._value
+
+    def bump(self):
+        # Nanosecond timestamps keep versions unique across processes without a lock file.
+        value = max(time.time_ns(), self.current() + 1)
+        tmp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as fh:
+            fh.write(str(value))
+        os.replace(tmp_path, self.path)
+        return value
+
+
+class TTLCache:
+    """A thread-safe LRU mapping whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,169 @@
+"""Server-side cart storage.
+
+The signed session cookie only carries a random ``cart_id``; the cart itself
+lives in a pluggable store with a TTL, so abandoned carts expire on their
+own and the cookie stays the same size however many items are added.
+
+Backends:
+  ``sql``     the ``cart_session`` table in the app database (default; shared
+              by every worker)
+  ``memory``  an in-process store, for a single-process dev server or tests
+  ``redis://`` a Redis server (needs the ``redis`` package)
+
+The memory backend is the Redis backend running on ``LocalRedis``, a tiny
+in-process stand-in for the three Redis commands the store uses. Every
+backend has ``load(cart_id)`` (the cart, or None), ``save(cart_id, cart)``
+and ``delete(cart_id)``. The SQL backend writes through ``db.session`` and
+leaves the commit to the caller, like any other change in the request, so
+views commit after changing the cart.
+"""
+import datetime
+import json
+import threading
+import time
+import uuid
+
+from flask import g, session
+from sqlalchemy import delete, insert, select, update
+
+
+class LocalRedis:
+    """The subset of the redis-py client API used by RedisCartStore, kept in memory."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def setex(self, key, seconds, value):
+        if isinstance(value, str):
+            value = value.encode()
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + seconds)
+            if len(self._data) % 1000 == 0:
+                self._purge()
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def _purge(self):
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+
+
+class RedisCartStore:
+    def __init__(self, client, ttl, prefix='cart:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def load(self, cart_id):
+        raw = self.client.get(self.prefix + cart_id)
+        return json.loads(raw) if raw else None
+
+    def save(self, cart_id, cart):
+        self.client.setex(self.prefix + cart_id, self.ttl, json.dumps(cart, separators=(',', ':')))
+
+    def delete(self, cart_id):
+        self.client.delete(self.prefix + cart_id)
+
+
+class SQLCartStore:
+    """Carts as JSON rows; expired rows are ignored on read and purged periodically."""
+
+    PURGE_INTERVAL = 600
+
+    def __init__(self, db, model, ttl):
+        self.db = db
+        self.model = model
+        self.ttl = ttl
+        self._next_purge = 0
+
+    def load(self, cart_id):
+        Cart = self.model
+        row = self.db.session.execute(select(Cart.data, Cart.expires_at).where(Cart.id == cart_id)).first()
+        if row is None or row.expires_at <= datetime.datetime.utcnow():
+            return None
+        return json.loads(row.data)
+
+    def save(self, cart_id, cart):
+        Cart = self.model
+        values = {'data': json.dumps(cart, separators=(',', ':')),
+                  'expires_at': datetime.datetime.utcnow() + datetime.timedelta(seconds=self.ttl)}
+        result = self.db.session.execute(update(Cart).where(Cart.id == cart_id).values(**values))
+        if result.rowcount == 0:
+            self.db.session.execute(insert(Cart).values(id=cart_id, **values))
+        self._maybe_purge()
+
+    def delete(self, cart_id):
+        self.db.session.execute(delete(self.model).where(self.model.id == cart_id))
+
+    def _maybe_purge(self):
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + self.PURGE_INTERVAL
+        self.db.session.execute(delete(self.model).where(self.model.expires_at <= datetime.datetime.utcnow()))
+
+
+def create_cart_store(app, db, model):
+    backend = app.config['CART_STORE']
+    ttl = app.config['CART_TTL']
+    if backend == 'sql':
+        return SQLCartStore(db, model, ttl)
+    if backend == 'memory':
+        return RedisCartStore(LocalRedis(), ttl)
+    if backend.startswith(('redis://', 'rediss://', 'unix://')):
+        import redis
+        return RedisCartStore(redis.Redis.from_url(backend), ttl)
+    raise RuntimeError(f'Unknown CART_STORE {backend!r}')
+
+
+class SessionCart:
+    """The current visitor's cart: ``cart_id`` in the session, contents in the store; commit after save/clear."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def get(self):
+        if 'cart' not in g:
+            g.cart = self._load()
+        return g.cart
+
+    def save(self, cart):
+        g.cart = cart
+        if not cart:
+            return self.clear()
+        session.pop('cart', None)  # a cookie cart (see _load) has now moved to the store
+        if 'cart_id' not in session:
+            session['cart_id'] = uuid.uuid4().hex
+        self.store.save(session['cart_id'], cart)
+
+    def clear(self):
+        g.cart = {}
+        session.pop('cart', None)
+        cart_id = session.pop('cart_id', None)
+        if cart_id:
+            self.store.delete(cart_id)
+
+    def _load(self):
+        legacy = session.get('cart')
+        if legacy:
+            # Carts from before server-side storage still live in the cookie until the next save moves them over
+            return legacy
+        cart_id = session.get('cart_id')
+        cart = self.store.load(cart_id) if cart_id else None
+        if cart is None and cart_id:
+            session.pop('cart_id')
+        return cart or {}
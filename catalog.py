@@ -0,0 +1,132 @@
+"""In-process cache of the menu catalog (FoodItem and Restaurant rows).
+
+The catalog only changes on admin writes, so every worker keeps a read-only
+snapshot in memory. Commits that touch a catalog model bump a shared
+``VersionStamp``; other workers notice the new version on their next read
+and rebuild their snapshot.
+
+The session hooks are registered once per process, on the Session class,
+and passed on to the cache of the app in context; creating more apps (tests,
+bench, CLI) adds no listeners and never invalidates another app's cache.
+"""
+import threading
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from caching import snapshot
+
+
+class CatalogSnapshot:
+    def __init__(self, version, items, restaurants):
+        self.version = version
+        self.items = {item.id: item for item in items}
+        self.restaurants = {restaurant.id: restaurant for restaurant in restaurants}
+        self.restaurant_list = tuple(restaurants)
+        self.item_list = tuple(items)
+        by_tag, by_tag_sub = {}, {}
+        for item in items:
+            by_tag.setdefault(item.tag, []).append(item)
+            by_tag_sub.setdefault((item.tag, item.sub_tag), []).append(item)
+        self.by_tag = {key: tuple(rows) for key, rows in by_tag.items()}
+        self.by_tag_sub = {key: tuple(rows) for key, rows in by_tag_sub.items()}
+
+
+class CatalogCache:
+    def __init__(self, db, food_item_model, restaurant_model, stamp):
+        self.db = db
+        self.food_item_model = food_item_model
+        self.restaurant_model = restaurant_model
+        self.stamp = stamp
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self.hits = 0    # reads served by the current snapshot
+        self.misses = 0  # snapshot rebuilds
+
+    def init_app(self, app):
+        # Where the session hooks below find this app's cache
+        app.extensions['catalog'] = self
+
+    # --- Reads ---
+
+    def snapshot(self):
+        current = self._snapshot
+        version = self.stamp.current()
+        if current is None or current.version != version:
+            with self._lock:
+                current = self._snapshot
+                if current is None or current.version != version:
+                    current = self._snapshot = self._build(version)
+                    self.misses += 1
+                    return current
+        self.hits += 1
+        return current
+
+    @property
+    def version(self):
+        return self.snapshot().version
+
+    def item(self, item_id):
+        return self.snapshot().items.get(item_id)
+
+    def items(self):
+        return self.snapshot().item_list
+
+    def items_by_tag(self, tag):
+        return self.snapshot().by_tag.get(tag, ())
+
+    def items_by_sub_tag(self, tag, sub_tag):
+        return self.snapshot().by_tag_sub.get((tag, sub_tag), ())
+
+    def restaurant(self, restaurant_id):
+        return self.snapshot().restaurants.get(restaurant_id)
+
+    def restaurants(self):
+        return self.snapshot().restaurant_list
+
+    def _build(self, version):
+        FoodItem, Restaurant = self.food_item_model, self.restaurant_model
+        items = [snapshot(item) for item in FoodItem.query.order_by(FoodItem.id)]
+        restaurants = [snapshot(r) for r in Restaurant.query.order_by(Restaurant.id)]
+        return CatalogSnapshot(version, items, restaurants)
+
+    # --- Invalidation ---
+
+    def invalidate(self):
+        self._snapshot = None
+        self.stamp.bump()
+
+    def _track_changes(self, session, flush_context, instances):
+        models = (self.food_item_model, self.restaurant_model)
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, models):
+                session.info['catalog_changed'] = True
+                return
+
+    def _track_bulk_changes(self, state):
+        # Bulk query.delete()/update() and insert() statements never reach before_flush.
+        if state.is_select or state.bind_mapper is None:
+            return
+        if issubclass(state.bind_mapper.class_, (self.food_item_model, self.restaurant_model)):
+            state.session.info['catalog_changed'] = True
+
+    def _after_commit(self, session):
+        if session.info.pop('catalog_changed', False):
+            self.invalidate()
+
+    def _after_rollback(self, session, previous_transaction):
+        session.info.pop('catalog_changed', None)
+
+
+def _dispatch(method):
+    def listener(*args):
+        cache = current_app.extensions.get('catalog') if has_app_context() else None
+        if cache is not None:
+            getattr(cache, method)(*args)
+    return listener
+
+
+for _event, _method in (('before_flush', '_track_changes'), ('do_orm_execute', '_track_bulk_changes'),
+                        ('after_commit', '_after_commit'), ('after_soft_rollback', '_after_rollback')):
+    event.listen(Session, _event, _dispatch(_method))
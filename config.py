@@ -0,0 +1,81 @@
+"""Default settings; ``create_app(config)`` applies overrides on top of these."""
+import datetime
+import os
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+
+class Config:
+    # Signs the session cookie; required outside debug/testing (create_app refuses to start without it)
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    # /add_test_data and /fix_profile_pic (see blueprints/dev.py); always on with --debug
+    DEV_ROUTES = os.environ.get('DEV_ROUTES') == '1'
+
+    # --- Database & Upload Configuration ---
+    # (the database URL and its pool + pragma tuning come from DATABASE_URL / DB_PROFILE, see database.py)
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Define where profile pics live
+    UPLOAD_FOLDER = os.path.join(basedir, 'static/profile_pics')
+    # Larger request bodies are refused with a 413 before they are read
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+    # Password KDF and work factor (werkzeug format, e.g. 'pbkdf2:sha256:600000'); older hashes are upgraded at login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_QUEUE = 16
+    # Login/signup attempts: (burst, seconds to refill it) per client IP and per email
+    LOGIN_LIMIT_PER_IP = (20, 60)
+    LOGIN_LIMIT_PER_EMAIL = (5, 300)
+    # Shared by all workers on the host so they can spot a stale catalog cache
+    CATALOG_VERSION_FILE = os.path.join(basedir, 'catalog.version')
+    # Logged-in user rows are cached per worker; edits clear them, other workers catch up after the TTL
+    USER_CACHE_SIZE = 2048
+    USER_CACHE_TTL = 60
+    # Page size for /my_orders and /my_bookings (keyset paginated)
+    HISTORY_PAGE_SIZE = 20
+    # Admin menu list and /admin/api/items: default and largest page
+    ADMIN_PAGE_SIZE = 50
+    ADMIN_MAX_PAGE_SIZE = 500
+    SEARCH_RESULT_LIMIT = 50
+    SEARCH_SUGGEST_LIMIT = 8
+    # Where carts live: 'sql' (shared by all workers), 'memory' (single process) or a redis:// URL
+    CART_STORE = os.environ.get('CART_STORE', 'sql')
+    CART_TTL = 7 * 24 * 3600
+    DELIVERY_FEE = float(os.environ.get('DELIVERY_FEE', '5.00'))
+    # Table bookings: first and last slot of the day, slot length and how far ahead tables can be booked
+    BOOKING_FIRST_SLOT = datetime.time(11, 0)
+    BOOKING_LAST_SLOT = datetime.time(22, 0)
+    BOOKING_SLOT_MINUTES = 30
+    BOOKING_WINDOW_DAYS = 7
+    # Rows per transaction for menu imports (and per fetch for exports)
+    MENU_IMPORT_BATCH_SIZE = 1000
+    # Anonymous menu pages and shared menu fragments kept in memory, keyed by catalog version
+    PAGE_CACHE_SIZE = 512
+    PAGE_CACHE_TTL = 300
+    # Requests slower than this are logged with their SQL count; /metrics wants this bearer token when set
+    SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', '500'))
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    # Confirmation emails are sent by `flask outbox-worker`, never by the request (run `python smtp_sink.py` locally)
+    MAIL_SERVER = os.environ.get('MAIL_SERVER', '127.0.0.1')
+    MAIL_PORT = int(os.environ.get('MAIL_PORT', '8025'))
+    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS') == '1'
+    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER', 'FoodWheels <orders@foodwheels.com>')
+    # Outbox worker: jobs per batch, tries before a job is dead-lettered, first retry delay doubling up to the cap (seconds)
+    OUTBOX_BATCH_SIZE = 50
+    OUTBOX_MAX_ATTEMPTS = 8
+    OUTBOX_BACKOFF = 30
+    OUTBOX_MAX_BACKOFF = 3600
+    # "Frequently ordered together": built by `flask refresh-recommendations`, memory-mapped by every worker
+    RECOMMENDATIONS_DIR = os.path.join(basedir, 'recommendations')
+    RECOMMENDATIONS_K = 12
+    RECOMMENDATIONS_MIN_SUPPORT = 2  # orders two items must share before they are suggested together
+    # Off where `flask refresh-recommendations` never runs, so archiving doesn't wait for it
+    RECOMMENDATIONS_ENABLED = os.environ.get('RECOMMENDATIONS_ENABLED', '1') == '1'
+    # Delivery batches: most orders per driver, and how far apart (minutes) orders in one batch may have been placed
+    DISPATCH_BATCH_SIZE = 10
+    DISPATCH_WINDOW_MINUTES = 20
+    DISPATCH_INTERVAL = 60  # seconds between `flask dispatch-tick --loop` runs
+    # Delivered/cancelled orders older than this move to the compressed order_archive table (`flask archive-orders`)
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', '180'))
+    ARCHIVE_BATCH_SIZE = 500  # orders per transaction
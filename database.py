@@ -0,0 +1,80 @@
+"""Database profiles: connection URL, pool sizing and per-connection pragmas.
+
+The profile is picked by the ``DB_PROFILE`` environment variable (default:
+``sqlite`` for SQLite URLs, ``postgres`` otherwise) and the URL by
+``DATABASE_URL`` (default: the bundled ``site.db``), so the same code runs
+on a single box with SQLite or against Postgres in larger deployments.
+"""
+import os
+
+from sqlalchemy import event
+
+MB = 1024 * 1024
+
+PROFILES = {
+    # Production SQLite: WAL lets readers run alongside the single writer, and
+    # busy_timeout makes a writer wait for the lock instead of failing with
+    # "database is locked". synchronous=NORMAL is durable across app crashes
+    # in WAL mode and only fsyncs at checkpoints.
+    'sqlite': {
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 5000,
+            'mmap_size': 256 * MB,
+            'cache_size': -32000,  # negative = KiB, so ~32 MB per connection
+            'temp_store': 'MEMORY',
+        },
+        # One connection per gunicorn thread plus a little headroom.
+        'engine_options': {'pool_size': 8, 'max_overflow': 4, 'pool_timeout': 10},
+    },
+    # The old behaviour: rollback journal, SQLAlchemy's default pool.
+    'sqlite-dev': {
+        'pragmas': {'busy_timeout': 5000},
+        'engine_options': {},
+    },
+    'postgres': {
+        'pragmas': {},
+        'engine_options': {'pool_size': 10, 'max_overflow': 10, 'pool_timeout': 10,
+                           'pool_pre_ping': True, 'pool_recycle': 1800},
+    },
+}
+
+
+def configure_database(app, default_url):
+    """Fill the SQLAlchemy settings in ``app.config`` from the selected profile."""
+    url = os.environ.get('DATABASE_URL', default_url)
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    name = os.environ.get('DB_PROFILE') or ('sqlite' if url.startswith('sqlite') else 'postgres')
+    if name not in PROFILES:
+        raise RuntimeError(f"Unknown DB_PROFILE {name!r}; expected one of {', '.join(PROFILES)}")
+    profile = PROFILES[name]
+
+    engine_options = dict(profile['engine_options'])
+    for option, env_var in (('pool_size', 'DB_POOL_SIZE'), ('max_overflow', 'DB_MAX_OVERFLOW')):
+        if os.environ.get(env_var):
+            engine_options[option] = int(os.environ[env_var])
+    if url in ('sqlite://', 'sqlite:///:memory:'):
+        engine_options = {}  # in-memory SQLite lives in a single connection
+
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    app.config['DB_PROFILE'] = name
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+    app.config['SQLITE_PRAGMAS'] = dict(profile['pragmas'])
+
+
+def install_pragmas(app, db):
+    """Run the profile's PRAGMA statements on every new SQLite connection."""
+    pragmas = app.config.get('SQLITE_PRAGMAS')
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
@@ -0,0 +1,197 @@
+"""Delivery dispatch: group pending orders into driver batches by city and time window.
+
+Order lifecycle: ``pending`` (placed) -> ``batched`` (assigned to a
+DispatchBatch) -> ``out_for_delivery`` -> ``delivered``; ``cancelled`` can
+happen any time before delivery.
+
+``flask dispatch-tick`` (cron, or ``--loop``) walks the pending orders one
+city at a time, oldest first, straight off the (status, city, date_placed)
+index, reading only ids and timestamps in chunks. Orders are grouped
+greedily: a batch takes orders placed within ``window`` of its first one,
+up to ``max_size``. A full batch closes at once; a partial one only once its
+window has passed, so later orders still have a chance to join it. Each
+pass writes up to 100 closed batches with one INSERT and one conditional
+UPDATE of their orders, and memory stays at one pass whatever the backlog.
+"""
+import datetime
+import time
+
+import click
+from sqlalchemy import bindparam, delete, func, insert, select, update
+
+PENDING, BATCHED, OUT_FOR_DELIVERY, DELIVERED, CANCELLED = (
+    'pending', 'batched', 'out_for_delivery', 'delivered', 'cancelled')
+ORDER_STATUSES = (PENDING, BATCHED, OUT_FOR_DELIVERY, DELIVERED, CANCELLED)
+READY = 'ready'  # a new batch, waiting for a driver
+# Batch status -> (order status it moves its orders to, statuses it can be reached from)
+BATCH_TRANSITIONS = {
+    OUT_FOR_DELIVERY: (OUT_FOR_DELIVERY, (READY,)),
+    DELIVERED: (DELIVERED, (READY, OUT_FOR_DELIVERY)),
+}
+BATCHES_PER_COMMIT = 100
+
+
+class DispatchError(Exception):
+    pass
+
+
+class Dispatcher:
+    def __init__(self, db, order_model, batch_model, max_size=10, window_minutes=20, chunk_size=1000):
+        self.db = db
+        self.order_model = order_model
+        self.batch_model = batch_model
+        self.max_size = max_size
+        self.window = datetime.timedelta(minutes=window_minutes)
+        self.chunk_size = chunk_size
+
+    # --- Batching ---
+
+    def tick(self, now=None):
+        """Batch what can be batched now; returns (batches created, orders batched)."""
+        Order = self.order_model
+        now = now or datetime.datetime.utcnow()
+        cities = self.db.session.scalars(select(Order.city).where(Order.status == PENDING).distinct()).all()
+        batches = orders = 0
+        for city in cities:
+            created, batched = self._batch_city(city, now)
+            batches += created
+            orders += batched
+        return batches, orders
+
+    def _batch_city(self, city, now):
+        created = batched = 0
+        while True:
+            groups, more = self._close_groups(city, now)
+            if groups:
+                created_now, batched_now = self._create_batches(city, groups, now)
+                created, batched = created + created_now, batched + batched_now
+            self.db.session.commit()
+            if not more:
+                return created, batched
+
+    def _close_groups(self, city, now):
+        """Up to BATCHES_PER_COMMIT closed groups of (id, date_placed), and whether there may be more."""
+        Order = self.order_model
+        pending = self.db.session.execute(
+            select(Order.id, Order.date_placed).where(Order.status == PENDING, Order.city == city)
+            .order_by(Order.date_placed, Order.id).execution_options(yield_per=self.chunk_size))
+        groups, current = [], []
+        try:
+            for order_id, placed in pending:
+                if current and (len(current) == self.max_size or placed - current[0][1] > self.window):
+                    groups.append(current)
+                    if len(groups) == BATCHES_PER_COMMIT:
+                        return groups, True  # batched orders leave the index, so the next read resumes here
+                    current = []
+                current.append((order_id, placed))
+        finally:
+            pending.close()
+        if current and (len(current) == self.max_size or now - current[0][1] > self.window):
+            groups.append(current)
+        return groups, False
+
+    def _create_batches(self, city, groups, now):
+        """One multi-row INSERT for the batches and one executemany UPDATE for their orders."""
+        Order, Batch = self.order_model, self.batch_model
+        connection = self.db.session.connection()
+        batch_ids = connection.execute(insert(Batch).returning(Batch.id, sort_by_parameter_order=True), [
+            {'city': city, 'status': READY, 'created_at': now, 'window_start': group[0][1],
+             'window_end': group[-1][1], 'order_count': len(group)} for group in groups]).scalars().all()
+        # Only orders still pending: one cancelled meanwhile stays out of its batch. The status test is
+        # wrapped so SQLite finds each row by primary key rather than walking the pending index.
+        connection.execute(
+            update(Order.__table__)
+            .where(Order.id == bindparam('order_id'), func.coalesce(Order.status, '') == PENDING)
+            .values(status=BATCHED, dispatch_batch_id=bindparam('batch_id')),
+            [{'order_id': order_id, 'batch_id': batch_id}
+             for batch_id, group in zip(batch_ids, groups) for order_id, _ in group])
+        taken = dict(connection.execute(
+            select(Order.dispatch_batch_id, func.count()).where(Order.dispatch_batch_id.in_(batch_ids))
+            .group_by(Order.dispatch_batch_id)).all())
+        short = [(batch_id, taken.get(batch_id, 0)) for batch_id, group in zip(batch_ids, groups)
+                 if taken.get(batch_id, 0) != len(group)]
+        for batch_id, count in short:
+            if count:
+                connection.execute(update(Batch).where(Batch.id == batch_id).values(order_count=count))
+            else:
+                connection.execute(delete(Batch).where(Batch.id == batch_id))
+        return len(batch_ids) - sum(1 for _, count in short if not count), sum(taken.values())
+
+    # --- Batch lifecycle ---
+
+    def set_batch_status(self, batch_id, status, driver=None):
+        """Move a batch and its orders along (out_for_delivery, delivered); raises DispatchError."""
+        if status not in BATCH_TRANSITIONS:
+            raise DispatchError(f'Unknown batch status {status!r}; expected one of {", ".join(BATCH_TRANSITIONS)}.')
+        Order, Batch = self.order_model, self.batch_model
+        order_status, allowed = BATCH_TRANSITIONS[status]
+        values = {'status': status}
+        if driver:
+            values['driver'] = driver
+        moved = self.db.session.execute(
+            update(Batch).where(Batch.id == batch_id, Batch.status.in_(allowed)).values(**values)).rowcount
+        if not moved:
+            self.db.session.rollback()
+            if self.db.session.get(Batch, batch_id) is None:
+                raise DispatchError(f'No dispatch batch {batch_id}.')
+            raise DispatchError(f'Batch {batch_id} cannot go to {status!r} from its current status.')
+        self.db.session.execute(
+            update(Order).where(Order.dispatch_batch_id == batch_id, Order.status != CANCELLED)
+            .values(status=order_status))
+        self.db.session.commit()
+
+    # --- Reading ---
+
+    def batches(self, status=None, city=None, after=None, limit=50):
+        """Newest batches first, keyset paginated on id; returns (batches, next cursor)."""
+        Batch = self.batch_model
+        query = select(Batch).order_by(Batch.id.desc()).limit(limit + 1)
+        if status:
+            query = query.where(Batch.status == status)
+        if city:
+            query = query.where(Batch.city == city)
+        if after:
+            query = query.where(Batch.id < after)
+        batches = self.db.session.scalars(query).all()
+        next_cursor = None
+        if len(batches) > limit:
+            batches = batches[:limit]
+            next_cursor = batches[-1].id
+        return batches, next_cursor
+
+    def orders_by_batch(self, batch_ids):
+        Order = self.order_model
+        rows = self.db.session.execute(
+            select(Order.dispatch_batch_id, Order.id, Order.name, Order.address, Order.city, Order.date_placed,
+                   Order.status, Order.total_price)
+            .where(Order.dispatch_batch_id.in_(batch_ids)).order_by(Order.date_placed, Order.id))
+        grouped = {batch_id: [] for batch_id in batch_ids}
+        for row in rows:
+            grouped[row.dispatch_batch_id].append(row)
+        return grouped
+
+    def backlog(self):
+        """Pending orders per city, and when the oldest one was placed."""
+        Order = self.order_model
+        rows = self.db.session.execute(
+            select(Order.city, func.count(), func.min(Order.date_placed))
+            .where(Order.status == PENDING).group_by(Order.city).order_by(Order.city))
+        return [{'city': city, 'pending': count, 'oldest': oldest.isoformat()} for city, count, oldest in rows]
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        app.config.setdefault('DISPATCH_INTERVAL', 60)
+
+        @app.cli.command('dispatch-tick')
+        @click.option('--loop', is_flag=True, help='Keep ticking every DISPATCH_INTERVAL seconds.')
+        def dispatch_tick_command(loop):
+            """Group pending orders into delivery batches."""
+            while True:
+                started = time.perf_counter()
+                batches, orders = self.tick()
+                click.echo(f'{batches} batch(es), {orders} order(s) in {time.perf_counter() - started:.2f}s')
+                if not loop:
+                    return
+                self.db.session.remove()
+                time.sleep(app.config['DISPATCH_INTERVAL'])
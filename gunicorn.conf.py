@@ -0,0 +1,51 @@
+"""gunicorn settings, picked up from the project directory: run ``gunicorn --workers 4 --threads 2``.
+
+With ``preload_app`` (the default here; ``GUNICORN_PRELOAD=0`` turns it off)
+the master imports and builds the app once, warms its read-only caches
+(services.warm: the catalog snapshot, the recommendations table, compiled
+templates) and only then forks the workers. They start in milliseconds
+instead of each importing and building everything again, and share those
+pages with the master copy-on-write.
+
+Two things keep the pages shared. The master drops its database connections
+before forking, since a connection must never be used by two processes. And
+the garbage collector is kept off the inherited objects: it stays disabled
+in the master while the app loads, everything alive at fork time is moved to
+the permanent generation with ``gc.freeze()``, and each worker turns
+collection back on for what it allocates itself.
+"""
+import gc
+import os
+import time
+
+wsgi_app = 'app:create_app()'
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+
+if preload_app:
+    gc.disable()
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from services import warm
+        started = time.perf_counter()
+        warm(server.app.wsgi())
+        server.log.info('Caches warmed in %.0f ms', (time.perf_counter() - started) * 1000)
+
+
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        gc.freeze()
+    worker.forked_at = time.monotonic()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        from models import db
+        with server.app.wsgi().app_context():
+            db.engine.dispose(close=False)  # forget any connection inherited from the master
+        gc.enable()
+
+
+def post_worker_init(worker):
+    worker.log.info('Worker %s booted in %.0f ms', worker.pid, (time.monotonic() - worker.forked_at) * 1000)
@@ -0,0 +1,172 @@
+"""Responsive derivatives for the menu photos in static/images.
+
+``flask build-images`` is an offline build step: it resizes every source
+photo to the widths the templates need, encodes each size as AVIF, WebP and
+JPEG under a content-hashed filename and records everything in a manifest.
+Templates call ``responsive_image()`` which turns the manifest entry into a
+``<picture>`` element with ``srcset``; photos that have not been built yet
+fall back to the original file. The manifest is read once per worker, so
+run the build before (re)starting the app.
+"""
+import hashlib
+import json
+import os
+
+import click
+from flask import url_for
+from markupsafe import Markup
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.avif')
+
+# Widths (px) generated for each place a photo is shown, and the matching sizes attribute.
+VARIANTS = {
+    'thumb': {'widths': (80, 160), 'sizes': '80px'},
+    'card': {'widths': (240, 480), 'sizes': '(max-width: 600px) 50vw, 240px'},
+    'detail': {'widths': (600, 1200), 'sizes': '(max-width: 900px) 100vw, 600px'},
+}
+
+FORMATS = {
+    'avif': {'mime': 'image/avif', 'save': {'quality': 50, 'speed': 6}},
+    'webp': {'mime': 'image/webp', 'save': {'quality': 78, 'method': 6}},
+    'jpeg': {'mime': 'image/jpeg', 'save': {'quality': 80, 'optimize': True, 'progressive': True}},
+}
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _build_one(source_path, output_dir, formats):
+    """Encode every width/format of one photo. Runs in a worker process."""
+    from PIL import Image, ImageOps
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    widths = sorted({w for variant in VARIANTS.values() for w in variant['widths']})
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img).convert('RGB')
+        entry = {'source_hash': _file_hash(source_path), 'width': img.width, 'height': img.height, 'files': {}}
+        for width in widths:
+            if width > img.width and width != widths[0]:
+                continue  # never upscale, but always keep the smallest size
+            height = max(1, round(img.height * width / img.width))
+            resized = img.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                tmp_path = os.path.join(output_dir, f'.{stem}.{width}.{os.getpid()}.tmp')
+                resized.save(tmp_path, format=fmt.upper(), **FORMATS[fmt]['save'])
+                digest = _file_hash(tmp_path)[:12]
+                ext = 'jpg' if fmt == 'jpeg' else fmt
+                name = f'{stem}.{width}.{digest}.{ext}'
+                os.replace(tmp_path, os.path.join(output_dir, name))
+                entry['files'].setdefault(fmt, {})[str(width)] = name
+    return entry
+
+
+def build_images(source_dir, output_dir, manifest_path, force=False, jobs=None, log=print):
+    """Build derivatives for new or changed photos and rewrite the manifest."""
+    # Only this offline build needs Pillow and a process pool; the app itself just reads the manifest
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        from PIL import features
+    except ImportError:  # the app still serves originals without Pillow
+        raise click.ClickException('Pillow is required to build image derivatives.')
+    os.makedirs(output_dir, exist_ok=True)
+    formats = [fmt for fmt in FORMATS if fmt != 'avif' or features.check('avif')]
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as fh:
+            manifest = json.load(fh)
+
+    pending = []
+    for filename in sorted(os.listdir(source_dir)):
+        path = os.path.join(source_dir, filename)
+        if not filename.lower().endswith(SOURCE_EXTENSIONS) or not os.path.isfile(path):
+            continue
+        entry = manifest.get(filename)
+        if entry and entry['source_hash'] == _file_hash(path) and set(entry['files']) == set(formats):
+            continue
+        pending.append(filename)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {name: pool.submit(_build_one, os.path.join(source_dir, name), output_dir, formats) for name in pending}
+        for done, (name, future) in enumerate(futures.items(), 1):
+            manifest[name] = future.result()
+            log(f'[{done}/{len(pending)}] {name}')
+
+    # Drop derivatives that are no longer referenced by the manifest.
+    live = {name for entry in manifest.values() for sizes in entry['files'].values() for name in sizes.values()}
+    for name in os.listdir(output_dir):
+        if name not in live and name != os.path.basename(manifest_path):
+            os.remove(os.path.join(output_dir, name))
+
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as fh:
+        json.dump(manifest, fh, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return len(pending)
+
+
+class ResponsiveImages:
+    def __init__(self, app=None):
+        self._manifest = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        images_dir = os.path.join(app.static_folder, 'images')
+        app.config.setdefault('IMAGES_SOURCE_DIR', images_dir)
+        app.config.setdefault('IMAGES_OUTPUT_DIR', os.path.join(images_dir, 'derived'))
+        app.config.setdefault('IMAGES_MANIFEST', os.path.join(images_dir, 'derived', 'manifest.json'))
+        self.config = app.config
+        self.static_folder = app.static_folder
+        app.jinja_env.globals['responsive_image'] = self.responsive_image
+
+        @app.cli.command('build-images')
+        @click.option('--force', is_flag=True, help='Rebuild every photo, ignoring the manifest.')
+        @click.option('--jobs', type=int, default=None, help='Worker processes (defaults to CPU count).')
+        def build_images_command(force, jobs):
+            """Generate resized AVIF/WebP/JPEG derivatives of static/images."""
+            built = build_images(app.config['IMAGES_SOURCE_DIR'], app.config['IMAGES_OUTPUT_DIR'],
+                                 app.config['IMAGES_MANIFEST'], force=force, jobs=jobs, log=click.echo)
+            click.echo(f'Built derivatives for {built} photo(s).')
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            try:
+                with open(self.config['IMAGES_MANIFEST']) as fh:
+                    self._manifest = json.load(fh)
+            except FileNotFoundError:
+                self._manifest = {}
+        return self._manifest
+
+    def responsive_image(self, filename, variant='card', alt='', css_class=None, lazy=True):
+        """Render a <picture> for ``filename`` sized for ``variant`` (thumb, card or detail)."""
+        spec = VARIANTS[variant]
+        attrs = Markup(' alt="{}" decoding="async"').format(alt)
+        if lazy:
+            attrs += Markup(' loading="lazy"')
+        if css_class:
+            attrs += Markup(' class="{}"').format(css_class)
+        entry = self.manifest.get(filename)
+        if not entry:
+            return Markup('<img src="{}"').format(url_for('static', filename='images/' + filename)) + attrs + Markup('>')
+
+        prefix = os.path.relpath(self.config['IMAGES_OUTPUT_DIR'], self.static_folder).replace(os.sep, '/')
+
+        def srcset(fmt):
+            sizes = entry['files'][fmt]
+            return ', '.join(f"{url_for('static', filename=f'{prefix}/{sizes[str(w)]}')} {w}w"
+                             for w in spec['widths'] if str(w) in sizes)
+
+        sources = Markup('').join(
+            Markup('<source type="{}" srcset="{}" sizes="{}">').format(FORMATS[fmt]['mime'], srcset(fmt), spec['sizes'])
+            for fmt in ('avif', 'webp') if fmt in entry['files']
+        )
+        jpegs = entry['files']['jpeg']
+        fallback = max((w for w in spec['widths'] if str(w) in jpegs), default=None) or min(jpegs, key=int)
+        img = Markup('<img src="{}" srcset="{}" sizes="{}"').format(
+            url_for('static', filename=f'{prefix}/{jpegs[str(fallback)]}'), srcset('jpeg'), spec['sizes'])
+        return Markup('<picture>') + sources + img + attrs + Markup('></picture>')
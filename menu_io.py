@@ -0,0 +1,268 @@
+"""Bulk import and export of the menu (FoodItem and Restaurant rows).
+
+Imports read CSV or JSON (an array or JSON Lines) as a stream, validate each
+row and upsert in batches: one lookup and at most one bulk INSERT and one
+bulk UPDATE per batch, committed together, so a 10k-row menu is a handful of
+transactions and never touches orders, bookings or users. A row replaces an
+existing one with the same ``id``, or else the same natural key (tag + name
+for items, name for restaurants). Exports stream rows straight from a
+server-side cursor in the same formats.
+"""
+import csv
+import io
+import json
+import math
+
+import click
+from sqlalchemy import insert, or_, select, tuple_, update
+
+# Column -> (type, required, max length); 'id' is optional everywhere.
+SCHEMAS = {
+    'items': {
+        'name': (str, True, 100),
+        'tag': (str, True, 50),
+        'sub_tag': (str, False, 50),
+        'price': (float, True, None),
+        'image_file': (str, True, 100),
+        'description': (str, False, 255),
+    },
+    'restaurants': {
+        'name': (str, True, 100),
+        'description': (str, False, 500),
+        'image_file': (str, True, 100),
+        'location': (str, False, 100),
+        'capacity': (int, False, None),
+    },
+}
+NATURAL_KEYS = {'items': ('tag', 'name'), 'restaurants': ('name',)}
+FORMATS = ('csv', 'json')
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.errors = []  # (row number, message), first MAX_REPORTED_ERRORS only
+        self.invalid = 0
+
+    def error(self, row, message):
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((row, message))
+
+    def __str__(self):
+        return (f'{self.rows} row(s): {self.inserted} added, {self.updated} updated, '
+                f'{self.invalid} rejected')
+
+
+# --- Reading ---
+
+def _text(stream):
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+
+def read_csv(stream):
+    """Yield (row number, dict) from a CSV file with a header row."""
+    for number, row in enumerate(csv.DictReader(_text(stream)), start=1):
+        yield number, row
+
+
+def read_json(stream, chunk_size=64 * 1024):
+    """Yield (row number, dict) from a JSON array or JSON Lines, without loading the whole file."""
+    text = _text(stream)
+    decoder = json.JSONDecoder()
+    buf, pos, number, eof = '', 0, 0, False
+    while True:
+        # Skip whitespace and the array punctuation between objects.
+        while pos < len(buf) and buf[pos] in ' \t\r\n,[]':
+            pos += 1
+        if pos == len(buf):
+            if eof:
+                return
+            buf, pos = text.read(chunk_size), 0
+            eof = not buf
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            chunk = '' if eof else text.read(chunk_size)
+            if not chunk:
+                raise ValueError(f'Invalid JSON after row {number}')
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        number += 1
+        pos = end
+        yield number, value
+
+
+def read_rows(stream, fmt):
+    if fmt not in FORMATS:
+        raise ValueError(f'Unsupported format {fmt!r}; expected one of {", ".join(FORMATS)}')
+    return read_csv(stream) if fmt == 'csv' else read_json(stream)
+
+
+def format_from_filename(filename):
+    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    return {'jsonl': 'json', 'ndjson': 'json'}.get(ext, ext)
+
+
+def clean_row(kind, raw):
+    """Return the validated column values of ``raw``, or raise ValueError."""
+    if not isinstance(raw, dict):
+        raise ValueError('expected an object')
+    row = {}
+    raw_id = raw.get('id')
+    if raw_id not in (None, ''):
+        try:
+            row['id'] = int(raw_id)
+        except (TypeError, ValueError):
+            raise ValueError(f'id {raw_id!r} is not a number')
+    for column, (column_type, required, max_length) in SCHEMAS[kind].items():
+        value = raw.get(column)
+        if isinstance(value, str):
+            value = value.strip()
+        if value in (None, ''):
+            if required:
+                raise ValueError(f'{column} is required')
+            if column in raw:
+                row[column] = None
+            continue
+        if column_type is str:
+            value = str(value)
+            if len(value) > max_length:
+                raise ValueError(f'{column} is longer than {max_length} characters')
+        else:
+            try:
+                value = column_type(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'{column} {value!r} is not a number')
+            if not math.isfinite(value):  # NaN passes every comparison below and is stored as NULL
+                raise ValueError(f'{column} {value!r} is not a finite number')
+            if value < 0 or (column == 'capacity' and value < 1):
+                raise ValueError(f'{column} must be positive')
+        row[column] = value
+    return row
+
+
+# --- Writing ---
+
+def _csv_line(values):
+    out = io.StringIO()
+    csv.writer(out).writerow(values)
+    return out.getvalue()
+
+
+class MenuTransfer:
+    def __init__(self, db, food_item_model, restaurant_model, batch_size=1000):
+        self.db = db
+        self.models = {'items': food_item_model, 'restaurants': restaurant_model}
+        self.batch_size = batch_size
+
+    # --- Import ---
+
+    def import_rows(self, kind, rows, progress=None):
+        """Validate and upsert ``rows`` ((row number, dict) pairs) in batches; returns an ImportReport."""
+        if kind not in self.models:
+            raise ValueError(f'Unknown kind {kind!r}; expected one of {", ".join(self.models)}')
+        report = ImportReport()
+        batch = []
+        for number, raw in rows:
+            report.rows += 1
+            try:
+                batch.append(clean_row(kind, raw))
+            except ValueError as e:
+                report.error(number, str(e))
+            if len(batch) >= self.batch_size:
+                self._upsert(kind, batch, report)
+                batch = []
+                if progress:
+                    progress(report)
+        if batch:
+            self._upsert(kind, batch, report)
+        if progress:
+            progress(report)
+        return report
+
+    def _upsert(self, kind, batch, report):
+        model = self.models[kind]
+        key_columns = NATURAL_KEYS[kind]
+        ids = [row['id'] for row in batch if 'id' in row]
+        keys = [tuple(row[c] for c in key_columns) for row in batch]
+        key_expr = tuple_(*(getattr(model, c) for c in key_columns))
+        existing_ids, existing_keys = set(), {}
+        query = select(model.id, *(getattr(model, c) for c in key_columns)).where(
+            or_(model.id.in_(ids), key_expr.in_(keys)))
+        for found in self.db.session.execute(query):
+            existing_ids.add(found[0])
+            existing_keys.setdefault(tuple(found[1:]), found[0])
+
+        # Later rows for the same target win, as if they had been applied one by one.
+        inserts, updates = {}, {}
+        for row, key in zip(batch, keys):
+            target = row['id'] if row.get('id') in existing_ids else existing_keys.get(key)
+            if target is None:
+                slot = row.get('id') or key
+                inserts[slot] = {**inserts.get(slot, {}), **row}
+            else:
+                updates[target] = {**updates.get(target, {}), **row, 'id': target}
+        try:
+            if inserts:
+                self.db.session.execute(insert(model), list(inserts.values()))
+            if updates:
+                self.db.session.execute(update(model), list(updates.values()))
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+        report.inserted += len(inserts)
+        report.updated += len(updates)
+
+    # --- Export ---
+
+    def export(self, kind, fmt):
+        """Yield the ``kind`` table as CSV or JSON text chunks, reading rows in batches."""
+        model = self.models[kind]
+        columns = ('id',) + tuple(SCHEMAS[kind])
+        query = select(*(getattr(model, c) for c in columns)).order_by(model.id)
+        result = self.db.session.execute(query.execution_options(yield_per=self.batch_size))
+        if fmt == 'csv':
+            yield _csv_line(columns)
+            for partition in result.partitions():
+                yield ''.join(_csv_line(row) for row in partition)
+        else:
+            yield '['
+            first = True
+            for partition in result.partitions():
+                chunk = ',\n'.join(json.dumps(dict(zip(columns, row))) for row in partition)
+                yield ('\n' if first else ',\n') + chunk
+                first = False
+            yield '\n]\n'
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        @app.cli.command('import-menu')
+        @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+        @click.option('--kind', type=click.Choice(list(self.models)), default='items', show_default=True)
+        @click.option('--format', 'fmt', type=click.Choice(FORMATS), help='Defaults to the file extension.')
+        def import_menu_command(path, kind, fmt):
+            """Add or update menu items or restaurants from a CSV or JSON file."""
+            with open(path, 'rb') as fh:
+                rows = read_rows(fh, fmt or format_from_filename(path))
+                report = self.import_rows(kind, rows, progress=lambda r: click.echo(f'  {r}'))
+            for number, message in report.errors:
+                click.echo(f'row {number}: {message}', err=True)
+            click.echo(f'Imported {report}.')
+
+        @app.cli.command('export-menu')
+        @click.argument('kind', type=click.Choice(list(self.models)))
+        @click.option('--format', 'fmt', type=click.Choice(FORMATS), default='csv', show_default=True)
+        @click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-')
+        def export_menu_command(kind, fmt, output):
+            """Write every menu item or restaurant as CSV or JSON."""
+            for chunk in self.export(kind, fmt):
+                output.write(chunk)
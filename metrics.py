@@ -0,0 +1,166 @@
+"""Lightweight request instrumentation and a Prometheus ``/metrics`` endpoint.
+
+Per request it records latency by route, the number and total time of SQL
+statements (SQLAlchemy cursor events) and the time spent rendering each
+template (Flask's template signals). Registered caches expose their hit and
+miss counters at scrape time. Requests slower than ``SLOW_REQUEST_MS`` are
+logged with their query count, and every response carries a
+``Server-Timing`` header so the numbers show up in the browser's devtools.
+
+Metrics are kept per process; with several gunicorn workers each scrape
+sees the worker that answered it, so scrape each worker (or aggregate
+with a ``worker`` label on the Prometheus side).
+"""
+import bisect
+import threading
+import time
+
+from flask import Response, abort, before_render_template, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=''):
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [count per bucket..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        for labels, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), values):
+                cumulative += count
+                le = 'le="+Inf"' if bound == '+Inf' else f'le="{bound}"'
+                lines.append(f'{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.label_names, labels)} {values[-1]}')
+            lines.append(f'{self.name}_count{_labels(self.label_names, labels)} {cumulative}')
+        return lines
+
+
+class Metrics:
+    def __init__(self, app=None, db=None):
+        self.request_latency = Histogram(
+            'http_request_duration_seconds', 'Request latency by route.', ('endpoint', 'method', 'status'))
+        self.request_queries = Histogram(
+            'http_request_sql_queries', 'SQL statements issued per request.', ('endpoint',), QUERY_BUCKETS)
+        self.request_sql_time = Histogram(
+            'http_request_sql_seconds', 'Time spent in SQL per request.', ('endpoint',))
+        self.template_time = Histogram(
+            'template_render_seconds', 'Template render time (includes nested fragments).', ('template',))
+        self.caches = {}
+        if app is not None:
+            self.init_app(app, db)
+
+    def register_cache(self, name, cache):
+        """Expose ``cache.hits`` / ``cache.misses`` as cache_{hits,misses}_total{cache=name}."""
+        self.caches[name] = cache
+
+    def init_app(self, app, db):
+        app.config.setdefault('SLOW_REQUEST_MS', 500)
+        app.config.setdefault('METRICS_TOKEN', None)
+        self.app = app
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        before_render_template.connect(self._start_template, app)
+        template_rendered.connect(self._finish_template, app)
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', self._start_query)
+        event.listen(engine, 'after_cursor_execute', self._finish_query)
+        app.add_url_rule('/metrics', 'metrics', self.metrics_view)
+
+    # --- Hooks ---
+
+    def _start_request(self):
+        g.metrics_start = time.perf_counter()
+        g.sql_queries = 0
+        g.sql_seconds = 0.0
+
+    def _finish_request(self, response):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return response
+        elapsed = time.perf_counter() - start
+        endpoint = request.endpoint or 'unmatched'
+        if endpoint == 'metrics':
+            return response
+        queries, sql_seconds = g.get('sql_queries', 0), g.get('sql_seconds', 0.0)
+        self.request_latency.observe(elapsed, endpoint, request.method, str(response.status_code))
+        self.request_queries.observe(queries, endpoint)
+        self.request_sql_time.observe(sql_seconds, endpoint)
+        response.headers.add('Server-Timing', f'app;dur={elapsed * 1000:.1f}')
+        response.headers.add('Server-Timing', f'db;dur={sql_seconds * 1000:.1f};desc="{queries} queries"')
+        if elapsed * 1000 >= self.app.config['SLOW_REQUEST_MS']:
+            self.app.logger.warning('Slow request: %s %s (%s) took %.0f ms, %d SQL statements in %.0f ms',
+                                    request.method, request.full_path.rstrip('?'), endpoint,
+                                    elapsed * 1000, queries, sql_seconds * 1000)
+        return response
+
+    def _start_query(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+    def _finish_query(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('metrics_query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        if has_request_context() and 'sql_queries' in g:
+            g.sql_queries += 1
+            g.sql_seconds += elapsed
+
+    def _start_template(self, sender, template, context, **extra):
+        if has_request_context():
+            g.setdefault('template_starts', []).append(time.perf_counter())
+
+    def _finish_template(self, sender, template, context, **extra):
+        starts = g.get('template_starts') if has_request_context() else None
+        if starts:
+            self.template_time.observe(time.perf_counter() - starts.pop(), template.name or '<string>')
+
+    # --- Exposition ---
+
+    def render(self):
+        lines = []
+        for histogram in (self.request_latency, self.request_queries, self.request_sql_time, self.template_time):
+            lines.extend(histogram.render())
+        for kind in ('hits', 'misses'):
+            lines.append(f'# HELP cache_{kind}_total Cache {kind} since the worker started.')
+            lines.append(f'# TYPE cache_{kind}_total counter')
+            for name, cache in sorted(self.caches.items()):
+                lines.append(f'cache_{kind}_total{{cache="{_escape(name)}"}} {getattr(cache, kind)}')
+        return '\n'.join(lines) + '\n'
+
+    def metrics_view(self):
+        token = self.app.config['METRICS_TOKEN']
+        if token and request.headers.get('Authorization') != f'Bearer {token}':
+            abort(401)
+        return Response(self.render(), mimetype='text/plain; version=0.0.4')
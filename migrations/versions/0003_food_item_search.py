@@ -0,0 +1,57 @@
+"""food item full-text search index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+# External-content FTS5 table: it only stores the inverted index and reads
+# the text back from food_item. The triggers keep it in step with every
+# insert, update and delete on food_item, ORM or bulk.
+STATEMENTS = [
+    """CREATE VIRTUAL TABLE food_item_fts USING fts5(
+        name, description, tag, sub_tag,
+        content='food_item', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+    """CREATE TRIGGER food_item_fts_ai AFTER INSERT ON food_item BEGIN
+        INSERT INTO food_item_fts(rowid, name, description, tag, sub_tag)
+        VALUES (new.id, new.name, new.description, new.tag, new.sub_tag);
+    END""",
+    """CREATE TRIGGER food_item_fts_ad AFTER DELETE ON food_item BEGIN
+        INSERT INTO food_item_fts(food_item_fts, rowid, name, description, tag, sub_tag)
+        VALUES ('delete', old.id, old.name, old.description, old.tag, old.sub_tag);
+    END""",
+    """CREATE TRIGGER food_item_fts_au AFTER UPDATE ON food_item BEGIN
+        INSERT INTO food_item_fts(food_item_fts, rowid, name, description, tag, sub_tag)
+        VALUES ('delete', old.id, old.name, old.description, old.tag, old.sub_tag);
+        INSERT INTO food_item_fts(rowid, name, description, tag, sub_tag)
+        VALUES (new.id, new.name, new.description, new.tag, new.sub_tag);
+    END""",
+    "INSERT INTO food_item_fts(food_item_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade():
+    # FTS5 is SQLite-only; other databases use the LIKE fallback in search.py.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for statement in STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for trigger in ('food_item_fts_ai', 'food_item_fts_ad', 'food_item_fts_au'):
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.execute('DROP TABLE IF EXISTS food_item_fts')
@@ -0,0 +1,50 @@
+"""indexes for hot lookup columns
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Home page: tag + sub_tag; category page: tag (leftmost prefix)
+    with op.batch_alter_table('food_item', schema=None) as batch_op:
+        batch_op.create_index('ix_food_item_tag_sub_tag', ['tag', 'sub_tag'], unique=False)
+
+    # /my_orders: WHERE user_id = ? ORDER BY date_placed DESC, id DESC
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.create_index('ix_order_user_id_date_placed', ['user_id', 'date_placed', 'id'], unique=False)
+
+    with op.batch_alter_table('order_item', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_order_item_order_id'), ['order_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_order_item_food_item_id'), ['food_item_id'], unique=False)
+
+    # /my_bookings: WHERE user_id = ? ORDER BY id DESC; restaurant pages by restaurant_id
+    with op.batch_alter_table('booking', schema=None) as batch_op:
+        batch_op.create_index('ix_booking_user_id_id', ['user_id', 'id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_booking_restaurant_id'), ['restaurant_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('booking', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_booking_restaurant_id'))
+        batch_op.drop_index('ix_booking_user_id_id')
+
+    with op.batch_alter_table('order_item', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_order_item_food_item_id'))
+        batch_op.drop_index(batch_op.f('ix_order_item_order_id'))
+
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_user_id_date_placed')
+
+    with op.batch_alter_table('food_item', schema=None) as batch_op:
+        batch_op.drop_index('ix_food_item_tag_sub_tag')
@@ -0,0 +1,34 @@
+"""server-side cart storage
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cart_session',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('data', sa.Text(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('cart_session', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_cart_session_expires_at'), ['expires_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('cart_session', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_cart_session_expires_at'))
+
+    op.drop_table('cart_session')
@@ -0,0 +1,70 @@
+"""booking capacity and slot occupancy
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('restaurant', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('capacity', sa.Integer(), server_default='40', nullable=False))
+
+    sqlite = op.get_bind().dialect.name == 'sqlite'
+    if sqlite:
+        # The batch copy CASTs changed columns, which turns '2026-10-17' into 2026 under SQLite's
+        # NUMERIC affinity; keep the text aside and put it back once the table is rebuilt.
+        # <input type="time"> posted HH:MM, while SQLAlchemy stores SQLite TIME as HH:MM:SS.ffffff.
+        op.execute(sa.text(r"""
+            CREATE TEMPORARY TABLE booking_datetime_text AS
+            SELECT id, booking_date,
+                   CASE WHEN length(booking_time) = 5 THEN booking_time || '\:00.000000' ELSE booking_time END AS booking_time
+            FROM booking"""))
+    with op.batch_alter_table('booking', schema=None) as batch_op:
+        batch_op.alter_column('booking_date', existing_type=sa.String(length=50), type_=sa.Date(),
+                              existing_nullable=False, postgresql_using='booking_date::date')
+        batch_op.alter_column('booking_time', existing_type=sa.String(length=50), type_=sa.Time(),
+                              existing_nullable=False, postgresql_using='booking_time::time')
+    if sqlite:
+        op.execute("""
+            UPDATE booking SET
+                booking_date = (SELECT t.booking_date FROM booking_datetime_text t WHERE t.id = booking.id),
+                booking_time = (SELECT t.booking_time FROM booking_datetime_text t WHERE t.id = booking.id)""")
+        op.execute('DROP TABLE booking_datetime_text')
+
+    op.create_table('booking_slot',
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('slot_date', sa.Date(), nullable=False),
+    sa.Column('slot_time', sa.Time(), nullable=False),
+    sa.Column('seats_booked', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurant.id'], ),
+    sa.PrimaryKeyConstraint('restaurant_id', 'slot_date', 'slot_time')
+    )
+    # Seats already promised by existing bookings
+    op.execute("""
+        INSERT INTO booking_slot (restaurant_id, slot_date, slot_time, seats_booked)
+        SELECT restaurant_id, booking_date, booking_time, SUM(party_size)
+        FROM booking GROUP BY restaurant_id, booking_date, booking_time""")
+
+
+def downgrade():
+    op.drop_table('booking_slot')
+
+    with op.batch_alter_table('booking', schema=None) as batch_op:
+        batch_op.alter_column('booking_time', existing_type=sa.Time(), type_=sa.String(length=50),
+                              existing_nullable=False)
+        batch_op.alter_column('booking_date', existing_type=sa.Date(), type_=sa.String(length=50),
+                              existing_nullable=False)
+
+    with op.batch_alter_table('restaurant', schema=None) as batch_op:
+        batch_op.drop_column('capacity')
@@ -0,0 +1,28 @@
+"""indexes for the admin menu list
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # /admin and /admin/api/items: ORDER BY name|price, id with keyset cursors and price ranges
+    with op.batch_alter_table('food_item', schema=None) as batch_op:
+        batch_op.create_index('ix_food_item_name_id', ['name', 'id'], unique=False)
+        batch_op.create_index('ix_food_item_price_id', ['price', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('food_item', schema=None) as batch_op:
+        batch_op.drop_index('ix_food_item_price_id')
+        batch_op.drop_index('ix_food_item_name_id')
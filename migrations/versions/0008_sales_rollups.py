@@ -0,0 +1,64 @@
+"""sales rollup tables and booking counts per slot
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('orders', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('items_sold', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('item_sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('food_item_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'food_item_id')
+    )
+    with op.batch_alter_table('booking_slot', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('bookings', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the existing orders and bookings
+    day = 'date("order".date_placed)' if op.get_bind().dialect.name == 'sqlite' else 'CAST("order".date_placed AS DATE)'
+    op.execute(f"""
+        INSERT INTO item_sales_daily (day, food_item_id, quantity, revenue)
+        SELECT {day}, order_item.food_item_id, SUM(order_item.quantity), SUM(order_item.quantity * order_item.price_per_item)
+        FROM order_item JOIN "order" ON "order".id = order_item.order_id
+        GROUP BY {day}, order_item.food_item_id""")
+    op.execute(f"""
+        INSERT INTO sales_daily (day, orders, revenue, items_sold)
+        SELECT {day}, COUNT("order".id), SUM("order".total_price), 0
+        FROM "order" GROUP BY {day}""")
+    op.execute("""
+        UPDATE sales_daily SET items_sold = COALESCE(
+            (SELECT SUM(quantity) FROM item_sales_daily WHERE item_sales_daily.day = sales_daily.day), 0)""")
+    op.execute("""
+        UPDATE booking_slot SET bookings = (
+            SELECT COUNT(*) FROM booking
+            WHERE booking.restaurant_id = booking_slot.restaurant_id
+              AND booking.booking_date = booking_slot.slot_date
+              AND booking.booking_time = booking_slot.slot_time)""")
+
+
+def downgrade():
+    with op.batch_alter_table('booking_slot', schema=None) as batch_op:
+        batch_op.drop_column('bookings')
+
+    op.drop_table('item_sales_daily')
+    op.drop_table('sales_daily')
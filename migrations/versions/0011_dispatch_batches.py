@@ -0,0 +1,56 @@
+"""order status and dispatch batches
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('dispatch_batch',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('window_start', sa.DateTime(), nullable=False),
+    sa.Column('window_end', sa.DateTime(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('driver', sa.String(length=100), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('dispatch_batch', schema=None) as batch_op:
+        batch_op.create_index('ix_dispatch_batch_status_id', ['status', 'id'], unique=False)
+
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('status', sa.String(length=20), server_default='pending', nullable=False))
+        batch_op.add_column(sa.Column('dispatch_batch_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_order_dispatch_batch_id'), ['dispatch_batch_id'], unique=False)
+        batch_op.create_index('ix_order_status_city_date_placed', ['status', 'city', 'date_placed'], unique=False)
+        batch_op.create_foreign_key('fk_order_dispatch_batch_id', 'dispatch_batch', ['dispatch_batch_id'], ['id'])
+
+    # Orders placed before dispatch existed went out by hand; don't batch them now
+    op.execute("UPDATE \"order\" SET status = 'delivered'")
+
+
+def downgrade():
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_order_dispatch_batch_id', type_='foreignkey')
+        batch_op.drop_index('ix_order_status_city_date_placed')
+        batch_op.drop_index(batch_op.f('ix_order_dispatch_batch_id'))
+        batch_op.drop_column('dispatch_batch_id')
+        batch_op.drop_column('status')
+
+    with op.batch_alter_table('dispatch_batch', schema=None) as batch_op:
+        batch_op.drop_index('ix_dispatch_batch_status_id')
+
+    op.drop_table('dispatch_batch')
@@ -0,0 +1,39 @@
+"""order archive table
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('order_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('date_placed', sa.DateTime(), nullable=False),
+    sa.Column('total_price', sa.Float(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('order_archive', schema=None) as batch_op:
+        batch_op.create_index('ix_order_archive_user_id_date_placed', ['user_id', 'date_placed', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('order_archive', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_archive_user_id_date_placed')
+
+    op.drop_table('order_archive')
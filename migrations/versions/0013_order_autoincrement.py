@@ -0,0 +1,36 @@
+"""order ids never reused
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 19:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Without AUTOINCREMENT SQLite hands out max(id) + 1, which reuses the ids of archived orders.
+    # Other databases take ids from a sequence that never goes back.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    with op.batch_alter_table('order', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': True}):
+        pass
+    # Carry on above every id handed out so far, archived ones included
+    op.execute("DELETE FROM sqlite_sequence WHERE name = 'order'")
+    op.execute("INSERT INTO sqlite_sequence (name, seq) SELECT 'order', MAX("
+               "(SELECT COALESCE(MAX(id), 0) FROM \"order\"), (SELECT COALESCE(MAX(id), 0) FROM order_archive))")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    with op.batch_alter_table('order', schema=None, recreate='always'):
+        pass
@@ -0,0 +1,154 @@
+"""Database models; ``db`` is bound to the app by ``create_app``."""
+import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password = db.Column(db.String(255), nullable=False)  # werkzeug KDF hash
+    first_name = db.Column(db.String(100), nullable=True)
+    last_name = db.Column(db.String(100), nullable=True)
+    country = db.Column(db.String(100), nullable=True)
+    # NEW: Profile Picture Column
+    image_file = db.Column(db.String(20), nullable=False, default='default.jpg')
+    is_admin = db.Column(db.Boolean, default=False)
+    orders = db.relationship('Order', backref='customer', lazy=True)
+    bookings = db.relationship('Booking', backref='customer', lazy=True)
+    
+    def __repr__(self):
+        return f'<User {self.email}>'
+
+class FoodItem(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    tag = db.Column(db.String(50), nullable=False) 
+    sub_tag = db.Column(db.String(50), nullable=True) 
+    price = db.Column(db.Float, nullable=False)
+    image_file = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.String(255), nullable=True)
+    order_items = db.relationship('OrderItem', backref='food_item', lazy=True)
+    # Home and category pages filter on tag, or tag + sub_tag; the admin list pages by (name|price, id)
+    __table_args__ = (db.Index('ix_food_item_tag_sub_tag', 'tag', 'sub_tag'),
+                      db.Index('ix_food_item_name_id', 'name', 'id'),
+                      db.Index('ix_food_item_price_id', 'price', 'id'))
+
+class Order(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    date_placed = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    total_price = db.Column(db.Float, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    items = db.relationship('OrderItem', backref='order', lazy=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    address = db.Column(db.String(255), nullable=False)
+    city = db.Column(db.String(100), nullable=False)
+    # Sent with the checkout form so a double-submit maps back to the first order
+    idempotency_key = db.Column(db.String(64), nullable=True)
+    # pending -> batched -> out_for_delivery -> delivered (or cancelled); see dispatch.py
+    status = db.Column(db.String(20), nullable=False, default='pending', server_default='pending')
+    dispatch_batch_id = db.Column(db.Integer, db.ForeignKey('dispatch_batch.id'), nullable=True, index=True)
+    __table_args__ = (
+        db.Index('ix_order_user_idempotency_key', 'user_id', 'idempotency_key', unique=True),
+        # /my_orders keyset pagination
+        db.Index('ix_order_user_id_date_placed', 'user_id', 'date_placed', 'id'),
+        # The dispatcher's scan: pending orders of one city, oldest first
+        db.Index('ix_order_status_city_date_placed', 'status', 'city', 'date_placed'),
+        # Ids only go up, even after the newest orders are archived (see archive.py)
+        {'sqlite_autoincrement': True},
+    )
+
+class DispatchBatch(db.Model):
+    # Orders of one city handed to one driver together
+    id = db.Column(db.Integer, primary_key=True)
+    city = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='ready')  # ready | out_for_delivery | delivered
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    window_start = db.Column(db.DateTime, nullable=False)  # first and last order's date_placed
+    window_end = db.Column(db.DateTime, nullable=False)
+    order_count = db.Column(db.Integer, nullable=False)
+    driver = db.Column(db.String(100), nullable=True)
+    __table_args__ = (db.Index('ix_dispatch_batch_status_id', 'status', 'id'),)
+
+class OrderItem(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('order.id'), nullable=False, index=True)
+    food_item_id = db.Column(db.Integer, db.ForeignKey('food_item.id'), nullable=False, index=True)
+    quantity = db.Column(db.Integer, nullable=False)
+    price_per_item = db.Column(db.Float, nullable=False)
+
+class OrderArchive(db.Model):
+    # Orders moved out of order/order_item by `flask archive-orders` (see archive.py); the payload
+    # is the rest of the receipt (delivery details and lines) as zstd-compressed JSON
+    id = db.Column(db.Integer, primary_key=True)  # the order's own id
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    date_placed = db.Column(db.DateTime, nullable=False)
+    total_price = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    # /my_orders keeps paging here once the hot orders run out
+    __table_args__ = (db.Index('ix_order_archive_user_id_date_placed', 'user_id', 'date_placed', 'id'),)
+
+class Restaurant(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+    description = db.Column(db.String(500), nullable=True)
+    image_file = db.Column(db.String(100), nullable=False)
+    location = db.Column(db.String(100), nullable=True)
+    capacity = db.Column(db.Integer, nullable=False, default=40, server_default='40')  # seats per booking slot
+    bookings = db.relationship('Booking', backref='restaurant', lazy=True)
+
+class Booking(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurant.id'), nullable=False, index=True)
+    booking_date = db.Column(db.Date, nullable=False)
+    booking_time = db.Column(db.Time, nullable=False)
+    party_size = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(50), nullable=False, default='Confirmed')
+    # /my_bookings keyset pagination
+    __table_args__ = (db.Index('ix_booking_user_id_id', 'user_id', 'id'),)
+
+class BookingSlot(db.Model):
+    # Seats taken per restaurant and slot; the primary key doubles as the availability index
+    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurant.id'), primary_key=True)
+    slot_date = db.Column(db.Date, primary_key=True)
+    slot_time = db.Column(db.Time, primary_key=True)
+    seats_booked = db.Column(db.Integer, nullable=False, default=0)
+    bookings = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+# --- Analytics Rollups (maintained by place_order; see analytics.py) ---
+class SalesDaily(db.Model):
+    day = db.Column(db.Date, primary_key=True)
+    orders = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+    items_sold = db.Column(db.Integer, nullable=False, default=0)
+
+class ItemSalesDaily(db.Model):
+    day = db.Column(db.Date, primary_key=True)
+    food_item_id = db.Column(db.Integer, primary_key=True)  # no FK: sales history outlives deleted items
+    quantity = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+
+class CartSession(db.Model):
+    # Server-side cart contents; the session cookie only holds the id
+    id = db.Column(db.String(32), primary_key=True)
+    data = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+class OutboxMessage(db.Model):
+    # Background jobs, written in the same transaction as the order/booking they belong to (see outbox.py)
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.Text, nullable=False)  # JSON
+    status = db.Column(db.String(10), nullable=False, default='pending')  # pending | sent | dead
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    available_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.String(500), nullable=True)
+    # The worker's "what is due" scan
+    __table_args__ = (db.Index('ix_outbox_message_status_available_at', 'status', 'available_at'),)
@@ -0,0 +1,176 @@
+"""Durable background jobs through a transactional outbox.
+
+Request handlers call ``outbox.add(kind, **payload)`` before they commit, so
+the job row is written in the same transaction as the order or booking it
+is about: either both exist or neither does, and the request never waits on
+whatever the job talks to (SMTP, for now). ``flask outbox-worker`` runs in
+its own process and drains the table in batches:
+
+* a batch is claimed with a conditional UPDATE that pushes ``available_at``
+  one lease into the future, so two workers never run the same job and a
+  crashed worker's jobs come back once the lease runs out;
+* a failed job is retried with exponential backoff and jitter;
+* after ``max_attempts`` failures it is parked as ``dead`` with its last
+  error, until ``flask outbox-requeue`` puts it back.
+
+Delivery is at-least-once: a worker that dies after sending but before
+recording it will send that job again.
+"""
+import datetime
+import json
+import logging
+import random
+import socket
+import time
+
+import click
+from sqlalchemy import func, select, update
+
+log = logging.getLogger(__name__)
+
+PENDING, SENT, DEAD = 'pending', 'sent', 'dead'
+
+
+def _now():
+    return datetime.datetime.utcnow()
+
+
+class Outbox:
+    def __init__(self, db, message_model, batch_size=50, max_attempts=8, backoff=30, max_backoff=3600, lease=300):
+        self.db = db
+        self.model = message_model
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lease = lease
+        self.handlers = {}
+
+    def handler(self, kind):
+        """Register ``func(payload)`` as the job for ``kind``; raising marks the attempt failed."""
+        def register(func):
+            self.handlers[kind] = func
+            return func
+        return register
+
+    def add(self, kind, **payload):
+        """Queue a job in the current session; it is only visible to workers once the caller commits."""
+        if kind not in self.handlers:
+            raise ValueError(f'No outbox handler for {kind!r}')
+        now = _now()
+        message = self.model(kind=kind, payload=json.dumps(payload), status=PENDING, attempts=0,
+                             created_at=now, available_at=now)
+        self.db.session.add(message)
+        return message
+
+    # --- Worker ---
+
+    def retry_delay(self, attempts):
+        """Seconds before attempt ``attempts + 1``: doubling from ``backoff``, capped, with +-20% jitter."""
+        delay = min(self.backoff * 2 ** (attempts - 1), self.max_backoff)
+        return delay * random.uniform(0.8, 1.2)
+
+    def claim(self):
+        """Lease up to ``batch_size`` due jobs to this worker; returns (id, kind, payload, attempts) rows."""
+        Message, session = self.model, self.db.session
+        now = _now()
+        due = (select(Message.id).where(Message.status == PENDING, Message.available_at <= now)
+               .order_by(Message.available_at, Message.id).limit(self.batch_size))
+        if session.get_bind().dialect.name == 'postgresql':
+            due = due.with_for_update(skip_locked=True)
+        ids = session.scalars(due).all()
+        if not ids:
+            session.rollback()
+            return []
+        # Re-checking available_at makes this a no-op for rows another worker leased in between.
+        rows = session.execute(
+            update(Message).where(Message.id.in_(ids), Message.status == PENDING, Message.available_at <= now)
+            .values(available_at=now + datetime.timedelta(seconds=self.lease), attempts=Message.attempts + 1)
+            .returning(Message.id, Message.kind, Message.payload, Message.attempts)).all()
+        session.commit()
+        return sorted(rows)
+
+    def run_batch(self):
+        """Claim and run one batch; returns (sent, failed) counts."""
+        sent = failed = 0
+        results = []
+        for message_id, kind, payload, attempts in self.claim():
+            try:
+                self.handlers[kind](json.loads(payload))
+            except Exception as e:
+                failed += 1
+                error = f'{type(e).__name__}: {e}'[:500]
+                if attempts >= self.max_attempts:
+                    log.error('Outbox job %s (%s) failed %d times, moved to dead letters: %s',
+                              message_id, kind, attempts, error)
+                    results.append((message_id, {'status': DEAD, 'last_error': error}))
+                else:
+                    log.warning('Outbox job %s (%s) failed, attempt %d of %d: %s',
+                                message_id, kind, attempts, self.max_attempts, error)
+                    retry_at = _now() + datetime.timedelta(seconds=self.retry_delay(attempts))
+                    results.append((message_id, {'available_at': retry_at, 'last_error': error}))
+                self.db.session.rollback()
+            else:
+                sent += 1
+                results.append((message_id, {'status': SENT, 'sent_at': _now(), 'last_error': None}))
+        if results:
+            for message_id, values in results:
+                self.db.session.execute(update(self.model).where(self.model.id == message_id).values(**values))
+            self.db.session.commit()
+        return sent, failed
+
+    def work(self, interval=2.0, once=False):
+        """Run batches until interrupted (or until the queue is empty, with ``once``)."""
+        while True:
+            sent, failed = self.run_batch()
+            if sent or failed:
+                log.info('Outbox batch: %d sent, %d failed', sent, failed)
+                continue
+            if once:
+                return
+            self.db.session.remove()
+            time.sleep(interval)
+
+    def requeue_dead(self, kind=None):
+        """Give dead jobs a fresh set of attempts; returns how many were requeued."""
+        stmt = (update(self.model).where(self.model.status == DEAD)
+                .values(status=PENDING, attempts=0, available_at=_now()))
+        if kind:
+            stmt = stmt.where(self.model.kind == kind)
+        count = self.db.session.execute(stmt).rowcount
+        self.db.session.commit()
+        return count
+
+    def counts(self):
+        rows = self.db.session.execute(
+            select(self.model.kind, self.model.status, func.count()).group_by(self.model.kind, self.model.status))
+        return {(kind, status): count for kind, status, count in rows}
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        app.config.setdefault('OUTBOX_POLL_INTERVAL', 2.0)
+        app.config.setdefault('OUTBOX_SEND_TIMEOUT', 30)
+
+        @app.cli.command('outbox-worker')
+        @click.option('--once', is_flag=True, help='Exit when no job is due instead of polling.')
+        def outbox_worker_command(once):
+            """Run queued background jobs (confirmation emails) until stopped."""
+            # Flask-Mail opens its SMTP connections without a timeout; a stuck server must not stall the worker.
+            socket.setdefaulttimeout(app.config['OUTBOX_SEND_TIMEOUT'])
+            try:
+                self.work(interval=app.config['OUTBOX_POLL_INTERVAL'], once=once)
+            except KeyboardInterrupt:
+                pass
+
+        @app.cli.command('outbox-status')
+        def outbox_status_command():
+            """Show queued, sent and dead jobs per kind."""
+            for (kind, status), count in sorted(self.counts().items()):
+                click.echo(f'{kind:<24} {status:<8} {count}')
+
+        @app.cli.command('outbox-requeue')
+        @click.option('--kind', help='Only requeue dead jobs of this kind.')
+        def outbox_requeue_command(kind):
+            """Retry jobs that were moved to dead letters."""
+            click.echo(f'Requeued {self.requeue_dead(kind)} job(s).')
@@ -0,0 +1,78 @@
+"""Response and fragment cache for the menu pages.
+
+Anonymous visitors all get the same HTML for a menu URL, so ``cached``
+stores the whole response keyed by endpoint, arguments, query string and
+catalog version, and answers repeat visits with an ETag / ``304``. Logged-in
+visitors get a personalised header, so views render the menu part through
+``fragment`` instead and only the page shell around it is rendered per
+request. A catalog change bumps the version and so retires every entry.
+"""
+import functools
+import hashlib
+
+from flask import make_response, request, session
+from markupsafe import Markup
+
+from caching import TTLCache
+
+
+class PageCache:
+    def __init__(self, version, maxsize=512, ttl=300):
+        self.version = version
+        self.pages = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.fragments = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, view):
+        """Serve the view's response from memory for anonymous GET requests."""
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            return self.serve(view, *args, **kwargs)
+        return wrapper
+
+    def serve(self, view, *args, **kwargs):
+        """The response for this request: from memory when cacheable, else ``view(*args, **kwargs)``."""
+        if not self._cacheable():
+            return view(*args, **kwargs)
+        key = ('page', request.endpoint, tuple(sorted(request.view_args.items())),
+               request.query_string, self.version())
+        entry = self.pages.get(key)
+        if entry is None:
+            self.misses += 1
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or 'Set-Cookie' in response.headers:
+                return response
+            body = response.get_data()
+            entry = (body, response.content_type, hashlib.sha1(body).hexdigest()[:20])
+            self.pages.set(key, entry)
+        else:
+            self.hits += 1
+        body, content_type, etag = entry
+        response = make_response(body)
+        response.content_type = content_type
+        response.set_etag(etag)
+        response.cache_control.no_cache = True  # always revalidate; a 304 is nearly free
+        response.vary.add('Cookie')
+        return response.make_conditional(request)
+
+    def fragment(self, name, render, *key):
+        """Return the cached HTML for ``name``/``key``, calling ``render()`` on a miss."""
+        full_key = ('fragment', name, key, self.version())
+        html = self.fragments.get(full_key)
+        if html is None:
+            self.misses += 1
+            html = Markup(render())
+            self.fragments.set(full_key, html)
+        else:
+            self.hits += 1
+        return html
+
+    def clear(self):
+        self.pages.clear()
+        self.fragments.clear()
+
+    @staticmethod
+    def _cacheable():
+        # Pending flash messages are per-visitor, so those pages are rendered normally.
+        return request.method in ('GET', 'HEAD') and 'user' not in session and '_flashes' not in session
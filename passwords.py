@@ -0,0 +1,63 @@
+"""Password hashing with a bounded pool of hashing threads.
+
+Hashes use werkzeug's KDFs (scrypt or PBKDF2) with the work factor taken
+from ``PASSWORD_HASH_METHOD``. hashlib releases the GIL while it runs the
+KDF, so doing the work on a small dedicated pool caps how many CPU-heavy
+hashes a worker runs at once while its other request threads keep serving;
+when the queue is full the call fails fast with ``HasherBusy`` instead of
+piling up. Hashes made with an older method, and plaintext passwords from
+before hashing existed, are reported as needing an upgrade so ``login`` can
+re-hash them with the current settings.
+"""
+import hmac
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+KDF_PREFIXES = ('scrypt:', 'pbkdf2:')
+
+
+class HasherBusy(Exception):
+    """Too many hashes are already queued on this worker."""
+
+
+def hash_method(stored):
+    """The method part of a werkzeug hash (``scrypt:32768:8:1``), or None for a legacy plaintext value."""
+    if stored and stored.startswith(KDF_PREFIXES) and stored.count('$') == 2:
+        return stored.split('$', 1)[0]
+    return None
+
+
+class PasswordHasher:
+    def __init__(self, method='scrypt:32768:8:1', workers=2, max_pending=16):
+        self.method = method
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='passwords')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._dummy = None
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored, password):
+        """Return (matches, needs_rehash); ``stored`` None checks against a dummy hash."""
+        if stored is None:
+            # Verifying against a real hash keeps "no such user" as slow as "wrong password". It is made on
+            # first use rather than at startup, where it would add a full KDF run to every worker's boot.
+            if self._dummy is None:
+                self._dummy = self._run(generate_password_hash, 'dummy password', self.method)
+            self._run(check_password_hash, self._dummy, password)
+            return False, False
+        method = hash_method(stored)
+        if method is None:
+            return hmac.compare_digest(stored.encode(), password.encode()), True
+        ok = self._run(check_password_hash, stored, password)
+        return ok, ok and method != self.method
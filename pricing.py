@@ -0,0 +1,87 @@
+"""Cart pricing: reprice a session cart against the current menu.
+
+The cart in the store remembers the price each item had when it was added,
+which can go stale when an admin edits or deletes the item. ``CartPricer``
+reprices every line from the catalog cache (no queries once it is warm) or,
+for the order itself, from one ``IN (...)`` lookup, and flags lines whose
+item is gone or whose price has moved since the cart was filled.
+"""
+from collections import namedtuple
+
+from caching import snapshot
+
+# Error flags on a line
+UNAVAILABLE = 'unavailable'
+PRICE_CHANGED = 'price_changed'
+BAD_QUANTITY = 'bad_quantity'
+
+QuoteLine = namedtuple('QuoteLine', 'item_id name image_file quantity unit_price line_total cart_price error')
+
+
+class Quote(namedtuple('Quote', 'lines subtotal delivery_fee total')):
+    @property
+    def errors(self):
+        return [line for line in self.lines if line.error]
+
+    @property
+    def orderable(self):
+        """Lines that can go into an order as they are."""
+        return [line for line in self.lines if line.error is None]
+
+    def synced_cart(self):
+        """The cart with unavailable lines dropped and stored prices brought up to date."""
+        return {str(line.item_id): {'name': line.name, 'price': line.unit_price,
+                                    'quantity': line.quantity, 'image_file': line.image_file}
+                for line in self.lines if line.error not in (UNAVAILABLE, BAD_QUANTITY)}
+
+
+def _money(value):
+    return round(value, 2)
+
+
+class CartPricer:
+    def __init__(self, db, food_item_model, catalog, delivery_fee):
+        self.db = db
+        self.food_item_model = food_item_model
+        self.catalog = catalog
+        self.delivery_fee = delivery_fee
+
+    def quote(self, cart, fresh=False):
+        """Price ``cart``; ``fresh`` reads prices from the database rather than the catalog cache."""
+        ids = [int(item_id) for item_id in cart if item_id.isdigit()]
+        items = self._load_fresh(ids) if fresh else self._load_cached(ids)
+
+        lines = []
+        subtotal = 0.0
+        for item_id, entry in cart.items():
+            item = items.get(int(item_id)) if item_id.isdigit() else None
+            quantity = entry.get('quantity')
+            cart_price = entry.get('price')
+            if item is None:
+                lines.append(QuoteLine(item_id, entry.get('name'), entry.get('image_file'), quantity,
+                                       cart_price, 0.0, cart_price, UNAVAILABLE))
+                continue
+            if not isinstance(quantity, int) or quantity < 1:
+                error = BAD_QUANTITY
+                line_total = 0.0
+            else:
+                error = PRICE_CHANGED if cart_price is not None and _money(cart_price) != _money(item.price) else None
+                line_total = _money(item.price * quantity)
+            lines.append(QuoteLine(item.id, item.name, item.image_file, quantity,
+                                   item.price, line_total, cart_price, error))
+            subtotal += line_total
+
+        subtotal = _money(subtotal)
+        delivery_fee = self.delivery_fee if any(line.line_total for line in lines) else 0.0
+        return Quote(tuple(lines), subtotal, delivery_fee, _money(subtotal + delivery_fee))
+
+    def _load_cached(self, ids):
+        snap = self.catalog.snapshot()
+        return {item_id: snap.items[item_id] for item_id in ids if item_id in snap.items}
+
+    def _load_fresh(self, ids):
+        if not ids:
+            return {}
+        FoodItem = self.food_item_model
+        rows = FoodItem.query.filter(FoodItem.id.in_(ids))
+        return {row.id: snapshot(row) for row in rows}
@@ -0,0 +1,45 @@
+"""In-memory token-bucket rate limiting.
+
+Each key (an IP address, an email, ...) gets a bucket of ``capacity`` tokens
+that refills at ``capacity / period`` tokens per second; a request spends one
+token and is refused when the bucket is empty. Buckets live in a bounded LRU
+map, so a flood of distinct keys costs a fixed amount of memory. Limits are
+per worker process.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucketLimiter:
+    def __init__(self, capacity, period, maxsize=100_000):
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()  # key -> (tokens, last refill time)
+        self._lock = threading.Lock()
+
+    def allow(self, key, cost=1.0):
+        """Spend ``cost`` tokens from ``key``'s bucket; False when there are not enough."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+            return allowed
+
+    def retry_after(self, key, cost=1.0):
+        """Seconds until ``key`` could spend ``cost`` tokens again."""
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.capacity, time.monotonic()))
+        tokens = min(self.capacity, tokens + (time.monotonic() - last) * self.rate)
+        return max(0.0, (cost - tokens) / self.rate)
+
+    def reset(self, key):
+        with self._lock:
+            self._buckets.pop(key, None)
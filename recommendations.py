@@ -0,0 +1,269 @@
+""""Frequently ordered together" suggestions from an OrderItem co-occurrence matrix.
+
+``flask refresh-recommendations`` (run it from cron) reads only the order
+lines added since its last run, turns each order into item pairs with NumPy
+and merges their counts into a sparse co-occurrence matrix kept as sorted
+``(item << 32 | other)`` keys plus counts. It then ranks every item's
+neighbours by cosine similarity, ``together / sqrt(orders(a) * orders(b))``,
+so best-sellers don't crowd out real pairings, and writes the top ``k`` as
+one ``int32`` table, ``topk.npy``, row = item id, ``-1`` padded.
+
+Web workers memory-map that table (the OS shares its pages between
+processes), so a lookup is a row slice plus a catalog check, well under a
+millisecond, and never touches ``order_item``. They pick up a new table when
+the file changes, checked at most every ``reload_interval`` seconds. Serving
+reads the ``.npy`` file with ``mmap`` alone; NumPy is only imported to build
+the table, so web workers don't carry it.
+
+Files in ``RECOMMENDATIONS_DIR``: ``cooccurrence.npz`` is the refresh
+state (pairs, counts, per-item order counts and the last order id read) and
+is written before ``topk.npy``, so an interrupted refresh is redone, never
+double-counted. ``flask archive-orders`` only archives orders up to the
+watermark, so the incremental refresh never misses any; ``--full`` rebuilds
+from the orders still in ``order_item``.
+"""
+import ast
+import itertools
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import uuid
+
+import click
+from sqlalchemy import func, select
+
+STATE_FILE = 'cooccurrence.npz'
+TOPK_FILE = 'topk.npy'
+
+
+def _empty_state():
+    import numpy as np
+    return {
+        'keys': np.empty(0, dtype=np.int64),
+        'counts': np.empty(0, dtype=np.int64),
+        'item_orders': np.empty(0, dtype=np.int64),
+        'watermark': 0,
+    }
+
+
+class _Table:
+    """A memory-mapped ``topk.npy``: ``table[item_id]`` is that item's row of neighbour ids."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:6] != b'\x93NUMPY':
+            raise ValueError(f'{path} is not an .npy file')
+        if self._map[6] == 1:
+            (header_length,), start = struct.unpack('<H', self._map[8:10]), 10
+        else:
+            (header_length,), start = struct.unpack('<I', self._map[8:12]), 12
+        header = ast.literal_eval(self._map[start:start + header_length].decode('latin1'))
+        if header['descr'] != '<i4' or header['fortran_order'] or len(header['shape']) != 2 or sys.byteorder != 'little':
+            raise ValueError(f'{path} is not a little-endian int32 table')
+        self.rows, self.k = header['shape']
+        self._data = memoryview(self._map)[start + header_length:].cast('i')
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, item_id):
+        return self._data[item_id * self.k:(item_id + 1) * self.k]
+
+
+def order_pairs(order_ids, item_ids, max_items=50):
+    """All ordered (item, other) pairs bought together, as int64 keys; input sorted by order id.
+
+    Orders with more than ``max_items`` distinct items (catering, bulk buys) are skipped; they say
+    little about what goes together and cost quadratically many pairs.
+    """
+    import numpy as np
+    if not len(order_ids):
+        return np.empty(0, dtype=np.int64)
+    starts = np.flatnonzero(np.r_[True, order_ids[1:] != order_ids[:-1]])
+    sizes = np.diff(np.r_[starts, len(order_ids)])
+    small = sizes <= max_items
+    item_ids = item_ids[np.repeat(small, sizes)]
+    sizes = sizes[small]
+    starts = np.cumsum(sizes) - sizes
+    # Every row pairs with every row of its own order: row i repeated size(i) times against its group.
+    row_size = np.repeat(sizes, sizes)
+    row_start = np.repeat(starts, sizes)
+    left = np.repeat(np.arange(len(item_ids)), row_size)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(row_size) - row_size, row_size)
+    right = np.repeat(row_start, row_size) + offsets
+    left, right = item_ids[left], item_ids[right]
+    distinct = left != right
+    return (left[distinct].astype(np.int64) << 32) | right[distinct].astype(np.int64)
+
+
+def top_k(keys, counts, item_orders, k, min_support=1):
+    """Top ``k`` neighbours per item by cosine score, as an int32 (max item id + 1, k) table."""
+    import numpy as np
+    table = np.full((len(item_orders), k), -1, dtype=np.int32)
+    supported = counts >= min_support
+    keys, counts = keys[supported], counts[supported]
+    if not len(keys):
+        return table
+    left = (keys >> 32).astype(np.int64)
+    right = (keys & 0xFFFFFFFF).astype(np.int64)
+    scores = counts / np.sqrt(item_orders[left] * item_orders[right])
+    # Sort by item, best score first (ties: the more popular pairing, then the lower id).
+    order = np.lexsort((right, -counts, -scores, left))
+    left, right = left[order], right[order]
+    starts = np.flatnonzero(np.r_[True, left[1:] != left[:-1]])
+    rank = np.arange(len(left)) - np.repeat(starts, np.diff(np.r_[starts, len(left)]))
+    keep = rank < k
+    table[left[keep], rank[keep]] = right[keep]
+    return table
+
+
+class Recommender:
+    def __init__(self, db, order_item_model, catalog, directory, k=12, min_support=2, reload_interval=30):
+        self.db = db
+        self.order_item_model = order_item_model
+        self.catalog = catalog
+        self.directory = directory
+        self.k = k
+        self.min_support = min_support
+        self.reload_interval = reload_interval
+        self._table = None
+        self._stamp = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # --- Serving ---
+
+    @property
+    def version(self):
+        """Changes whenever a new table is loaded; part of the page cache key."""
+        self._current()
+        return self._stamp
+
+    def _current(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return self._table
+        with self._lock:
+            if now - self._checked_at < self.reload_interval:
+                return self._table
+            path = os.path.join(self.directory, TOPK_FILE)
+            try:
+                stat = os.stat(path)
+                stamp = (stat.st_ino, stat.st_mtime_ns)
+                if stamp != self._stamp:
+                    self._table = _Table(path)
+                    self._stamp = stamp
+            except (OSError, ValueError):
+                self._table, self._stamp = None, None  # not built yet
+            self._checked_at = now
+            return self._table
+
+    def _neighbours(self, item_id):
+        table = self._current()
+        if table is None or not 0 <= item_id < len(table):
+            return ()
+        return table[item_id]
+
+    def _items(self, ids, limit, exclude=()):
+        items = []
+        for item_id in ids:
+            item = self.catalog.item(int(item_id)) if item_id not in exclude else None
+            if item and item.tag != 'Category':  # skip neighbours since deleted or turned into tiles
+                items.append(item)
+                if len(items) == limit:
+                    break
+        return items
+
+    def for_item(self, item_id, limit=4):
+        """Items most often ordered with ``item_id``, as catalog rows."""
+        return self._items((i for i in self._neighbours(item_id) if i >= 0), limit)
+
+    def for_cart(self, item_ids, limit=4):
+        """Items that go with the cart as a whole: neighbour lists merged by rank, cart items left out."""
+        votes = {}
+        for item_id in item_ids:
+            for rank, other in enumerate(self._neighbours(item_id)):
+                if other < 0:
+                    break
+                votes[int(other)] = votes.get(int(other), 0) + self.k - rank
+        ranked = sorted(votes, key=lambda other: (-votes[other], other))
+        return self._items(ranked, limit, exclude=set(item_ids))
+
+    # --- Building ---
+
+    def _load_state(self):
+        import numpy as np
+        try:
+            with np.load(os.path.join(self.directory, STATE_FILE)) as saved:
+                return {name: saved[name] for name in ('keys', 'counts', 'item_orders')} | {
+                    'watermark': int(saved['watermark'])}
+        except FileNotFoundError:
+            return _empty_state()
+
+    def watermark(self):
+        """The newest order id folded into the matrix so far (0 before the first refresh)."""
+        import numpy as np
+        try:
+            with np.load(os.path.join(self.directory, STATE_FILE)) as saved:
+                return int(saved['watermark'])
+        except FileNotFoundError:
+            return 0
+
+    def _save(self, name, write):
+        path = os.path.join(self.directory, name)
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp, 'wb') as fh:
+            write(fh)
+        os.replace(tmp, path)
+
+    def refresh(self, full=False, batch_orders=20_000):
+        """Fold order lines newer than the last refresh into the matrix and rewrite the top-k table."""
+        import numpy as np
+        OrderItem = self.order_item_model
+        state = _empty_state() if full else self._load_state()
+        keys, counts, item_orders = state['keys'], state['counts'], state['item_orders']
+        watermark = start = state['watermark']
+        newest = self.db.session.scalar(select(func.max(OrderItem.order_id))) or 0
+        while watermark < newest:
+            upper = min(watermark + batch_orders, newest)
+            rows = self.db.session.execute(
+                select(OrderItem.order_id, OrderItem.food_item_id)
+                .where(OrderItem.order_id > watermark, OrderItem.order_id <= upper)).all()
+            watermark = upper
+            if not rows:
+                continue
+            flat = np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64, count=2 * len(rows))
+            lines = np.unique((flat[0::2] << 32) | flat[1::2])  # sorted, one entry per (order, item)
+            order_ids, item_ids = lines >> 32, lines & 0xFFFFFFFF
+            new_keys, new_counts = np.unique(order_pairs(order_ids, item_ids), return_counts=True)
+            keys, inverse = np.unique(np.r_[keys, new_keys], return_inverse=True)
+            counts = np.bincount(inverse, weights=np.r_[counts, new_counts], minlength=len(keys)).astype(np.int64)
+            per_item = np.bincount(item_ids)
+            if len(per_item) > len(item_orders):
+                item_orders = np.r_[item_orders, np.zeros(len(per_item) - len(item_orders), dtype=np.int64)]
+            item_orders[:len(per_item)] += per_item
+        if watermark == start and not full and os.path.exists(os.path.join(self.directory, TOPK_FILE)):
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._save(STATE_FILE, lambda fh: np.savez(fh, keys=keys, counts=counts, item_orders=item_orders,
+                                                   watermark=np.int64(watermark)))
+        table = top_k(keys, counts, item_orders, self.k, self.min_support)
+        self._save(TOPK_FILE, lambda fh: np.save(fh, table))
+        self._checked_at = 0.0  # this process sees the new table straight away
+        return watermark - start
+
+    # --- CLI ---
+
+    def init_app(self, app):
+        @app.cli.command('refresh-recommendations')
+        @click.option('--full', is_flag=True, help='Rebuild from every order instead of only the new ones.')
+        def refresh_recommendations_command(full):
+            """Update the "frequently ordered together" table from new orders."""
+            started = time.perf_counter()
+            advanced = self.refresh(full=full)
+            click.echo(f'Recommendations refreshed in {time.perf_counter() - started:.2f}s '
+                       f'(order ids advanced by {advanced}).')
@@ -0,0 +1,133 @@
+"""Table reservations with a per-slot capacity check.
+
+Bookings are made for fixed slots (every ``slot_minutes`` between the first
+and last slot of the day). ``booking_slot`` keeps one row per restaurant and
+slot with the number of seats already taken, so checking and taking seats is
+a single conditional UPDATE that can never push a slot past the restaurant's
+capacity, however many requests race for the last table. The same table
+answers "free seats for the next N days" with one range query on its primary
+key.
+"""
+import datetime
+from collections import namedtuple
+
+from sqlalchemy import insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+
+FreeSlot = namedtuple('FreeSlot', 'date time free')
+Day = namedtuple('Day', 'date slots')
+
+
+class BookingError(Exception):
+    """A booking request that cannot be honoured; the message is shown to the user."""
+
+
+def parse_slot(value):
+    """Parse ``2026-10-17T19:30`` into a (date, time) pair, or return None."""
+    try:
+        moment = datetime.datetime.strptime(value or '', '%Y-%m-%dT%H:%M')
+    except ValueError:
+        return None
+    return moment.date(), moment.time()
+
+
+class ReservationBook:
+    def __init__(self, db, restaurant_model, booking_model, slot_model,
+                 first_slot, last_slot, slot_minutes=30, window_days=7, on_booked=None):
+        self.db = db
+        self.on_booked = on_booked
+        self.restaurant_model = restaurant_model
+        self.booking_model = booking_model
+        self.slot_model = slot_model
+        self.slot_minutes = slot_minutes
+        self.window_days = window_days
+        self.times = self._slot_times(first_slot, last_slot, slot_minutes)
+
+    @staticmethod
+    def _slot_times(first, last, minutes):
+        start = datetime.datetime.combine(datetime.date.min, first)
+        end = datetime.datetime.combine(datetime.date.min, last)
+        times = []
+        while start <= end:
+            times.append(start.time())
+            start += datetime.timedelta(minutes=minutes)
+        return tuple(times)
+
+    # --- Availability ---
+
+    def availability(self, restaurant, days=None, now=None):
+        """Free seats per upcoming slot for the next ``days`` days, from one query."""
+        now = now or datetime.datetime.now()
+        days = days or self.window_days
+        first_day = now.date()
+        last_day = first_day + datetime.timedelta(days=days - 1)
+        BookingSlot = self.slot_model
+        rows = self.db.session.execute(
+            select(BookingSlot.slot_date, BookingSlot.slot_time, BookingSlot.seats_booked)
+            .where(BookingSlot.restaurant_id == restaurant.id, BookingSlot.slot_date.between(first_day, last_day)))
+        booked = {(row.slot_date, row.slot_time): row.seats_booked for row in rows}
+
+        calendar = []
+        for offset in range(days):
+            day = first_day + datetime.timedelta(days=offset)
+            slots = [FreeSlot(day, time, max(restaurant.capacity - booked.get((day, time), 0), 0))
+                     for time in self.times if datetime.datetime.combine(day, time) > now]
+            if slots:
+                calendar.append(Day(day, slots))
+        return calendar
+
+    # --- Booking ---
+
+    def validate(self, restaurant, slot_date, slot_time, party_size, now=None):
+        now = now or datetime.datetime.now()
+        if slot_time not in self.times:
+            raise BookingError('Please pick one of the listed booking times.')
+        moment = datetime.datetime.combine(slot_date, slot_time)
+        if moment <= now:
+            raise BookingError('That time has already passed.')
+        if slot_date >= now.date() + datetime.timedelta(days=self.window_days):
+            raise BookingError(f'Bookings open {self.window_days} days ahead.')
+        if party_size < 1 or party_size > restaurant.capacity:
+            raise BookingError(f'Party size must be between 1 and {restaurant.capacity}.')
+
+    def book(self, user_id, restaurant, slot_date, slot_time, party_size):
+        """Take ``party_size`` seats in the slot and record the booking, or raise BookingError."""
+        self.validate(restaurant, slot_date, slot_time, party_size)
+        for attempt in range(2):
+            try:
+                if not self._take_seats(restaurant.id, slot_date, slot_time, party_size):
+                    self.db.session.rollback()
+                    raise BookingError('Sorry, that time is fully booked. Please pick another slot.')
+                booking = self.booking_model(user_id=user_id, restaurant_id=restaurant.id, booking_date=slot_date,
+                                             booking_time=slot_time, party_size=party_size)
+                self.db.session.add(booking)
+                if self.on_booked:
+                    # Runs inside the booking's transaction, e.g. to queue its confirmation email
+                    self.db.session.flush()
+                    self.on_booked(booking)
+                self.db.session.commit()
+                return booking
+            except IntegrityError:
+                # Another request created the slot row first; the retry takes the UPDATE path.
+                self.db.session.rollback()
+                if attempt:
+                    raise
+
+    def _take_seats(self, restaurant_id, slot_date, slot_time, party_size):
+        BookingSlot, Restaurant = self.slot_model, self.restaurant_model
+        capacity = select(Restaurant.capacity).where(Restaurant.id == restaurant_id).scalar_subquery()
+        key = (BookingSlot.restaurant_id == restaurant_id, BookingSlot.slot_date == slot_date, BookingSlot.slot_time == slot_time)
+        result = self.db.session.execute(
+            update(BookingSlot).where(*key, BookingSlot.seats_booked + party_size <= capacity)
+            .values(seats_booked=BookingSlot.seats_booked + party_size, bookings=BookingSlot.bookings + 1)
+            .execution_options(synchronize_session=False))
+        if result.rowcount:
+            return True
+        if self.db.session.execute(select(BookingSlot.seats_booked).where(*key)).first() is not None:
+            return False  # the slot exists and has no room for this party
+        result = self.db.session.execute(
+            insert(BookingSlot).from_select(
+                ['restaurant_id', 'slot_date', 'slot_time', 'seats_booked', 'bookings'],
+                select(literal(restaurant_id), literal(slot_date), literal(slot_time), literal(party_size), literal(1))
+                .where(capacity >= party_size)))
+        return bool(result.rowcount)
@@ -0,0 +1,84 @@
+"""Menu search backed by an SQLite FTS5 index over FoodItem.
+
+``food_item_fts`` is an external-content FTS5 table created by the
+food_item_search migration: it stores only the inverted index and reads the
+text back from ``food_item``. Triggers on ``food_item`` keep it in step with
+every insert, update and delete, whether they come from the ORM or from bulk
+statements. On databases without the index (Postgres, or a schema built with
+create_all) the same API falls back to a LIKE scan over the indexed columns.
+"""
+import re
+import threading
+
+from sqlalchemy import or_, text
+from sqlalchemy.exc import OperationalError
+
+# bm25 column weights: a hit in the name matters most, then the tag, sub_tag and description.
+RANKED_QUERY = text("""
+    SELECT rowid FROM food_item_fts
+    WHERE food_item_fts MATCH :match
+    ORDER BY bm25(food_item_fts, 10.0, 1.0, 4.0, 2.0)
+    LIMIT :limit""")
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+def match_expression(query):
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix."""
+    tokens = _TOKEN.findall(query.lower())
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+class SearchIndex:
+    def __init__(self, db, food_item_model):
+        self.db = db
+        self.food_item_model = food_item_model
+        self._available = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        """True when the database has the FTS5 index; checked once per process."""
+        if self._available is None:
+            with self._lock:
+                if self._available is None:
+                    self._available = self._has_index()
+        return self._available
+
+    def _has_index(self):
+        engine = self.db.engine
+        if engine.dialect.name != 'sqlite':
+            return False
+        with engine.connect() as conn:
+            try:
+                conn.execute(text('SELECT rowid FROM food_item_fts LIMIT 0'))
+            except OperationalError:  # not migrated yet, or SQLite built without FTS5
+                return False
+        return True
+
+    def rebuild(self):
+        if self.available:
+            with self.db.engine.begin() as conn:
+                conn.execute(text("INSERT INTO food_item_fts(food_item_fts) VALUES ('rebuild')"))
+
+    def search(self, query, limit=50):
+        """Return FoodItem ids matching ``query``, best match first."""
+        match = match_expression(query)
+        if not match:
+            return []
+        if self.available:
+            rows = self.db.session.execute(RANKED_QUERY, {'match': match, 'limit': limit})
+            return [row[0] for row in rows]
+        return self._like_search(query, limit)
+
+    def _like_search(self, query, limit):
+        FoodItem = self.food_item_model
+        columns = (FoodItem.name, FoodItem.description, FoodItem.tag, FoodItem.sub_tag)
+        q = self.db.session.query(FoodItem.id)
+        for token in _TOKEN.findall(query.lower()):
+            q = q.filter(or_(*(column.ilike(f'%{token}%') for column in columns)))
+        return [row[0] for row in q.order_by(FoodItem.name).limit(limit)]
@@ -0,0 +1,218 @@
+"""The app's subsystems (caches, cart, outbox, ...), built per app by ``init_app``.
+
+Blueprints are defined before any app exists, so they import the proxies
+below: inside a request (or app context) ``catalog.item(3)`` goes to the
+catalog of the app handling it, which ``init_app`` keeps in
+``app.extensions['foodwheels']``.
+
+``warm`` fills the read-only caches ahead of the first request. Under
+``gunicorn --preload`` (see gunicorn.conf.py) the master calls it once and
+the forked workers share those pages copy-on-write instead of each building
+its own copy.
+"""
+import functools
+
+from flask import current_app, render_template
+from werkzeug.local import LocalProxy
+
+from analytics import SalesAnalytics
+from archive import OrderArchiver
+from assets import AssetManifest
+from avatars import AvatarPipeline
+from caching import VersionStamp
+from cart_store import SessionCart, create_cart_store
+from catalog import CatalogCache
+from dispatch import Dispatcher
+from images import ResponsiveImages
+from menu_io import MenuTransfer
+from metrics import Metrics
+from models import (Booking, BookingSlot, CartSession, DispatchBatch, FoodItem, ItemSalesDaily, Order, OrderArchive,
+                    OrderItem, OutboxMessage, Restaurant, SalesDaily, User, db)
+from outbox import Outbox
+from page_cache import PageCache
+from passwords import PasswordHasher
+from pricing import CartPricer
+from ratelimit import TokenBucketLimiter
+from recommendations import Recommender
+from reservations import ReservationBook
+from search import SearchIndex
+from users import UserLoader
+
+
+def _service(name):
+    return LocalProxy(lambda: current_app.extensions['foodwheels'][name])
+
+
+catalog = _service('catalog')
+users = _service('users')
+passwords = _service('passwords')
+login_ip_limiter = _service('login_ip_limiter')
+login_email_limiter = _service('login_email_limiter')
+avatars = _service('avatars')
+search_index = _service('search_index')
+outbox = _service('outbox')
+cart = _service('cart')
+pricer = _service('pricer')
+recommender = _service('recommender')
+dispatcher = _service('dispatcher')
+archive = _service('archive')
+reservations = _service('reservations')
+menu_io = _service('menu_io')
+analytics = _service('analytics')
+page_cache = _service('page_cache')
+metrics = _service('metrics')
+
+
+def cached(view):
+    """``page_cache.cached`` for views defined before the app (and its page cache) exists."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        return page_cache.serve(view, *args, **kwargs)
+    return wrapper
+
+
+# --- Profile Pictures ---
+# Uploads are resized on a background thread; set_profile_picture runs once the files are written
+def set_profile_picture(user_id, digest):
+    db.session.execute(db.update(User).where(User.id == user_id).values(image_file=digest))
+    db.session.commit()
+    users.invalidate(user_id)
+
+
+# --- Notifications ---
+def send_mail(subject, recipients, body):
+    # Only `flask outbox-worker` sends mail, so web workers never import Flask-Mail (or smtplib)
+    from flask_mail import Mail, Message
+    mail = current_app.extensions.get('mail') or Mail().init_app(current_app)
+    mail.send(Message(subject, recipients=recipients, body=body))
+
+
+def send_order_confirmation(payload):
+    order = db.session.get(Order, payload['order_id'])
+    if not order: return  # deleted since; nothing to confirm
+    lines = db.session.execute(db.select(OrderItem, FoodItem.name).outerjoin(FoodItem, FoodItem.id == OrderItem.food_item_id)
+                               .where(OrderItem.order_id == order.id)).all()
+    send_mail(f'Your FoodWheels order #{order.id}', [order.email],
+              render_template('emails/order_confirmation.txt', order=order, lines=lines))
+
+
+def send_booking_confirmation(payload):
+    booking = db.session.get(Booking, payload['booking_id'])
+    if not booking: return
+    send_mail(f'Your table at {booking.restaurant.name} is booked', [booking.customer.email],
+              render_template('emails/booking_confirmation.txt', booking=booking))
+
+
+def init_app(app):
+    config = app.config
+    # Sized AVIF/WebP/JPEG copies of static/images, built offline with `flask build-images`
+    images = ResponsiveImages(app)
+    # Content-hashed, year-long cached URLs for static CSS/JS (precompress with `flask build-assets`)
+    assets = AssetManifest(app)
+
+    # --- Catalog Cache ---
+    # Menu reads are served from memory; commits touching FoodItem/Restaurant invalidate it.
+    catalog = CatalogCache(db, FoodItem, Restaurant, VersionStamp(config['CATALOG_VERSION_FILE']))
+    catalog.init_app(app)
+
+    # --- Current User ---
+    # users.current() resolves the session's user at most once per request, by primary key.
+    users = UserLoader(db, User, maxsize=config['USER_CACHE_SIZE'], ttl=config['USER_CACHE_TTL'])
+    users.init_app(app)
+
+    # --- Passwords & Login Limits ---
+    passwords = PasswordHasher(method=config['PASSWORD_HASH_METHOD'], workers=config['PASSWORD_HASH_WORKERS'],
+                               max_pending=config['PASSWORD_HASH_QUEUE'])
+    login_ip_limiter = TokenBucketLimiter(*config['LOGIN_LIMIT_PER_IP'])
+    login_email_limiter = TokenBucketLimiter(*config['LOGIN_LIMIT_PER_EMAIL'])
+
+    # --- Profile Pictures ---
+    avatars = AvatarPipeline(app, on_ready=set_profile_picture)
+
+    # --- Search ---
+    # FTS5 index over FoodItem, kept in sync by triggers; hits are resolved through the catalog cache.
+    search_index = SearchIndex(db, FoodItem)
+
+    # --- Notifications ---
+    # outbox.add() queues a job in the caller's transaction; `flask outbox-worker` sends it later
+    outbox = Outbox(db, OutboxMessage, batch_size=config['OUTBOX_BATCH_SIZE'], max_attempts=config['OUTBOX_MAX_ATTEMPTS'],
+                    backoff=config['OUTBOX_BACKOFF'], max_backoff=config['OUTBOX_MAX_BACKOFF'])
+    outbox.init_app(app)
+    outbox.handler('order_confirmation')(send_order_confirmation)
+    outbox.handler('booking_confirmation')(send_booking_confirmation)
+
+    # --- Cart ---
+    # cart.get()/save()/clear() read and write the visitor's cart in the configured store
+    cart = SessionCart(create_cart_store(app, db, CartSession))
+    # pricer.quote(cart) reprices every line against the current menu
+    pricer = CartPricer(db, FoodItem, catalog, delivery_fee=config['DELIVERY_FEE'])
+
+    # --- Recommendations ---
+    recommender = Recommender(db, OrderItem, catalog, config['RECOMMENDATIONS_DIR'], k=config['RECOMMENDATIONS_K'],
+                              min_support=config['RECOMMENDATIONS_MIN_SUPPORT'])
+    recommender.init_app(app)
+
+    # --- Dispatch ---
+    # `flask dispatch-tick` groups pending orders into driver batches; admins follow them at /admin/api/dispatch
+    dispatcher = Dispatcher(db, Order, DispatchBatch, max_size=config['DISPATCH_BATCH_SIZE'],
+                            window_minutes=config['DISPATCH_WINDOW_MINUTES'])
+    dispatcher.init_app(app)
+
+    # --- Order Archive ---
+    # `flask archive-orders` moves old delivered/cancelled orders out of the hot tables; /my_orders reads both
+    archive = OrderArchiver(db, Order, OrderItem, FoodItem, OrderArchive, after_days=config['ARCHIVE_AFTER_DAYS'],
+                            batch_size=config['ARCHIVE_BATCH_SIZE'],
+                            ready_upto=recommender.watermark if config['RECOMMENDATIONS_ENABLED'] else None)
+    archive.init_app(app)
+
+    # --- Reservations ---
+    reservations = ReservationBook(db, Restaurant, Booking, BookingSlot,
+                                   first_slot=config['BOOKING_FIRST_SLOT'], last_slot=config['BOOKING_LAST_SLOT'],
+                                   slot_minutes=config['BOOKING_SLOT_MINUTES'], window_days=config['BOOKING_WINDOW_DAYS'],
+                                   on_booked=lambda booking: outbox.add('booking_confirmation', booking_id=booking.id))
+
+    # --- Menu Import / Export ---
+    # menu_io.import_rows()/export() back the admin upload/download and `flask import-menu` / `flask export-menu`
+    menu_io = MenuTransfer(db, FoodItem, Restaurant, batch_size=config['MENU_IMPORT_BATCH_SIZE'])
+    menu_io.init_app(app)
+
+    # --- Analytics ---
+    analytics = SalesAnalytics(db, Order, OrderItem, FoodItem, Restaurant, BookingSlot, SalesDaily, ItemSalesDaily,
+                               archived_until=archive.horizon)
+    analytics.init_app(app)
+
+    # --- Page Cache ---
+    # Whole pages for anonymous visitors, shared menu fragments for everyone; a catalog change or new recommendations retire both
+    page_cache = PageCache(version=lambda: (catalog.version, recommender.version), maxsize=config['PAGE_CACHE_SIZE'],
+                           ttl=config['PAGE_CACHE_TTL'])
+
+    # --- Metrics ---
+    # Per-route latency, SQL statements/time per request, template render time and cache hit rates at /metrics
+    metrics = Metrics(app, db)
+    metrics.register_cache('catalog', catalog)
+    metrics.register_cache('users', users.cache)
+    metrics.register_cache('page_cache', page_cache)
+
+    app.extensions['foodwheels'] = {
+        'images': images, 'assets': assets, 'catalog': catalog, 'users': users, 'passwords': passwords,
+        'login_ip_limiter': login_ip_limiter, 'login_email_limiter': login_email_limiter, 'avatars': avatars,
+        'search_index': search_index, 'outbox': outbox, 'cart': cart, 'pricer': pricer, 'recommender': recommender,
+        'dispatcher': dispatcher, 'archive': archive, 'reservations': reservations, 'menu_io': menu_io, 'analytics': analytics,
+        'page_cache': page_cache, 'metrics': metrics,
+    }
+
+
+def warm(app):
+    """Build the read-only caches now rather than on the first requests that need them."""
+    with app.app_context():
+        try:
+            catalog.snapshot()
+            recommender.version  # maps topk.npy
+            search_index.available
+        except Exception as e:  # e.g. not migrated yet; each worker builds them on demand instead
+            app.logger.warning('Cache warm-up skipped: %s', e)
+        app.extensions['foodwheels']['images'].manifest
+        for name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(name)
+        # Connections must not cross a fork; workers open their own
+        db.engine.dispose()
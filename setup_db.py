@@ -1,20 +1,28 @@
-from app import app, db, Restaurant
+import secrets
+
+from flask_migrate import upgrade
+from app import create_app, init_migrations
+from models import db, Restaurant
+
+app = create_app({'SECRET_KEY': secrets.token_hex(32)})  # only migrates and seeds; no sessions to sign
 
 with app.app_context():
-    # 1. Create the empty database file
-    db.create_all()
+    # 1. Create (or bring up to date) the database schema from migrations/
+    init_migrations(app)
+    upgrade()
 
     # 2. Add the restaurants (Notice the FIXED 'room.jpg')
-    r1 = Restaurant(name='The Velvet Room', description='A modern dining experience.', image_file='room.jpg', location='Downtown')
-    r2 = Restaurant(name='Luxe Dining', description='Classic luxury and fine food.', image_file='luxe.jpg', location='Uptown')
-    r3 = Restaurant(name='The Urban Retreat', description='A beautiful spot with outdoor seating.', image_file='urban.jpg', location='Market Street')
-    r4 = Restaurant(name='Golden Fork', description='The best traditional food.', image_file='golden.jpg', location='Old Town')
-    r5 = Restaurant(name='Spice Garden', description='Authentic flavors and spices.', image_file='spice.jpg', location='East Side')
-    r6 = Restaurant(name='Sushi Zen', description='Fresh sushi in a peaceful setting.', image_file='zen.jpg', location='River Walk')
-    r7 = Restaurant(name='Bella Napoli', description='Wood-fired pizza and pasta.', image_file='bella.jpg', location='Little Italy')
-    r8 = Restaurant(name='The Burger Joint', description='Juicy burgers and shakes.', image_file='joint.jpg', location='Main Avenue')
+    if Restaurant.query.first() is None:
+        r1 = Restaurant(name='The Velvet Room', description='A modern dining experience.', image_file='room.jpg', location='Downtown')
+        r2 = Restaurant(name='Luxe Dining', description='Classic luxury and fine food.', image_file='luxe.jpg', location='Uptown')
+        r3 = Restaurant(name='The Urban Retreat', description='A beautiful spot with outdoor seating.', image_file='urban.jpg', location='Market Street')
+        r4 = Restaurant(name='Golden Fork', description='The best traditional food.', image_file='golden.jpg', location='Old Town')
+        r5 = Restaurant(name='Spice Garden', description='Authentic flavors and spices.', image_file='spice.jpg', location='East Side')
+        r6 = Restaurant(name='Sushi Zen', description='Fresh sushi in a peaceful setting.', image_file='zen.jpg', location='River Walk')
+        r7 = Restaurant(name='Bella Napoli', description='Wood-fired pizza and pasta.', image_file='bella.jpg', location='Little Italy')
+        r8 = Restaurant(name='The Burger Joint', description='Juicy burgers and shakes.', image_file='joint.jpg', location='Main Avenue')
 
-    # 3. Save it all
-    db.session.add_all([r1, r2, r3, r4, r5, r6, r7, r8])
-    db.session.commit()
-    print("SUCCESS: New database created!")
\ No newline at end of file
+        # 3. Save it all
+        db.session.add_all([r1, r2, r3, r4, r5, r6, r7, r8])
+        db.session.commit()
+    print("SUCCESS: Database is up to date!")
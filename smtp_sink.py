@@ -0,0 +1,143 @@
+"""A local SMTP server that accepts every message and keeps it, for development and tests.
+
+Run ``python smtp_sink.py`` and point ``MAIL_SERVER``/``MAIL_PORT`` at it
+(the defaults already are); each message is printed and, with
+``--maildir``, saved as an ``.eml`` file. Tests can start one in-process::
+
+    with SMTPSink(port=0) as sink:
+        app.config['MAIL_PORT'] = sink.port
+        ...
+        assert sink.messages[0]['To'] == 'ana@example.com'
+
+``--delay`` and ``--fail`` make it slow or refuse every message, to check
+that checkout doesn't care and the outbox retries.
+"""
+import email
+import email.policy
+import os
+import socketserver
+import threading
+import time
+import uuid
+
+import click
+
+
+class _Session(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        sink = self.server.sink
+        self.reply('220 smtp-sink ready')
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline(65536)
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command[:4].upper()
+            if verb in ('HELO', 'EHLO'):
+                self.reply('250 smtp-sink')
+            elif verb == 'MAIL':
+                sender, recipients = command[10:].strip(), []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command[8:].strip())
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = self._read_data()
+                if sink.delay:
+                    time.sleep(sink.delay)
+                if sink.fail:
+                    self.reply('451 smtp-sink is refusing mail')
+                else:
+                    sink.deliver(sender, recipients, data)
+                    self.reply('250 OK: queued')
+            elif verb == 'RSET':
+                sender, recipients = None, []
+                self.reply('250 OK')
+            elif verb == 'NOOP':
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+    def _read_data(self):
+        lines = []
+        while True:
+            line = self.rfile.readline(65536)
+            if not line or line in (b'.\r\n', b'.\n'):
+                return b''.join(lines)
+            lines.append(line[1:] if line.startswith(b'..') else line)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    def __init__(self, host='127.0.0.1', port=8025, maildir=None, delay=0, fail=False, echo=False):
+        self.maildir = maildir
+        self.delay = delay
+        self.fail = fail
+        self.echo = echo
+        self.messages = []
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Session)
+        self._server.sink = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = None
+
+    def deliver(self, sender, recipients, data):
+        message = email.message_from_bytes(data, policy=email.policy.default)
+        with self._lock:
+            self.messages.append(message)
+        if self.maildir:
+            os.makedirs(self.maildir, exist_ok=True)
+            with open(os.path.join(self.maildir, f'{uuid.uuid4().hex}.eml'), 'wb') as fh:
+                fh.write(data)
+        if self.echo:
+            click.echo(f'--- {sender} -> {", ".join(recipients)}: {message["Subject"]}')
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True)
+@click.option('--port', default=8025, show_default=True)
+@click.option('--maildir', type=click.Path(file_okay=False), help='Also save each message here as .eml.')
+@click.option('--delay', default=0.0, help='Seconds to stall before answering each DATA.')
+@click.option('--fail', is_flag=True, help='Refuse every message with a 451.')
+def main(host, port, maildir, delay, fail):
+    """Accept mail on HOST:PORT and print what arrives."""
+    sink = SMTPSink(host, port, maildir=maildir, delay=delay, fail=fail, echo=True)
+    click.echo(f'smtp-sink listening on {sink.host}:{sink.port}')
+    try:
+        sink.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
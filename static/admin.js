@@ -0,0 +1,49 @@
+// Admin menu list: fetch the next page from /admin/api/items and append it to the table.
+function escapeHtml(value) {
+    let div = document.createElement('div');
+    div.textContent = value == null ? '' : value;
+    return div.innerHTML;
+}
+
+function itemRow(item, button) {
+    let row = document.createElement('tr');
+    let deleteUrl = button.dataset.deleteUrl.replace(/0$/, item.id);
+    row.innerHTML =
+        '<td><img src="' + button.dataset.imageBase + encodeURIComponent(item.image_file) + '" alt="img" loading="lazy" decoding="async"></td>' +
+        '<td>' + escapeHtml(item.name) + '</td>' +
+        '<td>' + escapeHtml(item.tag) + ' <span class="sub-tag">(' + escapeHtml(item.sub_tag) + ')</span></td>' +
+        '<td class="price">$' + item.price.toFixed(2) + '</td>' +
+        '<td><a href="' + deleteUrl + '" class="btn-delete" onclick="return confirm(\'Are you sure you want to delete this?\')"><i class="fa-solid fa-trash"></i></a></td>';
+    return row;
+}
+
+function loadMoreItems() {
+    let button = document.getElementById('load-more');
+    let url = new URL(button.dataset.apiUrl, window.location.href);
+    url.searchParams.set('after', button.dataset.nextCursor);
+    button.disabled = true;
+    fetch(url)
+        .then(response => response.json())
+        .then(function(page) {
+            let body = document.getElementById('admin-items');
+            page.items.forEach(function(item) {
+                body.appendChild(itemRow(item, button));
+            });
+            if (page.next_cursor) {
+                button.dataset.nextCursor = page.next_cursor;
+                button.disabled = false;
+            } else {
+                button.remove();
+            }
+        })
+        .catch(function() {
+            button.disabled = false;
+        });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    let button = document.getElementById('load-more');
+    if (button) {
+        button.addEventListener('click', loadMoreItems);
+    }
+});
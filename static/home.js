@@ -32,4 +32,28 @@ function filterCategories() {
             item.style.display = 'none';
         }
     });
+}
+
+let suggestTimer = null;
+function suggestFoods() {
+    clearTimeout(suggestTimer);
+    suggestTimer = setTimeout(function() {
+        let input = document.getElementById('search-input');
+        let query = input.value.trim();
+        let list = document.getElementById('search-suggestions');
+        if (query.length < 2) {
+            list.innerHTML = '';
+            return;
+        }
+        fetch(input.dataset.suggestUrl + '?q=' + encodeURIComponent(query))
+            .then(response => response.json())
+            .then(function(suggestions) {
+                list.innerHTML = '';
+                suggestions.forEach(function(item) {
+                    let option = document.createElement('option');
+                    option.value = item.name;
+                    list.appendChild(option);
+                });
+            });
+    }, 150);
 }
\ No newline at end of file
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import create_app, init_migrations  # noqa: E402
+from models import User, db  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    """An app on a fresh, fully migrated SQLite database of its own."""
+    from flask_migrate import upgrade
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "test.db"}',
+                      'CATALOG_VERSION_FILE': str(tmp_path / 'catalog.version'),
+                      'RECOMMENDATIONS_DIR': str(tmp_path / 'recommendations'),
+                      'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000'})
+    with app.app_context():
+        init_migrations(app)
+        upgrade(directory=os.path.join(ROOT, 'migrations'))
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def user(app):
+    from services import passwords
+    user = User(email='ana@example.com', password=passwords.hash('secret'), first_name='Ana')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def client(app, user):
+    """A test client logged in as ``user``."""
+    client = app.test_client()
+    response = client.post('/login', data={'email': 'ana@example.com', 'password': 'secret'})
+    assert response.status_code == 302
+    return client
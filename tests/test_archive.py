@@ -0,0 +1,75 @@
+import datetime
+import re
+
+from app import create_app
+from models import FoodItem, Order, OrderArchive, OrderItem, db
+from services import archive, recommender
+
+
+def place_order(user, days_ago, status='delivered'):
+    item = FoodItem.query.first() or FoodItem(name='Pasta', tag='Italian', price=9.5, image_file='pasta.jpg')
+    order = Order(total_price=19.0, user_id=user.id, name='Ana', email=user.email, address='1 Main St', city='Pune',
+                  status=status, date_placed=datetime.datetime.utcnow() - datetime.timedelta(days=days_ago))
+    db.session.add(order)
+    db.session.flush()
+    db.session.add(OrderItem(order_id=order.id, food_item=item, quantity=2, price_per_item=9.5))
+    db.session.commit()
+    return order.id
+
+
+def test_archived_ids_are_never_reused(app, user):
+    first = [place_order(user, days_ago=400 - n) for n in range(3)]
+    recommender.refresh()
+    assert archive.run() == 3
+    assert Order.query.count() == 0
+
+    # The newest order went to the archive too; a new one must not get its id again
+    newer = place_order(user, days_ago=300)
+    assert newer > max(first)
+    recommender.refresh()
+    assert archive.run() == 1
+    assert sorted(a.id for a in OrderArchive.query) == first + [newer]
+
+
+def history(client):
+    """Order ids on every /my_orders page, following the "Older orders" links."""
+    seen, url = [], '/my_orders'
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        seen += [int(order_id) for order_id in re.findall(r'Order ID:</strong> #(\d+)', html)]
+        older = re.search(r'href="(/my_orders\?before=[^"]+)"', html)
+        url = older and older.group(1)
+    return seen
+
+
+def test_my_orders_pages_through_the_archive(app, user, client):
+    app.config['HISTORY_PAGE_SIZE'] = 2
+    ids = [place_order(user, days_ago=days, status=status)
+           for days, status in ((400, 'pending'), (300, 'delivered'), (250, 'cancelled'), (5, 'delivered'))]
+    recommender.refresh()
+    assert archive.run() == 2
+    assert history(client) == ids[::-1]
+
+    # Archived orders stay in the history after ARCHIVE_AFTER_DAYS is raised
+    archive.after = datetime.timedelta(days=3650)
+    assert history(client) == ids[::-1]
+
+
+def test_archiving_waits_for_recommendations(app, user, caplog):
+    ids = [place_order(user, days_ago=400 - n) for n in range(2)]
+    assert archive.run() == 0
+    assert '2 finished order(s) after #0 are held back' in caplog.text
+    recommender.refresh()
+    assert archive.run() == 2
+    assert sorted(a.id for a in OrderArchive.query) == ids
+
+
+def test_archiving_without_recommendations(app, user):
+    order_id = place_order(user, days_ago=400)
+    other = create_app({'TESTING': True, 'RECOMMENDATIONS_ENABLED': False,
+                        'SQLALCHEMY_DATABASE_URI': app.config['SQLALCHEMY_DATABASE_URI']})
+    with other.app_context():
+        assert archive.run() == 1
+        assert [a.id for a in OrderArchive.query] == [order_id]
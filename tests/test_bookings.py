@@ -0,0 +1,33 @@
+import datetime
+
+import pytest
+
+from models import Booking, Restaurant, db
+
+
+@pytest.fixture
+def restaurant(app):
+    restaurant = Restaurant(name='Spice Garden', image_file='spice.jpg', capacity=10)
+    db.session.add(restaurant)
+    db.session.commit()
+    return restaurant
+
+
+def book(client, restaurant, party_size):
+    day = datetime.date.today() + datetime.timedelta(days=2)
+    return client.post(f'/book_table/{restaurant.id}', data={'slot': f'{day.isoformat()}T19:00', 'party_size': party_size},
+                       follow_redirects=True)
+
+
+@pytest.mark.parametrize('party_size', ['abc', '', '2.5', '0'])
+def test_book_table_rejects_bad_party_sizes(client, restaurant, party_size):
+    response = book(client, restaurant, party_size)
+    assert response.status_code == 200
+    assert 'Party size must be between 1 and 10.' in response.get_data(as_text=True)
+    assert Booking.query.count() == 0
+
+
+def test_book_table(client, restaurant):
+    response = book(client, restaurant, '4')
+    assert response.status_code == 200
+    assert [booking.party_size for booking in Booking.query] == [4]
@@ -0,0 +1,40 @@
+from cart_store import LocalRedis, RedisCartStore, SQLCartStore
+from models import CartSession, FoodItem, Restaurant, db
+
+CART = {'1': {'name': 'Paneer Tikka', 'price': 8.5, 'quantity': 2, 'image_file': 'paneer.jpg'}}
+
+
+def test_sql_store_leaves_the_commit_to_the_caller(app):
+    store = SQLCartStore(db, CartSession, ttl=60)
+    db.session.add(Restaurant(name='Spice Garden', image_file='spice.jpg', capacity=10))
+    store.save('abc', CART)
+    db.session.rollback()
+    assert store.load('abc') is None
+    assert Restaurant.query.count() == 0
+
+    store.save('abc', CART)
+    db.session.commit()
+    store.save('abc', {})
+    assert store.load('abc') == {}
+    store.delete('abc')
+    db.session.commit()
+    assert store.load('abc') is None
+
+
+def test_memory_store_round_trip():
+    store = RedisCartStore(LocalRedis(), ttl=60)
+    store.save('abc', CART)
+    assert store.load('abc') == CART
+    store.delete('abc')
+    assert store.load('abc') is None
+
+
+def test_add_to_cart_persists_the_cart(app, client):
+    item = FoodItem(name='Paneer Tikka', tag='veg', price=8.5, image_file='paneer.jpg')
+    db.session.add(item)
+    db.session.commit()
+    client.post(f'/add_to_cart/{item.id}', data={'quantity': 2})
+    db.session.remove()
+    [row] = db.session.scalars(db.select(CartSession)).all()
+    assert '"quantity":2' in row.data
+    assert 'Paneer Tikka' in client.get('/cart').get_data(as_text=True)
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from menu_io import clean_row, read_rows
+from models import FoodItem
+from services import menu_io
+
+
+@pytest.mark.parametrize('price', ['nan', 'inf', '-inf', float('nan')])
+def test_clean_row_rejects_non_finite_numbers(price):
+    with pytest.raises(ValueError, match='not a finite number'):
+        clean_row('items', {'name': 'Pasta', 'tag': 'Italian', 'price': price, 'image_file': 'pasta.jpg'})
+
+
+def test_import_reports_non_finite_rows_and_keeps_the_rest(app):
+    csv = b'name,tag,price,image_file\nPasta,Italian,nan,pasta.jpg\nPizza,Italian,12.5,pizza.jpg\n'
+    report = menu_io.import_rows('items', read_rows(io.BytesIO(csv), 'csv'))
+    assert (report.inserted, report.invalid) == (1, 1)
+    assert report.errors[0][0] == 1
+    assert [item.name for item in FoodItem.query] == ['Pizza']
+
+
+def test_admin_import_reports_database_errors(app, user, client, monkeypatch):
+    from sqlalchemy.exc import IntegrityError
+    from models import db
+    user.is_admin = True
+    db.session.commit()
+
+    def rejected(*args, **kwargs):
+        raise IntegrityError('INSERT INTO food_item ...', {}, Exception('NOT NULL constraint failed'))
+    monkeypatch.setattr(menu_io, 'import_rows', rejected)
+    response = client.post('/admin/import', data={'menu_file': (io.BytesIO(b'name\n'), 'menu.csv')},
+                           content_type='multipart/form-data', follow_redirects=True)
+    assert response.status_code == 200
+    assert 'the database rejected a batch' in response.get_data(as_text=True)
@@ -0,0 +1,99 @@
+"""Request-scoped resolution of the logged-in user.
+
+The session keeps the user's id next to their email so a request costs at
+most one primary-key fetch, and usually none: user rows are kept in a small
+TTL/LRU cache that is cleared whenever a commit touches that user. The
+session hooks are registered once per process and passed on to the loader
+of the app in context (see catalog.py).
+"""
+from flask import current_app, g, has_app_context, session
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from caching import TTLCache, snapshot
+
+
+class UserLoader:
+    def __init__(self, db, user_model, maxsize=1024, ttl=60):
+        self.db = db
+        self.user_model = user_model
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def init_app(self, app):
+        app.extensions['user_loader'] = self
+
+    def current(self):
+        """Return a read-only row for the logged-in user, or None. Runs once per request."""
+        if 'current_user' not in g:
+            g.current_user = self._load()
+        return g.current_user
+
+    def current_for_update(self):
+        """Return the logged-in user as an ORM instance attached to the session."""
+        user = self.current()
+        return self.db.session.get(self.user_model, user.id) if user else None
+
+    def login(self, user):
+        session['user'] = user.email
+        session['user_id'] = user.id
+        g.current_user = self._remember(user)
+
+    def logout(self):
+        session.pop('user', None)
+        session.pop('user_id', None)
+        g.pop('current_user', None)
+
+    def invalidate(self, user_id):
+        self.cache.pop(user_id)
+
+    def _load(self):
+        if 'user' not in session:
+            return None
+        user_id = session.get('user_id')
+        if user_id is not None:
+            cached = self.cache.get(user_id)
+            if cached is not None:
+                return cached
+            user = self.db.session.get(self.user_model, user_id)
+        else:
+            # Sessions created before the id was stored: resolve the email once.
+            user = self.user_model.query.filter_by(email=session['user']).first()
+        if user is None:
+            return None
+        session['user_id'] = user.id
+        return self._remember(user)
+
+    def _remember(self, user):
+        row = snapshot(user)
+        self.cache.set(user.id, row)
+        return row
+
+    # --- Invalidation ---
+
+    def _track_changes(self, session, flush_context, instances):
+        changed = session.info.setdefault('users_changed', set())
+        for obj in (*session.dirty, *session.deleted):
+            if isinstance(obj, self.user_model) and obj.id is not None:
+                changed.add(obj.id)
+
+    def _after_commit(self, session):
+        for user_id in session.info.pop('users_changed', ()):
+            self.cache.pop(user_id)
+            if g and getattr(g.get('current_user'), 'id', None) == user_id:
+                g.pop('current_user')
+
+    def _after_rollback(self, session, previous_transaction):
+        session.info.pop('users_changed', None)
+
+
+def _dispatch(method):
+    def listener(*args):
+        loader = current_app.extensions.get('user_loader') if has_app_context() else None
+        if loader is not None:
+            getattr(loader, method)(*args)
+    return listener
+
+
+for _event, _method in (('before_flush', '_track_changes'), ('after_commit', '_after_commit'),
+                        ('after_soft_rollback', '_after_rollback')):
+    event.listen(Session, _event, _dispatch(_method))